@@ -56,6 +56,11 @@ class Settings(BaseSettings):
         default="data/deliverables",
         description="Directory for generated deliverable files",
     )
+    gig_creation_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Number of gigs setup_gigs creates in parallel (one browser page each)",
+    )
 
     @property
     def base_dir(self) -> Path:
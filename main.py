@@ -79,7 +79,8 @@ async def main(headless: bool = False) -> None:
     )
     await engine.start()
 
-    selectors = SelectorStore(str(_PROJECT_ROOT / "config" / "selectors.yaml"))
+    selectors = SelectorStore(str(_PROJECT_ROOT / "config" / "selectors.yaml"), db=db)
+    await selectors.load_persisted()
     session = SessionManager(engine, settings.fiverr_username, settings.fiverr_password)
 
     # NOTE: We do NOT call ensure_session() here. The scheduler's first cycle
@@ -170,6 +171,9 @@ async def main(headless: bool = False) -> None:
     finally:
         log.info("sixxer.shutting_down")
         await health_server.stop()
+        await session.close()
+        await inbox.close()
+        await order_actions.close()
         await engine.stop()
         await db.close()
         log.info("sixxer.shutdown_complete")
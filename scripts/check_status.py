@@ -25,7 +25,7 @@ from src.browser.engine import BrowserEngine  # noqa: E402
 from src.browser.selectors import SelectorStore  # noqa: E402
 from src.browser.session import SessionManager  # noqa: E402
 from src.fiverr.dashboard import DashboardScraper  # noqa: E402
-from src.fiverr.gig_manager import GigManager  # noqa: E402
+from src.fiverr.gig_manager import GigManager, gig_columns  # noqa: E402
 from src.fiverr.navigation import Navigator  # noqa: E402
 from src.models.database import Database  # noqa: E402
 from src.utils.logger import get_logger, setup_logging  # noqa: E402
@@ -119,6 +119,14 @@ async def main() -> None:
                     f"Orders: {orders}"
                 )
                 print()
+
+            totals = gig_columns(gigs)
+            print(
+                f"  Totals: Impressions: {sum(totals['impressions'])}  "
+                f"Clicks: {sum(totals['clicks'])}  "
+                f"Orders: {sum(totals['orders'])}"
+            )
+            print()
         else:
             print("  No gigs found on your account.")
             print()
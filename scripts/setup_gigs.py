@@ -40,6 +40,7 @@ async def main() -> None:
     templates_path = str(_PROJECT_ROOT / "config" / "gig_templates.yaml")
     print(f"  Templates file : {templates_path}")
     print(f"  Browser data   : {settings.abs_browser_data_dir}")
+    print(f"  Concurrency    : {settings.gig_creation_concurrency}")
     print()
 
     engine = BrowserEngine(
@@ -70,7 +71,10 @@ async def main() -> None:
         print("  Creating gigs from templates...")
         print()
 
-        created_ids = await gig_manager.create_all_gigs(templates_path)
+        created_ids = await gig_manager.create_all_gigs(
+            templates_path,
+            concurrency=settings.gig_creation_concurrency,
+        )
 
         # Print results
         print()
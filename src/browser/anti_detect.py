@@ -11,14 +11,40 @@ from __future__ import annotations
 import asyncio
 import math
 import random
+import weakref
 
-from playwright.async_api import Page
+from playwright.async_api import Locator, Page
 
 from src.utils.human_timing import between_actions, human_delay, reading_delay
 from src.utils.logger import get_logger
 
 log = get_logger(__name__, component="anti_detect")
 
+# Playwright does not expose the current mouse coords, so every move made
+# through ``move_mouse`` records where it left the pointer on that page.
+_mouse_positions: weakref.WeakKeyDictionary[Page, tuple[float, float]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def mouse_position(page: Page) -> tuple[float, float]:
+    """Return the last known mouse position on *page*.
+
+    Defaults to the centre of the viewport if the mouse has not been
+    moved on this page yet.
+    """
+    pos = _mouse_positions.get(page)
+    if pos is None:
+        viewport = page.viewport_size or {"width": 1920, "height": 1080}
+        pos = (viewport["width"] / 2.0, viewport["height"] / 2.0)
+    return pos
+
+
+async def move_mouse(page: Page, x: float, y: float, steps: int = 1) -> None:
+    """Move the mouse to (*x*, *y*) and remember the new position."""
+    await page.mouse.move(x, y, steps=steps)
+    _mouse_positions[page] = (x, y)
+
 
 async def mouse_jitter(page: Page, x: int, y: int) -> None:
     """Move the mouse to (*x*, *y*) with slight random offsets.
@@ -30,7 +56,7 @@ async def mouse_jitter(page: Page, x: int, y: int) -> None:
     offset_y = random.randint(-5, 5)
     target_x = max(0, x + offset_x)
     target_y = max(0, y + offset_y)
-    await page.mouse.move(target_x, target_y, steps=random.randint(5, 15))
+    await move_mouse(page, target_x, target_y, steps=random.randint(5, 15))
     await asyncio.sleep(human_delay(0.05, 0.15))
 
 
@@ -49,14 +75,18 @@ async def random_scroll(page: Page) -> None:
     log.debug("random_scroll", direction=direction, distance=abs(distance))
 
 
-async def human_click(page: Page, selector: str) -> None:
+async def human_click(page: Page, selector: str | Locator) -> None:
     """Click an element with a human-like curved mouse approach.
 
     The mouse travels from its current position to the element's centre
-    (with a slight random offset) along an arc, then clicks after a
-    brief pause.
+    (with a slight random offset) along an arc, then clicks with a
+    human-like press duration.  *selector* may also be a ``Locator``
+    (e.g. from ``get_by_role``); its first match is clicked.
     """
-    element = await page.wait_for_selector(selector, timeout=10_000)
+    if isinstance(selector, Locator):
+        element = await selector.first.element_handle(timeout=10_000)
+    else:
+        element = await page.wait_for_selector(selector, timeout=10_000)
     if element is None:
         log.warning("human_click_element_not_found", selector=selector)
         return
@@ -74,9 +104,12 @@ async def human_click(page: Page, selector: str) -> None:
     # Curved mouse movement using a Bezier-like multi-step path
     await _curved_mouse_move(page, target_x, target_y)
 
-    # Short pause before clicking, like a person aiming
-    await asyncio.sleep(human_delay(0.05, 0.2))
-    await page.mouse.click(target_x, target_y)
+    # Hold the button for a human-like press duration; the driver spaces
+    # mousedown/mouseup itself so no extra Python-side pause is needed.
+    await page.mouse.click(
+        target_x, target_y, delay=int(human_delay(0.05, 0.2) * 1000)
+    )
+    _mouse_positions[page] = (target_x, target_y)
     await asyncio.sleep(human_delay(0.1, 0.4))
 
     log.debug("human_click", selector=selector, x=round(target_x), y=round(target_y))
@@ -136,34 +169,31 @@ async def _curved_mouse_move(
     page: Page,
     target_x: float,
     target_y: float,
-    steps: int | None = None,
+    waypoints: int = 6,
 ) -> None:
     """Move the mouse along a slightly curved path to (*target_x*, *target_y*).
 
     The curve is achieved by introducing a random control point and
-    interpolating a quadratic Bezier curve.
+    interpolating a quadratic Bezier curve.  Only *waypoints* points of
+    the curve are sent to the driver; Playwright interpolates the short
+    straight segments between them via ``steps=``, which keeps the path
+    smooth without one driver round-trip per pixel.
     """
-    # Estimate current mouse position (default to centre of viewport)
-    viewport = page.viewport_size or {"width": 1920, "height": 1080}
-    # Playwright does not expose the current mouse coords, so we pick a
-    # reasonable "last known" origin near the viewport centre.
-    start_x = viewport["width"] / 2.0 + random.uniform(-100, 100)
-    start_y = viewport["height"] / 2.0 + random.uniform(-100, 100)
-
-    # Compute distance to decide number of steps
-    dist = math.hypot(target_x - start_x, target_y - start_y)
-    if steps is None:
-        steps = max(10, int(dist / 15))
+    start_x, start_y = mouse_position(page)
 
     # Control point for quadratic Bezier (offset from midpoint)
     mid_x = (start_x + target_x) / 2.0 + random.uniform(-80, 80)
     mid_y = (start_y + target_y) / 2.0 + random.uniform(-80, 80)
 
-    for i in range(1, steps + 1):
-        t = i / steps
+    prev_x, prev_y = start_x, start_y
+    for i in range(1, waypoints + 1):
+        t = i / waypoints
         inv = 1 - t
         # Quadratic Bezier: B(t) = (1-t)^2 P0 + 2(1-t)t P1 + t^2 P2
         x = inv * inv * start_x + 2 * inv * t * mid_x + t * t * target_x
         y = inv * inv * start_y + 2 * inv * t * mid_y + t * t * target_y
-        await page.mouse.move(x, y)
-        await asyncio.sleep(random.uniform(0.005, 0.02))
+        # One interpolated step per ~6 px keeps the segment smooth.
+        steps = max(1, int(math.hypot(x - prev_x, y - prev_y) / 6))
+        await move_mouse(page, x, y, steps=steps)
+        await asyncio.sleep(random.uniform(0.01, 0.03))
+        prev_x, prev_y = x, y
@@ -9,6 +9,9 @@ common DOM operations.
 from __future__ import annotations
 
 import asyncio
+import json
+import random
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Self
@@ -19,6 +22,7 @@ from playwright.async_api import (
     Playwright,
     async_playwright,
 )
+from src.browser.anti_detect import move_mouse
 from src.utils.human_timing import (
     between_actions,
     human_delay,
@@ -60,6 +64,9 @@ class BrowserEngine:
         headless: bool = False,
     ) -> None:
         self._data_dir = Path(data_dir)
+        # Snapshot of cookies/localStorage written after a successful
+        # login; kept next to (not inside) the browser profile.
+        self._storage_state_path = self._data_dir.parent / "storage_state.json"
         self._headless = headless
         self._playwright: Playwright | None = None
         self._context: BrowserContext | None = None
@@ -120,6 +127,42 @@ class BrowserEngine:
 
         log.info("browser_stopped")
 
+    # ------------------------------------------------------------------
+    # Storage state
+    # ------------------------------------------------------------------
+
+    async def save_storage_state(self) -> None:
+        """Write the context's cookies and localStorage to disk."""
+        if self._context is None:
+            raise RuntimeError("BrowserEngine has not been started.")
+
+        await self._context.storage_state(path=str(self._storage_state_path))
+        log.info("storage_state_saved", path=str(self._storage_state_path))
+
+    async def restore_storage_state(self) -> bool:
+        """Load cookies from the last saved storage state into the context.
+
+        The persistent profile normally keeps the session on its own; this
+        is a cheap way to recover it if the profile lost its cookies.
+        Returns ``True`` if any cookies were restored.
+        """
+        if self._context is None:
+            raise RuntimeError("BrowserEngine has not been started.")
+        if not self._storage_state_path.is_file():
+            return False
+
+        try:
+            state = json.loads(self._storage_state_path.read_text(encoding="utf-8"))
+            cookies = state.get("cookies", [])
+            if cookies:
+                await self._context.add_cookies(cookies)
+        except Exception:
+            log.warning("storage_state_restore_failed", exc_info=True)
+            return False
+
+        log.info("storage_state_restored", cookies=len(cookies))
+        return bool(cookies)
+
     # ------------------------------------------------------------------
     # Context manager
     # ------------------------------------------------------------------
@@ -151,15 +194,58 @@ class BrowserEngine:
 
         return self._page
 
+    async def new_bare_page(self) -> Page:
+        """Open an extra page for background fetches (JSON, HEAD, assets).
+
+        The page shares the persistent context (and therefore cookies)
+        but is not tracked as the engine's current page, so it never
+        disturbs the page used for interactive work.  The caller is
+        responsible for closing it.
+        """
+        if self._context is None:
+            raise RuntimeError("BrowserEngine has not been started.")
+
+        page = await self._context.new_page()
+        log.debug("bare_page_created")
+        return page
+
+    async def new_worker_page(self) -> Page:
+        """Open an extra page for running an interactive flow in parallel.
+
+        Unlike ``new_bare_page`` this one is meant to be driven like the
+        main page (clicks, typing, wizards).  It inherits the launch-time
+        stealth setup from the shared context (user agent, viewport,
+        locale, timezone, Firefox prefs), and the mouse is parked at a
+        random point so the ``anti_detect`` helpers start from a plausible
+        position rather than the exact viewport centre.  The caller is
+        responsible for closing it.
+        """
+        page = await self.new_bare_page()
+        await move_mouse(
+            page,
+            random.uniform(0.2, 0.8) * _VIEWPORT["width"],
+            random.uniform(0.2, 0.8) * _VIEWPORT["height"],
+        )
+        log.debug("worker_page_created")
+        return page
+
     # ------------------------------------------------------------------
     # Navigation
     # ------------------------------------------------------------------
 
     async def navigate(
-        self, url: str, wait_until: str = "domcontentloaded"
+        self,
+        url: str,
+        wait_until: str = "domcontentloaded",
+        page: Page | None = None,
     ) -> None:
-        """Navigate to *url* and wait, then pause like a human."""
-        page = await self.get_page()
+        """Navigate to *url* and wait, then pause like a human.
+
+        *page* defaults to the engine's current page; pass one from
+        ``new_bare_page`` or ``new_worker_page`` to drive it instead.
+        """
+        if page is None:
+            page = await self.get_page()
         log.info("navigating", url=url)
         await page.goto(url, wait_until=wait_until)  # type: ignore[arg-type]
         await asyncio.sleep(page_load_wait())
@@ -168,12 +254,14 @@ class BrowserEngine:
     # Interaction helpers
     # ------------------------------------------------------------------
 
-    async def click(self, selector: str) -> None:
+    async def click(self, selector: str, page: Page | None = None) -> None:
         """Click an element with human-like delays.
 
         Waits briefly before and after the click to emulate natural rhythm.
+        *page* defaults to the engine's current page.
         """
-        page = await self.get_page()
+        if page is None:
+            page = await self.get_page()
         await asyncio.sleep(between_actions())
 
         element = await page.wait_for_selector(selector, timeout=10_000)
@@ -184,7 +272,8 @@ class BrowserEngine:
         box = await element.bounding_box()
         if box is not None:
             # Move mouse to element vicinity first
-            await page.mouse.move(
+            await move_mouse(
+                page,
                 box["x"] + box["width"] / 2,
                 box["y"] + box["height"] / 2,
                 steps=5,
@@ -200,6 +289,7 @@ class BrowserEngine:
         selector: str,
         text: str,
         clear_first: bool = True,
+        page: Page | None = None,
     ) -> None:
         """Type *text* character-by-character with human-like timing.
 
@@ -211,8 +301,11 @@ class BrowserEngine:
             The string to type.
         clear_first:
             If ``True``, select-all and delete existing content before typing.
+        page:
+            Page to type into; defaults to the engine's current page.
         """
-        page = await self.get_page()
+        if page is None:
+            page = await self.get_page()
         await page.wait_for_selector(selector, timeout=10_000)
 
         if clear_first:
@@ -267,32 +360,52 @@ class BrowserEngine:
                 texts.append(content.strip())
         return texts
 
-    async def screenshot(self, name: str = "debug") -> Path:
+    async def screenshot(
+        self, name: str = "debug", page: Page | None = None
+    ) -> Path:
         """Capture a full-page screenshot and return its path.
 
         Screenshots are saved under ``data/screenshots/`` with a
-        UTC-timestamped filename for easy debugging.
+        UTC-timestamped filename for easy debugging.  *page* defaults to
+        the engine's current page.
         """
-        page = await self.get_page()
+        if page is None:
+            page = await self.get_page()
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         path = _SCREENSHOTS_DIR / f"{name}_{ts}.png"
         await page.screenshot(path=str(path), full_page=True)
         log.info("screenshot_saved", path=str(path))
         return path
 
-    async def upload_file(self, selector: str, file_path: str) -> None:
-        """Upload a file through a ``<input type="file">`` element.
+    async def upload_file(
+        self, selector: str, file_path: str | Sequence[str]
+    ) -> None:
+        """Upload one or more files through a ``<input type="file">`` element.
 
         If the input is hidden (common with styled upload buttons), the
         method uses Playwright's ``set_input_files`` which bypasses the
-        need for a visible click-to-upload interaction.
+        need for a visible click-to-upload interaction.  Passing several
+        paths selects them all in one go; that requires the input to
+        carry the ``multiple`` attribute.  An empty sequence raises
+        ``ValueError``.
         """
+        paths = [file_path] if isinstance(file_path, str) else list(file_path)
+        if not paths:
+            raise ValueError("upload_file needs at least one path.")
         page = await self.get_page()
-        resolved = Path(file_path).resolve()
-        if not resolved.is_file():
-            log.error("upload_file_not_found", path=str(resolved))
-            raise FileNotFoundError(f"Upload target not found: {resolved}")
-
-        await page.set_input_files(selector, str(resolved))
+        resolved: list[Path] = []
+        for fp in paths:
+            p = Path(fp).resolve()
+            if not p.is_file():
+                log.error("upload_file_not_found", path=str(p))
+                raise FileNotFoundError(f"Upload target not found: {p}")
+            resolved.append(p)
+
+        await page.set_input_files(selector, [str(p) for p in resolved])
         await asyncio.sleep(between_actions())
-        log.info("file_uploaded", selector=selector, path=str(resolved))
+        log.info(
+            "file_uploaded",
+            selector=selector,
+            path=str(resolved[0]),
+            count=len(resolved),
+        )
@@ -18,16 +18,83 @@ selectors; each segment is treated as an independent candidate.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import yaml
-from playwright.async_api import Page
+from playwright.async_api import ElementHandle, Page
 
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.models.database import Database
+
 log = get_logger(__name__, component="selectors")
 
+# ``find_cached`` trusts a resolved selector for this long (seconds) on the
+# URL path where it was last confirmed, without touching the page.
+_RESOLVED_TTL = 60.0
+
+# Resolved selectors persisted in ``selector_cache`` when a database is
+# attached; rows older than this are dropped on load.
+_PERSISTED_TTL = timedelta(days=7)
+_SELECT_PERSISTED_SQL = "SELECT page, element, selector FROM selector_cache"
+_DELETE_STALE_PERSISTED_SQL = "DELETE FROM selector_cache WHERE cached_at < ?"
+_DELETE_PERSISTED_SQL = "DELETE FROM selector_cache WHERE page = ? AND element = ?"
+_UPSERT_PERSISTED_SQL = (
+    "INSERT OR REPLACE INTO selector_cache (page, element, selector, cached_at) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+
+async def wait_for_any(
+    browser_page: Page,
+    selectors: Sequence[str],
+    timeout: int,
+) -> tuple[str, ElementHandle] | None:
+    """Wait for all *selectors* concurrently and return the first match.
+
+    Every selector shares the same *timeout* budget (milliseconds), so
+    the worst case is one timeout rather than one per candidate.  The
+    remaining waits are cancelled as soon as one selector matches.
+
+    Returns
+    -------
+    tuple[str, ElementHandle] | None
+        The winning selector and its element, or ``None`` if nothing
+        matched before the timeout.
+    """
+    if not selectors:
+        return None
+
+    tasks = {
+        asyncio.create_task(
+            browser_page.wait_for_selector(selector, timeout=timeout)
+        ): selector
+        for selector in selectors
+    }
+    pending: set[asyncio.Task[ElementHandle | None]] = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is not None:
+                    continue
+                el = task.result()
+                if el is not None:
+                    return tasks[task], el
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+
 
 class SelectorStore:
     """Read-only store backed by a YAML selector map.
@@ -37,11 +104,27 @@ class SelectorStore:
     yaml_path:
         Path to the YAML file.  Relative paths are resolved from the
         current working directory.
+    db:
+        Optional database; when given, selectors resolved by
+        ``find_cached`` are persisted there so they survive restarts.
     """
 
-    def __init__(self, yaml_path: str = "config/selectors.yaml") -> None:
+    def __init__(
+        self,
+        yaml_path: str = "config/selectors.yaml",
+        db: Database | None = None,
+    ) -> None:
         self._path = Path(yaml_path)
         self._data: dict[str, dict[str, dict[str, str]]] = {}
+        # Memoised ``get_all_safe`` results; the YAML is immutable at runtime.
+        self._safe_cache: dict[tuple[str, str], list[str]] = {}
+        # The one resolved-selector cache shared by every caller:
+        # (page, element) -> (selector, URL path, monotonic time) of the
+        # last confirmation on a live page.
+        self._resolved: dict[tuple[str, str], tuple[str, str, float]] = {}
+        self._resolve_locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._db = db
+        self._persisted_loaded = db is None
         self._load()
 
     # ------------------------------------------------------------------
@@ -84,6 +167,15 @@ class SelectorStore:
         # If the entry is a plain string (non-dict), return it directly.
         return str(entry)
 
+    def get_or_none(self, page: str, element: str) -> str | None:
+        """Like ``get`` but return ``None`` if *page*/*element* is undefined."""
+        entry = self._data.get(page, {}).get(element)
+        if entry is None:
+            return None
+        if isinstance(entry, dict):
+            return entry.get("primary")
+        return str(entry)
+
     def get_all(self, page: str, element: str) -> list[str]:
         """Return a list of all selectors (primary first, then fallbacks).
 
@@ -111,6 +203,22 @@ class SelectorStore:
 
         return selectors
 
+    def get_all_safe(self, page: str, element: str) -> list[str]:
+        """Like ``get_all`` but return ``[]`` if *page*/*element* is undefined.
+
+        Results (including misses) are cached per key; callers must treat
+        the returned list as read-only.
+        """
+        key = (page, element)
+        cached = self._safe_cache.get(key)
+        if cached is None:
+            try:
+                cached = self.get_all(page, element)
+            except KeyError:
+                cached = []
+            self._safe_cache[key] = cached
+        return cached
+
     async def find(
         self,
         browser_page: Page,
@@ -168,3 +276,114 @@ class SelectorStore:
             candidates=candidates,
         )
         return None
+
+    async def find_cached(
+        self,
+        browser_page: Page,
+        page: str,
+        element: str,
+        timeout: int = 10_000,
+    ) -> str | None:
+        """Like ``find``, but reuse the selector resolved last time.
+
+        Every caller shares one entry per *page*/*element*:
+
+        - confirmed on the same URL path in the last ``_RESOLVED_TTL``
+          seconds: returned without touching the page;
+        - otherwise re-confirmed with a single ``query_selector``;
+        - if that misses, the entry is dropped and the full ``find``
+          chain runs again, under a per-key lock so concurrent callers
+          do not probe the same chain twice.
+
+        Only hits are cached.  With a database attached, changes are
+        written to ``selector_cache``.  Use ``find`` when the caller needs
+        to know the element is present *now* (e.g. to detect page state).
+        """
+        if not self._persisted_loaded:
+            await self.load_persisted()
+        key = (page, element)
+        path = urlsplit(browser_page.url).path
+
+        cached = self._resolved.get(key)
+        if cached is not None:
+            selector, seen_path, seen_at = cached
+            if seen_path == path and time.monotonic() - seen_at < _RESOLVED_TTL:
+                return selector
+            if await browser_page.query_selector(selector) is not None:
+                self._resolved[key] = (selector, path, time.monotonic())
+                return selector
+
+        lock = self._resolve_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have re-resolved it while we waited.
+            fresh = self._resolved.get(key)
+            if fresh is not None and fresh is not cached:
+                return fresh[0]
+            self._resolved.pop(key, None)
+
+            selector = await self.find(browser_page, page, element, timeout=timeout)
+            if selector is not None:
+                self._resolved[key] = (selector, path, time.monotonic())
+            if selector != (cached[0] if cached is not None else None):
+                await self._persist(page, element, selector)
+            return selector
+
+    def forget(self, page: str | None = None, element: str | None = None) -> None:
+        """Drop resolved selectors so the next ``find_cached`` probes afresh.
+
+        With no arguments every entry goes; with *page* only that YAML
+        page's; with both just the one.  Persisted rows are corrected by
+        the next lookup.
+        """
+        if page is None:
+            self._resolved.clear()
+            return
+        for key in [k for k in self._resolved if k[0] == page]:
+            if element is None or key[1] == element:
+                del self._resolved[key]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    async def load_persisted(self) -> None:
+        """Seed the resolved-selector cache from the database.
+
+        Rows older than ``_PERSISTED_TTL`` are deleted first; loaded
+        entries are re-confirmed on first use.  ``find_cached`` calls this
+        lazily; call it at startup to keep the load off the first lookup.
+        A no-op without a database.
+        """
+        if self._persisted_loaded:
+            return
+        self._persisted_loaded = True
+        assert self._db is not None
+        cutoff = (datetime.now(timezone.utc) - _PERSISTED_TTL).isoformat()
+        try:
+            await self._db.execute(_DELETE_STALE_PERSISTED_SQL, (cutoff,))
+            rows = await self._db.fetch_all(_SELECT_PERSISTED_SQL)
+        except Exception:
+            log.warning("selector_cache_load_failed", exc_info=True)
+            return
+        for row in rows:
+            self._resolved.setdefault(
+                (row["page"], row["element"]), (row["selector"], "", float("-inf"))
+            )
+        log.debug("selector_cache_loaded", entries=len(rows))
+
+    async def _persist(self, page: str, element: str, selector: str | None) -> None:
+        """Store (or, for ``None``, forget) the selector for *page*/*element*."""
+        if self._db is None:
+            return
+        try:
+            if selector is None:
+                await self._db.execute(_DELETE_PERSISTED_SQL, (page, element))
+            else:
+                await self._db.execute(
+                    _UPSERT_PERSISTED_SQL,
+                    (page, element, selector, datetime.now(timezone.utc).isoformat()),
+                )
+        except Exception:
+            log.warning(
+                "selector_cache_write_failed", page=page, element=element, exc_info=True
+            )
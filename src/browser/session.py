@@ -9,12 +9,19 @@ resilient element lookups.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import re
+import time
+
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.browser.anti_detect import human_click, random_scroll, simulate_reading
 from src.browser.engine import BrowserEngine
-from src.browser.selectors import SelectorStore
-from src.utils.human_timing import between_actions, human_delay, page_load_wait
+from src.browser.selectors import SelectorStore, wait_for_any
+from src.utils.human_timing import between_actions, human_delay
 from src.utils.logger import get_logger
+from src.utils.profiling import profile
 
 log = get_logger(__name__, component="session")
 
@@ -22,6 +29,78 @@ _FIVERR_LOGIN_URL = "https://www.fiverr.com/login"
 _FIVERR_DASHBOARD_URL = "https://www.fiverr.com/seller_dashboard"
 _FIVERR_HOME_URL = "https://www.fiverr.com"
 
+# URL classification for session checks.  Anchored on the host so that
+# "fiverr.com" appearing in a query string does not count.
+_ON_FIVERR_URL_RE = re.compile(r"^https?://(?:[\w-]+\.)*fiverr\.com(?:[/?#]|$)")
+_LOGGED_IN_URL_RE = re.compile(
+    r"^https?://(?:[\w-]+\.)*fiverr\.com/(?:seller_dashboard|manage_orders)"
+)
+
+# Polled in the page after the login form is submitted; resolves to which
+# of the mutually exclusive outcomes happened first.  Captcha and error
+# markers only count while visible, so pre-rendered hidden containers are
+# ignored.
+_LOGIN_OUTCOME_JS = """
+(sels) => {
+    const shown = (el) =>
+        el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    const any = (list) => list.some((s) => {
+        try { return Array.from(document.querySelectorAll(s)).some(shown); }
+        catch (e) { return false; }
+    });
+    if (/fiverr\\.com\\/(seller_dashboard|manage_orders)/.test(location.href)) return 'ok';
+    if (any(sels.captcha)) return 'captcha';
+    if (any(sels.error)) return 'err';
+    return null;
+}
+"""
+
+# Generic login error markers, checked in addition to the YAML selectors.
+_LOGIN_ERROR_FALLBACK_SELS = (".error-msg", "[data-testid='login-error']")
+
+# Backoff schedule (seconds) while waiting for the operator to solve a
+# security challenge; the last value repeats until the overall timeout.
+_SECURITY_POLL_INTERVALS = (0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0)
+
+# Return, for each key, the first candidate selector present in the DOM.
+_RESOLVE_SELECTORS_JS = """
+(map) => {
+    const out = {};
+    for (const [key, sels] of Object.entries(map)) {
+        for (const sel of sels) {
+            try {
+                if (document.querySelector(sel)) { out[key] = sel; break; }
+            } catch (e) {}
+        }
+    }
+    return out;
+}
+"""
+
+# How long a positive session check is trusted before probing again.
+_SESSION_TTL_SECONDS = 300.0
+
+# Single-round-trip check of the current DOM for visible challenge and
+# cookie banner signals; hidden containers (pre-rendered templates) do not
+# count.  Selectors the browser cannot parse (e.g. Playwright's
+# ``:has-text``) are skipped.
+_SNAPSHOT_JS = """
+(sels) => {
+    const shown = (el) =>
+        el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    const any = (list) => list.some((s) => {
+        try { return Array.from(document.querySelectorAll(s)).some(shown); }
+        catch (e) { return false; }
+    });
+    return {
+        url: location.href,
+        hasCaptcha: any(sels.captcha),
+        hasCookie: any(sels.cookie)
+            || any(['[id*=cookie i] button, [class*=cookie i] button']),
+    };
+}
+"""
+
 
 class PerimeterXBlockedError(RuntimeError):
     """Raised when PerimeterX bot detection blocks access to Fiverr."""
@@ -39,69 +118,122 @@ class SessionManager:
         Fiverr account username (or e-mail).
     password:
         Fiverr account password.
+    fast_login:
+        If ``True``, fill the login fields by setting their value directly
+        in one ``evaluate`` instead of typing character by character.
+        Faster, but less human-like; typing is still used as a fallback.
     """
 
+    __slots__ = (
+        "_engine",
+        "_username",
+        "_password",
+        "_selectors",
+        "_dashboard_sels",
+        "_username_display_sels",
+        "_login_error_sels",
+        "_captcha_sels",
+        "_cookie_sels",
+        "_login_form_sels",
+        "_session_valid_until",
+        "_fast_login",
+        "_bg_tasks",
+    )
+
     def __init__(
         self,
         engine: BrowserEngine,
         username: str,
         password: str,
+        fast_login: bool = False,
     ) -> None:
         self._engine = engine
         self._username = username
         self._password = password
+        self._fast_login = fast_login
         self._selectors = SelectorStore()
 
+        # Selector lists used on every session check, resolved once.
+        self._dashboard_sels = self._selectors.get_all_safe("dashboard", "active_orders")
+        self._username_display_sels = self._selectors.get_all_safe(
+            "dashboard", "username_display"
+        )
+        self._login_error_sels = self._selectors.get_all_safe("login", "error_message")
+        self._captcha_sels = self._selectors.get_all_safe("login", "captcha_indicator")
+        self._cookie_sels = self._selectors.get_all_safe("common", "cookie_banner_close")
+        self._login_form_sels = {
+            "username_input": self._selectors.get_all_safe("login", "username_input"),
+            "password_input": self._selectors.get_all_safe("login", "password_input"),
+            "submit_button": self._selectors.get_all_safe("login", "submit_button"),
+        }
+
+        # ``time.monotonic()`` deadline until which the session is known
+        # to be valid; ``0.0`` means "unknown, probe the page".
+        self._session_valid_until = 0.0
+
+        # Debug screenshots taken off the hot path; kept referenced until
+        # done so they are not garbage-collected mid-flight.
+        self._bg_tasks: set[asyncio.Task[None]] = set()
+
+    async def close(self) -> None:
+        """Wait for any background debug screenshots to finish."""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
     # ------------------------------------------------------------------
     # Session health
     # ------------------------------------------------------------------
 
+    @profile
     async def is_logged_in(self) -> bool:
         """Return ``True`` if the browser appears to have an active session.
 
         Navigates to the seller dashboard and looks for recognisable
         dashboard elements.  If none are found within a short timeout the
-        user is considered logged out.
+        user is considered logged out.  A positive result is trusted for
+        ``_SESSION_TTL_SECONDS`` without touching the page again.
         """
+        if time.monotonic() < self._session_valid_until:
+            return True
+
+        try:
+            logged_in = await self._probe_logged_in()
+        except Exception:
+            self._session_valid_until = 0.0
+            raise
+
+        self._session_valid_until = (
+            time.monotonic() + _SESSION_TTL_SECONDS if logged_in else 0.0
+        )
+        return logged_in
+
+    async def _probe_logged_in(self) -> bool:
+        """Check the live page for signs of an active session."""
         page = await self._engine.get_page()
 
-        # If we are not already on the dashboard, navigate there.
-        current_url = page.url
-        if "seller_dashboard" not in current_url and "fiverr.com" not in current_url:
+        # If we are not on Fiverr at all, navigate to the dashboard.
+        if not _ON_FIVERR_URL_RE.search(page.url):
             await self._engine.navigate(_FIVERR_DASHBOARD_URL)
 
         # Try multiple dashboard indicators
-        dashboard_selectors = self._selectors.get_all("dashboard", "active_orders")
-        for selector in dashboard_selectors:
-            try:
-                el = await page.wait_for_selector(selector, timeout=5_000)
-                if el is not None:
-                    log.info("session_active")
-                    return True
-            except Exception:
-                continue
+        if await wait_for_any(page, self._dashboard_sels, timeout=5_000):
+            log.info("session_active")
+            return True
 
         # Fallback: check if the URL itself indicates we landed on a logged-in page
         # BUT first verify PerimeterX isn't blocking us (URL can still contain
         # "manage_orders" while showing the challenge page).
-        current_url = page.url
-        if "seller_dashboard" in current_url or "manage_orders" in current_url:
-            if await self._detect_perimeterx():
+        if _LOGGED_IN_URL_RE.search(page.url):
+            if await self._detect_perimeterx(page):
                 log.warning("session_url_ok_but_perimeterx_blocked")
                 return False
             log.info("session_active_by_url")
             return True
 
         # Check for username display as another indicator
-        username_selectors = self._selectors.get_all("dashboard", "username_display") if "dashboard" in self._selectors._data and "username_display" in self._selectors._data.get("dashboard", {}) else []
-        for selector in username_selectors:
-            try:
-                el = await page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    log.info("session_active_by_username")
-                    return True
-            except Exception:
-                continue
+        if await wait_for_any(page, self._username_display_sels, timeout=3_000):
+            log.info("session_active_by_username")
+            return True
 
         log.info("session_not_active")
         return False
@@ -113,8 +245,21 @@ class SessionManager:
         login flow is executed.  Raises ``PerimeterXBlockedError`` if
         PerimeterX is blocking access, ``RuntimeError`` for other failures.
         """
+        if time.monotonic() < self._session_valid_until:
+            return
+
+        try:
+            await self._ensure_session()
+        except Exception:
+            self._session_valid_until = 0.0
+            raise
+
+    async def _ensure_session(self) -> None:
+        """Body of ``ensure_session`` without the cached fast path."""
+        page = await self._engine.get_page()
+
         # Check for PerimeterX before anything else
-        if await self._detect_perimeterx():
+        if await self._detect_perimeterx(page):
             log.warning("ensure_session_perimeterx_blocked")
             raise PerimeterXBlockedError(
                 "PerimeterX bot detection is blocking access. "
@@ -126,18 +271,26 @@ class SessionManager:
 
         # After is_logged_in() navigated, PX may now be visible.
         # Raise immediately rather than wasting time on a login attempt.
-        if await self._detect_perimeterx():
+        if await self._detect_perimeterx(page):
             log.warning("ensure_session_perimeterx_after_nav")
             raise PerimeterXBlockedError(
                 "PerimeterX bot detection is blocking access. "
                 "Use /debug/solve-px or /debug/screenshot to resolve."
             )
 
+        # Try the cookies saved after the last successful login before
+        # falling back to the full form-based flow.
+        if await self._engine.restore_storage_state():
+            await self._engine.navigate(_FIVERR_DASHBOARD_URL)
+            if await self.is_logged_in():
+                log.info("session_restored_from_storage_state")
+                return
+
         log.info("session_expired_relogging")
         success = await self.login()
         if not success:
             # Check again if PX appeared during login
-            if await self._detect_perimeterx():
+            if await self._detect_perimeterx(page):
                 raise PerimeterXBlockedError(
                     "PerimeterX blocked during login attempt."
                 )
@@ -147,6 +300,7 @@ class SessionManager:
     # Login flow
     # ------------------------------------------------------------------
 
+    @profile
     async def login(self) -> bool:
         """Perform the complete Fiverr login flow.
 
@@ -157,90 +311,93 @@ class SessionManager:
 
         # ------ 1. Navigate to login page -----------------------------------
         await self._engine.navigate(_FIVERR_LOGIN_URL)
-        await asyncio.sleep(page_load_wait())
+        await page.wait_for_load_state("domcontentloaded")
 
         # ------ 2. Dismiss cookie / consent banners -------------------------
-        await self._dismiss_cookie_banner()
+        # Runs in the background while the challenge check and form lookup
+        # proceed; it is awaited before anything is typed so the banner
+        # cannot sit on top of the fields.
+        banner_task = asyncio.create_task(self._dismiss_cookie_banner(page))
 
-        # ------ 3. Check for security challenges ----------------------------
-        if await self._detect_security_check():
-            await self.handle_security_check()
-            # After human intervention, re-check login state
-            if await self.is_logged_in():
-                return True
-            # If still not logged in, the user didn't complete the challenge
-            log.warning("security_check_not_resolved")
-            return False
+        # Steps 3-4 may return or raise before the banner task is awaited;
+        # the ``finally`` makes sure it never outlives this call unobserved.
+        try:
+            # ------ 3. Check for security challenges ------------------------
+            if await self._detect_security_check(page):
+                await banner_task
+                await self.handle_security_check()
+                # After human intervention, re-check login state
+                if await self.is_logged_in():
+                    return True
+                # If still not logged in, the user didn't complete the challenge
+                log.warning("security_check_not_resolved")
+                return False
 
-        # ------ 4. Fill username -------------------------------------------
-        username_sel = await self._selectors.find(
-            page, "login", "username_input"
-        )
-        if username_sel is None:
-            log.error("login_username_field_not_found")
-            await self._engine.screenshot("login_no_username_field")
+            # ------ 4. Locate the form fields -----------------------------
+            form = await self._resolve_login_form(page)
+            await banner_task
+        finally:
+            if not banner_task.done():
+                banner_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await banner_task
+
+        missing = [key for key in self._login_form_sels if key not in form]
+        if missing:
+            log.error("login_form_fields_not_found", missing=missing)
+            self._bg_screenshot("login_form_incomplete")
             return False
 
+        # ------ 5. Fill username and password -----------------------------
         await asyncio.sleep(between_actions())
-        await self._engine.type_text(username_sel, self._username)
+        await self._fill_field(page, form["username_input"], self._username)
         log.info("login_username_entered")
 
-        # ------ 5. Fill password -------------------------------------------
-        password_sel = await self._selectors.find(
-            page, "login", "password_input"
-        )
-        if password_sel is None:
-            log.error("login_password_field_not_found")
-            await self._engine.screenshot("login_no_password_field")
-            return False
-
         await asyncio.sleep(between_actions())
-        await self._engine.type_text(password_sel, self._password)
+        await self._fill_field(page, form["password_input"], self._password)
         log.info("login_password_entered")
 
         # ------ 6. Submit the form -----------------------------------------
-        submit_sel = await self._selectors.find(
-            page, "login", "submit_button"
-        )
-        if submit_sel is None:
-            log.error("login_submit_button_not_found")
-            await self._engine.screenshot("login_no_submit")
-            return False
-
+        submit_sel = form["submit_button"]
         await asyncio.sleep(human_delay(0.3, 0.8))
         await human_click(page, submit_sel)
         log.info("login_form_submitted")
 
-        # ------ 7. Wait for navigation / dashboard -------------------------
-        await asyncio.sleep(page_load_wait())
+        # ------ 7. Wait for redirect, challenge, or error ------------------
+        outcome = await self._wait_for_login_outcome(page)
 
-        # Check for post-login security challenge
-        if await self._detect_security_check():
+        if outcome == "captcha" or (
+            outcome is None and await self._detect_security_check(page)
+        ):
             await self.handle_security_check()
             if await self.is_logged_in():
                 return True
             return False
 
-        # Check for login errors
-        error_selectors = self._selectors.get_all("login", "error_message") if "login" in self._selectors._data and "error_message" in self._selectors._data.get("login", {}) else []
-        for err_sel in error_selectors:
-            try:
-                el = await page.wait_for_selector(err_sel, timeout=2_000)
-                if el is not None:
-                    error_text = await el.text_content()
-                    log.error("login_error_displayed", error=error_text)
-                    await self._engine.screenshot("login_error")
-                    return False
-            except Exception:
-                continue
+        if outcome == "err":
+            error_match = await wait_for_any(
+                page,
+                [*self._login_error_sels, *_LOGIN_ERROR_FALLBACK_SELS],
+                timeout=1_000,
+            )
+            error_text = (
+                await error_match[1].text_content() if error_match else None
+            )
+            log.error("login_error_displayed", error=error_text)
+            self._bg_screenshot("login_error")
+            return False
 
         # Verify we actually reached the dashboard
         logged_in = await self.is_logged_in()
         if logged_in:
             log.info("login_successful")
+            try:
+                await self._engine.save_storage_state()
+            except Exception:
+                log.warning("storage_state_save_failed", exc_info=True)
         else:
             log.warning("login_verification_failed")
-            await self._engine.screenshot("login_verification_failed")
+            self._bg_screenshot("login_verification_failed")
 
         return logged_in
 
@@ -271,17 +428,21 @@ class SessionManager:
 
         page = await self._engine.get_page()
 
-        # Poll every 5 seconds for up to 5 minutes, waiting for the
-        # challenge to disappear (i.e. the page navigates away).
+        # Poll with exponential backoff for up to 5 minutes, waiting for the
+        # challenge to disappear (i.e. the page navigates away).  Short
+        # early intervals catch quick solves; later ones cap the cost.
         max_wait_seconds = 300
-        poll_interval = 5.0
+        intervals = iter(_SECURITY_POLL_INTERVALS)
         elapsed = 0.0
 
         while elapsed < max_wait_seconds:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            interval = next(intervals, _SECURITY_POLL_INTERVALS[-1])
+            await asyncio.sleep(interval)
+            elapsed += interval
 
-            if not await self._detect_security_check():
+            # The challenge is known to be present; we only need a quick
+            # snapshot to notice when it is gone.
+            if not await self._detect_security_check(page, timeout=500):
                 log.info("security_check_resolved", elapsed_secs=round(elapsed))
                 return
 
@@ -291,13 +452,11 @@ class SessionManager:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _detect_perimeterx(self) -> bool:
+    async def _detect_perimeterx(self, page: Page, timeout: int = 2_000) -> bool:
         """Return ``True`` if PerimeterX (HUMAN Security) challenge is present."""
-        page = await self._engine.get_page()
-
         # Check for the #px-captcha element (primary PX indicator)
         try:
-            el = await page.wait_for_selector("#px-captcha", timeout=2_000)
+            el = await page.wait_for_selector("#px-captcha", timeout=timeout)
             if el is not None:
                 log.warning("perimeterx_captcha_detected")
                 return True
@@ -335,38 +494,146 @@ class SessionManager:
 
         return False
 
-    async def _detect_security_check(self) -> bool:
-        """Return ``True`` if a CAPTCHA / challenge iframe is present."""
-        # Check PerimeterX first (most common blocker on Fiverr)
-        if await self._detect_perimeterx():
+    async def _detect_security_check(
+        self, page: Page, timeout: int = 2_000
+    ) -> bool:
+        """Return ``True`` if a CAPTCHA / challenge iframe is present.
+
+        *timeout* (ms) bounds each selector wait; pass a small value when
+        polling for a challenge that is already known to be present.
+        """
+        snapshot = await self._snapshot(page)
+        if snapshot.get("hasCaptcha"):
+            log.debug("security_check_indicator_found")
             return True
 
-        page = await self._engine.get_page()
-        captcha_selectors = self._selectors.get_all("login", "captcha_indicator")
-        for selector in captcha_selectors:
-            try:
-                el = await page.wait_for_selector(selector, timeout=2_000)
-                if el is not None:
-                    log.debug("security_check_indicator_found", selector=selector)
-                    return True
-            except Exception:
-                continue
-        return False
+        # PerimeterX can also show up as a page title or script globals.
+        return await self._detect_perimeterx(page, timeout=timeout)
 
-    async def _dismiss_cookie_banner(self) -> None:
+    async def _dismiss_cookie_banner(self, page: Page) -> None:
         """Attempt to close a cookie-consent banner if present."""
-        page = await self._engine.get_page()
-        cookie_selectors = self._selectors.get_all("common", "cookie_banner_close")
-        for selector in cookie_selectors:
+        snapshot = await self._snapshot(page)
+        if not snapshot.get("hasCookie"):
+            log.debug("no_cookie_banner_found")
+            return
+
+        match = await wait_for_any(page, self._cookie_sels, timeout=3_000)
+        if match is not None:
+            selector, el = match
             try:
-                el = await page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.3, 1.0))
-                    await el.click()
-                    log.info("cookie_banner_dismissed", selector=selector)
-                    await asyncio.sleep(human_delay(0.5, 1.5))
-                    return
+                await asyncio.sleep(human_delay(0.3, 1.0))
+                await el.click()
+                log.info("cookie_banner_dismissed", selector=selector)
+                await asyncio.sleep(human_delay(0.5, 1.5))
+                return
             except Exception:
-                continue
+                log.debug("cookie_banner_click_failed", selector=selector)
 
         log.debug("no_cookie_banner_found")
+
+    def _bg_screenshot(self, name: str) -> None:
+        """Capture a debug screenshot without blocking the caller."""
+        task = asyncio.create_task(self._safe_screenshot(name))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
+    async def _safe_screenshot(self, name: str) -> None:
+        """Take a screenshot, logging (not raising) any failure."""
+        try:
+            await self._engine.screenshot(name)
+        except Exception:
+            log.warning("screenshot_failed", name=name, exc_info=True)
+
+    async def _wait_for_login_outcome(self, page: Page) -> str | None:
+        """Wait for the first post-submit outcome in a single page poll.
+
+        Returns ``"ok"`` (redirected to a logged-in URL), ``"captcha"``,
+        ``"err"`` (login error shown), or ``None`` if nothing conclusive
+        happened within 15 s.
+        """
+        try:
+            handle = await page.wait_for_function(
+                _LOGIN_OUTCOME_JS,
+                arg={
+                    "captcha": self._captcha_sels,
+                    "error": [*self._login_error_sels, *_LOGIN_ERROR_FALLBACK_SELS],
+                },
+                timeout=15_000,
+            )
+            outcome: str = await handle.json_value()
+        except PlaywrightTimeoutError:
+            log.debug("login_outcome_wait_timeout", url=page.url)
+            return None
+        except Exception:
+            # Navigation can destroy the execution context mid-poll.
+            log.debug("login_outcome_wait_failed", exc_info=True)
+            return None
+        log.debug("login_outcome", outcome=outcome)
+        return outcome
+
+    async def _fill_field(self, page: Page, selector: str, value: str) -> None:
+        """Fill a login field, using ``_fast_fill`` when enabled."""
+        if self._fast_login and await self._fast_fill(page, selector, value):
+            return
+        await self._engine.type_text(selector, value)
+
+    async def _fast_fill(self, page: Page, selector: str, value: str) -> bool:
+        """Set an input's value directly and fire ``input``/``change`` events.
+
+        Returns ``False`` if the element is missing or the script fails,
+        so the caller can fall back to typing.
+        """
+        try:
+            filled: bool = await page.evaluate(
+                """(args) => {
+                    const el = document.querySelector(args.sel);
+                    if (!el) return false;
+                    el.focus();
+                    el.value = args.v;
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new Event('change', {bubbles: true}));
+                    return true;
+                }""",
+                {"sel": selector, "v": value},
+            )
+        except Exception:
+            log.debug("fast_fill_failed", selector=selector, exc_info=True)
+            return False
+        return filled
+
+    async def _resolve_login_form(self, page: Page) -> dict[str, str]:
+        """Resolve the username, password and submit selectors together.
+
+        All three are looked up in a single ``evaluate``; only fields the
+        snapshot missed (e.g. not rendered yet) fall back to the waiting
+        ``SelectorStore.find``.  Fields that cannot be found are omitted.
+        """
+        try:
+            form: dict[str, str] = await page.evaluate(
+                _RESOLVE_SELECTORS_JS, self._login_form_sels
+            )
+        except Exception:
+            log.debug("login_form_snapshot_failed", exc_info=True)
+            form = {}
+
+        for key in self._login_form_sels:
+            if key not in form:
+                selector = await self._selectors.find(page, "login", key)
+                if selector is not None:
+                    form[key] = selector
+        return form
+
+    async def _snapshot(self, page: Page) -> dict[str, object]:
+        """Return challenge / cookie-banner signals from one ``evaluate``.
+
+        Returns an empty dict if the page cannot be evaluated (e.g. it is
+        mid-navigation), which callers treat as "nothing present".
+        """
+        try:
+            return await page.evaluate(
+                _SNAPSHOT_JS,
+                {"captcha": self._captcha_sels, "cookie": self._cookie_sels},
+            )
+        except Exception:
+            log.debug("page_snapshot_failed", exc_info=True)
+            return {}
@@ -7,13 +7,58 @@ response rate, and unread-message status.
 
 from __future__ import annotations
 
+import asyncio
+import re
+
 from src.browser.engine import BrowserEngine
 from src.browser.selectors import SelectorStore
 from src.fiverr.navigation import Navigator
 from src.utils.logger import get_logger
+from src.utils.profiling import profile
 
 log = get_logger(__name__, component="dashboard")
 
+_DIGITS_RE = re.compile(r"\d+")
+
+# Dashboard metric -> (YAML page, YAML element) in the selector store.
+_METRIC_SELECTORS: dict[str, tuple[str, str]] = {
+    "active_orders": ("dashboard", "active_orders"),
+    "earnings": ("dashboard", "earnings_total"),
+    "response_rate": ("dashboard", "response_rate"),
+    "has_new_messages": ("dashboard", "new_messages_badge"),
+}
+
+# Resolve every metric in one round-trip: for each key, return the text of
+# the first candidate selector that matches an element with text.
+_EXTRACT_METRICS_JS = """
+(map) => {
+    const out = {};
+    for (const [key, sels] of Object.entries(map)) {
+        for (const sel of sels) {
+            let el = null;
+            try { el = document.querySelector(sel); } catch (e) { continue; }
+            if (el && el.textContent) { out[key] = el.textContent; break; }
+        }
+    }
+    return out;
+}
+"""
+
+# Same lookup for a single candidate list, plus the document's readyState
+# so the caller knows whether waiting could still help.
+_FIRST_TEXT_JS = """
+(sels) => {
+    for (const sel of sels) {
+        let el = null;
+        try { el = document.querySelector(sel); } catch (e) { continue; }
+        if (el && el.textContent) {
+            return {text: el.textContent, ready: document.readyState};
+        }
+    }
+    return {text: null, ready: document.readyState};
+}
+"""
+
 
 class DashboardScraper:
     """Extracts seller metrics from the Fiverr dashboard.
@@ -28,6 +73,8 @@ class DashboardScraper:
         A configured ``Navigator`` instance.
     """
 
+    __slots__ = ("_engine", "_selectors", "_navigator")
+
     def __init__(
         self,
         engine: BrowserEngine,
@@ -42,6 +89,7 @@ class DashboardScraper:
     # Primary scrape
     # ------------------------------------------------------------------
 
+    @profile
     async def scrape(self) -> dict[str, str | int | bool]:
         """Navigate to the dashboard and return key seller metrics.
 
@@ -54,6 +102,10 @@ class DashboardScraper:
         """
         await self._navigator.goto_dashboard()
 
+        # Extraction reads the DOM as it is, so make sure it has been parsed.
+        page = await self._engine.get_page()
+        await page.wait_for_load_state("domcontentloaded")
+
         metrics: dict[str, str | int | bool] = {
             "active_orders": 0,
             "earnings": "N/A",
@@ -61,38 +113,32 @@ class DashboardScraper:
             "has_new_messages": False,
         }
 
+        texts = await self._extract_metric_texts()
+
         # -- Active orders --------------------------------------------------
-        active_orders_text = await self._extract_with_fallback(
-            "dashboard", "active_orders"
-        )
+        active_orders_text = texts.get("active_orders")
         if active_orders_text is not None:
             cleaned = active_orders_text.strip()
             # Extract the numeric portion (e.g. "3 Active" -> 3)
-            digits = "".join(ch for ch in cleaned if ch.isdigit())
-            if digits:
-                metrics["active_orders"] = int(digits)
+            match = _DIGITS_RE.search(cleaned)
+            if match:
+                metrics["active_orders"] = int(match.group())
             else:
                 # If the entire text is not numeric, store the raw string
                 log.debug("active_orders_non_numeric", raw=cleaned)
 
         # -- Earnings -------------------------------------------------------
-        earnings_text = await self._extract_with_fallback(
-            "dashboard", "earnings_total"
-        )
+        earnings_text = texts.get("earnings")
         if earnings_text is not None:
             metrics["earnings"] = earnings_text.strip()
 
         # -- Response rate --------------------------------------------------
-        response_text = await self._extract_with_fallback(
-            "dashboard", "response_rate"
-        )
+        response_text = texts.get("response_rate")
         if response_text is not None:
             metrics["response_rate"] = response_text.strip()
 
         # -- New messages ---------------------------------------------------
-        badge_text = await self._extract_with_fallback(
-            "dashboard", "new_messages_badge"
-        )
+        badge_text = texts.get("has_new_messages")
         if badge_text is not None:
             stripped = badge_text.strip()
             # Any non-empty badge text (including "0") that is not literally "0"
@@ -127,11 +173,12 @@ class DashboardScraper:
 
         for selector in notification_selectors:
             try:
-                elements = await page.query_selector_all(selector)
-                for el in elements:
-                    text = await el.text_content()
-                    if text and text.strip():
-                        notifications.append(text.strip())
+                # One round-trip per selector for all matching elements.
+                notifications = await page.eval_on_selector_all(
+                    selector,
+                    "els => els.map(e => e.textContent && e.textContent.trim())"
+                    ".filter(Boolean)",
+                )
                 if notifications:
                     break
             except Exception:
@@ -144,13 +191,58 @@ class DashboardScraper:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _extract_metric_texts(self) -> dict[str, str]:
+        """Return raw text for every dashboard metric in one ``evaluate``.
+
+        Metrics whose selectors are missing from the store or match
+        nothing are absent from the result.  If the in-page script fails,
+        the metrics are resolved concurrently via ``_extract_with_fallback``.
+        """
+        page = await self._engine.get_page()
+
+        selector_map: dict[str, list[str]] = {}
+        for key, (yaml_page, yaml_element) in _METRIC_SELECTORS.items():
+            try:
+                selector_map[key] = self._selectors.get_all(yaml_page, yaml_element)
+            except KeyError:
+                log.warning(
+                    "selector_key_missing",
+                    page=yaml_page,
+                    element=yaml_element,
+                )
+
+        try:
+            texts: dict[str, str] = await page.evaluate(
+                _EXTRACT_METRICS_JS, selector_map
+            )
+            log.debug("dashboard_metrics_extracted", keys=list(texts))
+            return texts
+        except Exception:
+            log.warning("dashboard_batch_extract_failed", exc_info=True)
+
+        # The fields are independent, so let their selector waits overlap.
+        results = await asyncio.gather(
+            *(
+                self._extract_with_fallback(yaml_page, yaml_element)
+                for yaml_page, yaml_element in _METRIC_SELECTORS.values()
+            )
+        )
+        return {
+            key: text
+            for key, text in zip(_METRIC_SELECTORS, results, strict=True)
+            if text is not None
+        }
+
+    @profile
     async def _extract_with_fallback(
         self, yaml_page: str, yaml_element: str
     ) -> str | None:
         """Try every selector for *yaml_page*/*yaml_element* and return text.
 
-        Returns the ``textContent`` from the first matching selector, or
-        ``None`` if none matched.
+        The loaded DOM is checked for all candidates in one ``evaluate``;
+        only while the document is still loading does it wait (briefly)
+        for any candidate to appear.  Returns the ``textContent`` from the first matching
+        selector, or ``None`` if none matched.
         """
         page = await self._engine.get_page()
 
@@ -164,22 +256,45 @@ class DashboardScraper:
             )
             return None
 
-        for selector in candidates:
-            try:
-                element = await page.wait_for_selector(selector, timeout=5_000)
-                if element is not None:
-                    text = await element.text_content()
-                    if text is not None:
-                        log.debug(
-                            "element_extracted",
-                            page=yaml_page,
-                            element=yaml_element,
-                            selector=selector,
-                            text=text.strip()[:80],
-                        )
-                        return text
-            except Exception:
-                continue
+        try:
+            snapshot = await page.evaluate(_FIRST_TEXT_JS, candidates)
+            text, ready_state = snapshot["text"], snapshot["ready"]
+        except Exception:
+            text, ready_state = None, "loading"
+
+        if text is not None:
+            log.debug(
+                "element_extracted",
+                page=yaml_page,
+                element=yaml_element,
+                text=text.strip()[:80],
+            )
+            return text
+        if ready_state == "complete":
+            log.debug(
+                "element_not_found",
+                page=yaml_page,
+                element=yaml_element,
+            )
+            return None
+
+        # Still loading: let the browser race every candidate at once via a
+        # CSS selector union, with a single timeout budget.
+        try:
+            text = await page.locator(", ".join(candidates)).first.text_content(
+                timeout=2_000
+            )
+        except Exception:
+            text = None
+
+        if text is not None:
+            log.debug(
+                "element_extracted",
+                page=yaml_page,
+                element=yaml_element,
+                text=text.strip()[:80],
+            )
+            return text
 
         log.debug(
             "element_not_found",
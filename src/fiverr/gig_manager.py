@@ -9,22 +9,361 @@ listing and status-toggling for existing gigs.
 from __future__ import annotations
 
 import asyncio
+import json
+import re
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin
 
 import yaml
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.browser.anti_detect import human_click
 from src.browser.engine import BrowserEngine
 from src.browser.selectors import SelectorStore
 from src.fiverr.navigation import Navigator
 from src.models.database import Database
-from src.utils.human_timing import between_actions, human_delay, page_load_wait
+from src.utils.human_timing import (
+    between_actions,
+    human_delay,
+    page_load_wait,
+    typing_delay,
+)
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page as PwPage
+
 log = get_logger(__name__, component="gig_manager")
 
+# Relative gig links are resolved against this.
+_BASE_URL = "https://www.fiverr.com/"
+
+_NON_DIGITS_RE = re.compile(r"\D+")
+# Numeric gig ID as a whole path segment after /manage_gigs/ or /gigs/.
+_GIG_ID_RE = re.compile(r"/(?:manage_gigs|gigs)/(\d+)(?=[/?#]|$)")
+
+# Title keywords for _infer_gig_type, matched anywhere in the title (so
+# "scripts" and "coder" count) in a single scan.
+_CODING_KEYWORDS_RE = re.compile(r"python|script|code|automation", re.IGNORECASE)
+_DATA_ENTRY_KEYWORDS_RE = re.compile(r"data entry|spreadsheet|excel", re.IGNORECASE)
+
+_UPDATE_GIG_STATUS_SQL = "UPDATE gigs SET status = ? WHERE fiverr_gig_id = ?"
+_INSERT_GIG_SQL = (
+    "INSERT INTO gigs (fiverr_gig_id, gig_type, title, status, created_at) "
+    "VALUES (?, ?, ?, 'active', ?)"
+)
+
+# LibYAML's C parser when PyYAML was built with it (the binary wheels are);
+# the pure-Python loader otherwise.  Both are "safe" loaders.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Parsed template files keyed by path -> (mtime_ns, size, data).  Entries
+# are only reused while the file's mtime and size are unchanged.
+_TEMPLATE_CACHE: OrderedDict[str, tuple[int, int, Mapping[str, Any]]] = OrderedDict()
+_TEMPLATE_CACHE_MAX = 32
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of parsed YAML/JSON data.
+
+    Dicts become ``MappingProxyType`` and lists become tuples, recursively.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _load_templates(path: Path) -> Mapping[str, Any]:
+    """Return the parsed YAML at *path*, reusing a cached parse if fresh.
+
+    The result is frozen (see ``_freeze``) so it can be shared with every
+    caller without copying; nothing can mutate the cached tree.
+    """
+    st = path.stat()
+    key = str(path.resolve())
+
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _TEMPLATE_CACHE.move_to_end(key)
+        log.debug("templates_cache_hit", path=key)
+        return cached[2]
+
+    data: Mapping[str, Any] = _freeze(_parse_templates(path, st.st_mtime_ns))
+
+    _TEMPLATE_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _TEMPLATE_CACHE.move_to_end(key)
+    while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_MAX:
+        _TEMPLATE_CACHE.popitem(last=False)
+
+    return data
+
+
+def _parse_templates(path: Path, yaml_mtime_ns: int) -> dict[str, Any]:
+    """Parse the templates at *path*, via the compiled JSON copy if current.
+
+    The JSON copy (``<name>.cache.json`` next to the YAML) is rewritten
+    whenever it is older than the YAML.  It is skipped when the data does
+    not survive a JSON round trip unchanged (dates, or the non-string keys
+    YAML produces for ``yes``/``no``/``1``/``1.5``), so every run sees the
+    same tree.  Failing to write it (read-only config dir) only costs the
+    speed-up.
+    """
+    json_path = path.with_suffix(".cache.json")
+    try:
+        if json_path.stat().st_mtime_ns >= yaml_mtime_ns:
+            with open(json_path, encoding="utf-8") as fh:
+                return json.load(fh)
+    except (OSError, ValueError):
+        pass
+
+    with open(path, encoding="utf-8") as fh:
+        data: dict[str, Any] = yaml.load(fh, Loader=_YamlLoader) or {}
+
+    try:
+        encoded = json.dumps(data)
+        round_trips = json.loads(encoded) == data
+    except (TypeError, ValueError):
+        round_trips = False
+    if not round_trips:
+        log.debug("templates_json_cache_skipped", path=str(json_path))
+        return data
+
+    tmp_path = json_path.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(encoded, encoding="utf-8")
+        tmp_path.replace(json_path)
+    except OSError:
+        log.debug("templates_json_cache_write_failed", path=str(json_path), exc_info=True)
+        tmp_path.unlink(missing_ok=True)
+
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Static selector fallbacks
+# ---------------------------------------------------------------------------
+
+# Gig card containers on the manage-gigs page, most specific first.
+_GIG_CARD_SELECTORS: tuple[str, ...] = (
+    ".gig-card",
+    ".gig-row",
+    "[data-testid='gig-item']",
+    ".manage-gig-item",
+    "tr.gig-item",
+    ".gig-listing",
+)
+
+# Per-field selectors tried inside each manage-gigs card, in order.
+_GIG_TITLE_SELECTORS: tuple[str, ...] = (
+    "h3", ".gig-title", "a.title", "h4", "[data-testid='gig-title']",
+)
+_GIG_STATUS_SELECTORS: tuple[str, ...] = (
+    ".gig-status", ".status-badge", "span[class*='status']",
+    "[data-testid='gig-status']",
+)
+_GIG_STAT_SELECTORS: tuple[tuple[str, str], ...] = (
+    (".impressions", "impressions"),
+    (".clicks", "clicks"),
+    (".orders-count", "orders"),
+)
+_GIG_STAT_CELL_SELECTOR = "td.stat, .analytics-cell, .stat-value"
+_GIG_STAT_KEYS: tuple[str, ...] = ("impressions", "clicks", "orders")
+
+# Activate/pause controls on a gig's management page, keyed by action.
+_TOGGLE_SELECTORS: dict[str, tuple[str, ...]] = {
+    action: (
+        f"button:has-text('{action.capitalize()}')",
+        f"a:has-text('{action.capitalize()}')",
+        ".gig-status-toggle",
+        "[data-testid='gig-toggle']",
+        f"button[data-action='{action}']",
+    )
+    for action in ("activate", "pause")
+}
+# Accessible names matched with get_by_role: one accessibility-tree scan
+# instead of a :has-text probe per label.
+_CONFIRM_BUTTON_NAME = re.compile(r"^(Confirm|Yes|OK)$", re.IGNORECASE)
+_PUBLISH_BUTTON_NAME = re.compile(r"^Publish( Gig)?$", re.IGNORECASE)
+
+# gig_creation elements whose YAML selector (if any) is tried before the
+# built-in fallbacks below.
+_YAML_FALLBACK_ELEMENTS: tuple[str, ...] = (
+    "price_input",
+    "delivery_days",
+    "save_button",
+    "publish_button",
+)
+
+# Wizard buttons; the YAML-configured selector (if any) is tried first.
+_SAVE_SELECTORS: tuple[str, ...] = (
+    "button:has-text('Save & Continue')",
+    "button:has-text('Save and Continue')",
+    "button:has-text('Continue')",
+    "button:has-text('Next')",
+    "[data-testid='save-continue']",
+)
+# Tried alongside the _PUBLISH_BUTTON_NAME role lookup.
+_PUBLISH_SELECTORS: tuple[str, ...] = ("[data-testid='publish-gig']",)
+
+_DESCRIPTION_FALLBACK_SELECTORS: tuple[str, ...] = (
+    "textarea[name='description']",
+    ".ql-editor",
+    "[contenteditable='true']",
+    "textarea.description",
+)
+_GIG_ID_SELECTORS: tuple[str, ...] = (
+    ".gig-id",
+    "[data-testid='gig-id']",
+    "a[href*='/gigs/']",
+    ".success-gig-link",
+)
+
+# Whether each selector matches anything: true / false, or null if it is
+# not plain CSS (e.g. Playwright's :has-text) and must be checked by
+# Playwright instead.
+_MATCHES_JS = """
+(sels) => {
+    const shown = (el) =>
+        el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+    return sels.map((sel) => {
+        try { return Array.from(document.querySelectorAll(sel)).some(shown); }
+        catch (e) { return null; }
+    });
+}
+"""
+
+# Every option of a <select> element as [lowercased label, value] pairs.
+_SELECT_OPTIONS_JS = (
+    "el => Array.from(el.options, o => [o.textContent.trim().toLowerCase(), o.value])"
+)
+
+_PACKAGE_TIERS: tuple[str, ...] = ("basic", "standard", "premium")
+
+# Set package fields in one call: {tier: {field: {value, selectors}}} ->
+# list of "tier.field" keys that were set.  Selects match ``revisions`` by
+# label and everything else by option value.
+_PREFILL_PACKAGES_JS = """
+(spec) => {
+    const filled = [];
+    for (const [tier, fields] of Object.entries(spec)) {
+        for (const [field, {value, selectors}] of Object.entries(fields)) {
+            let el = null;
+            for (const sel of selectors) {
+                try { el = document.querySelector(sel); } catch (e) { continue; }
+                if (el) break;
+            }
+            if (!el) continue;
+            if (el.tagName === "SELECT") {
+                const opt = Array.from(el.options).find((o) => field === "revisions"
+                    ? o.textContent.trim() === value : o.value === value);
+                if (!opt) continue;
+                el.value = opt.value;
+            } else {
+                el.value = value;
+            }
+            el.dispatchEvent(new Event("input", {bubbles: true}));
+            el.dispatchEvent(new Event("change", {bubbles: true}));
+            filled.push(tier + "." + field);
+        }
+    }
+    return filled;
+}
+"""
+
+# Upper bound on cards parsed at once by the element-by-element fallback.
+_CARD_PARSE_CONCURRENCY = 16
+
+# Scrape every gig card on the manage-gigs page in one round-trip.  Mirrors
+# the per-element fallback in ``get_my_gigs``: the first card selector that
+# matches wins, each text field takes the first non-empty candidate, and
+# stat cells (when present) override the named stat elements by position.
+_EXTRACT_GIGS_JS = """
+(spec) => {
+    const text = (el) => (el && el.textContent ? el.textContent.trim() : "");
+    const firstText = (card, sels) => {
+        for (const sel of sels) {
+            const t = text(card.querySelector(sel));
+            if (t) return t;
+        }
+        return "";
+    };
+
+    let cards = [];
+    for (const sel of spec.cards) {
+        cards = document.querySelectorAll(sel);
+        if (cards.length) break;
+    }
+
+    const gigs = [];
+    for (const card of cards) {
+        const gig = {
+            title: firstText(card, spec.title),
+            status: firstText(card, spec.status).toLowerCase(),
+            url: "",
+            impressions: "0",
+            clicks: "0",
+            orders: "0",
+        };
+
+        const link = card.querySelector("a[href*='/gigs/']")
+            || card.querySelector("a[href]");
+        let href = link ? (link.getAttribute("href") || "") : "";
+        if (href) {
+            try { href = new URL(href, "https://www.fiverr.com/").href; } catch (e) {}
+        }
+        gig.url = href;
+
+        for (const [sel, key] of spec.stats) {
+            const digits = text(card.querySelector(sel)).replace(/\\D/g, "");
+            if (digits) gig[key] = digits;
+        }
+        const cells = card.querySelectorAll(spec.statCells);
+        spec.statKeys.forEach((key, idx) => {
+            if (idx >= cells.length) return;
+            const digits = text(cells[idx]).replace(/\\D/g, "");
+            if (digits) gig[key] = digits;
+        });
+
+        if (gig.title) gigs.push(gig);
+    }
+    return gigs;
+}
+"""
+
+
+def gig_columns(gigs: list[dict[str, str]]) -> dict[str, list[Any]]:
+    """Pivot ``get_my_gigs`` rows into one list per field.
+
+    ``title``, ``status`` and ``url`` stay strings; ``impressions``,
+    ``clicks`` and ``orders`` are converted to ``int`` so columns can be
+    summed or plotted directly (``sum(cols["clicks"])``).
+    """
+    columns: dict[str, list[Any]] = {
+        key: [] for key in ("title", "status", "url", *_GIG_STAT_KEYS)
+    }
+    for gig in gigs:
+        columns["title"].append(gig["title"])
+        columns["status"].append(gig["status"])
+        columns["url"].append(gig["url"])
+        for key in _GIG_STAT_KEYS:
+            columns[key].append(int(gig[key] or 0))
+    return columns
+
+
+def _gig_status(active: bool) -> str:
+    """Database status string for an activated / paused gig."""
+    return "active" if active else "paused"
+
 
 class GigManager:
     """Create, list, and manage Fiverr gigs.
@@ -39,6 +378,10 @@ class GigManager:
         A configured ``Navigator`` instance.
     db:
         A connected ``Database`` for gig tracking.
+    fast_fill:
+        If ``True``, set all package/pricing fields directly in one
+        ``evaluate`` instead of typing them.  Much faster, but less
+        human-like; anything the script can't place is still typed.
     """
 
     def __init__(
@@ -47,17 +390,33 @@ class GigManager:
         selectors: SelectorStore,
         navigator: Navigator,
         db: Database,
+        fast_fill: bool = False,
     ) -> None:
         self._engine = engine
         self._selectors = selectors
         self._navigator = navigator
         self._db = db
+        self._fast_fill = fast_fill
+        # ``<select>`` options as [lowercased label, value] pairs, keyed by
+        # (selector, scope) -- see ``_select_option_by_text``.
+        self._option_cache: dict[tuple[str, str], list[list[str]]] = {}
+        # YAML-configured gig_creation selectors that are prepended to the
+        # built-in fallbacks; ``None`` where the YAML doesn't define one.
+        self._gig_creation_sels: dict[str, str | None] = {
+            element: selectors.get_or_none("gig_creation", element)
+            for element in _YAML_FALLBACK_ELEMENTS
+        }
 
     # ------------------------------------------------------------------
     # Gig creation
     # ------------------------------------------------------------------
 
-    async def create_gig(self, template: dict[str, Any]) -> str | None:
+    async def create_gig(
+        self,
+        template: Mapping[str, Any],
+        page: PwPage | None = None,
+        persist: bool = True,
+    ) -> str | None:
         """Create a single gig from a template dictionary.
 
         The template is expected to have keys matching the structure in
@@ -68,6 +427,14 @@ class GigManager:
         ----------
         template:
             A gig template dictionary.
+        page:
+            Page to run the wizard on.  Defaults to the engine's current
+            page; ``create_all_gigs`` passes its own pages when creating
+            gigs concurrently.
+        persist:
+            Whether to record the new gig in the database immediately.
+            ``create_all_gigs`` turns this off and inserts the whole batch
+            at once.
 
         Returns
         -------
@@ -81,10 +448,12 @@ class GigManager:
 
         log.info("creating_gig", title=title)
 
-        try:
-            await self._navigator.goto_gig_creation()
+        if page is None:
             page = await self._engine.get_page()
 
+        try:
+            await self._navigator.goto_gig_creation(page)
+
             # Step 1: Title
             await self._fill_title(page, title)
 
@@ -117,7 +486,8 @@ class GigManager:
             gig_id = await self._publish_gig(page)
 
             if gig_id:
-                await self._save_gig_to_db(template, gig_id)
+                if persist:
+                    await self._save_gig_to_db(template, gig_id)
                 log.info("gig_created", gig_id=gig_id, title=title)
             else:
                 log.warning("gig_creation_uncertain", title=title)
@@ -126,7 +496,9 @@ class GigManager:
 
         except Exception:
             log.error("gig_creation_failed", title=title, exc_info=True)
-            await self._engine.screenshot("gig_creation_error")
+            # A cached selector may be what broke; re-probe on the next gig.
+            self._selectors.forget("gig_creation")
+            await self._engine.screenshot("gig_creation_error", page=page)
             return None
 
     # ------------------------------------------------------------------
@@ -134,7 +506,9 @@ class GigManager:
     # ------------------------------------------------------------------
 
     async def create_all_gigs(
-        self, templates_path: str = "config/gig_templates.yaml"
+        self,
+        templates_path: str = "config/gig_templates.yaml",
+        concurrency: int = 1,
     ) -> list[str]:
         """Load all templates from a YAML file and create each gig.
 
@@ -142,51 +516,99 @@ class GigManager:
         ----------
         templates_path:
             Path to the YAML file containing gig templates.
+        concurrency:
+            Number of gigs to work on at once.  Each extra worker drives
+            its own page in the shared (logged-in) browser context; ``1``
+            keeps the original one-at-a-time behaviour on the main page.
 
         Returns
         -------
         list[str]
-            Fiverr gig IDs for successfully created gigs.
+            Fiverr gig IDs for successfully created gigs, in template order.
         """
         path = Path(templates_path)
         if not path.is_file():
             log.error("templates_file_not_found", path=str(path))
             return []
 
-        with open(path, encoding="utf-8") as fh:
-            raw: dict[str, Any] = yaml.safe_load(fh) or {}
+        raw = _load_templates(path)
 
         # Support both top-level ``gigs:`` wrapper and flat layout
         gig_templates = raw.get("gigs", raw)
-        if not isinstance(gig_templates, dict):
+        if not isinstance(gig_templates, Mapping):
             log.error("invalid_templates_structure", path=str(path))
             return []
 
-        created_ids: list[str] = []
-
-        for gig_key, template in gig_templates.items():
-            if not isinstance(template, dict):
+        queue: asyncio.Queue[tuple[int, str, Mapping[str, Any]]] = asyncio.Queue()
+        for idx, (gig_key, template) in enumerate(gig_templates.items()):
+            if not isinstance(template, Mapping):
                 log.warning("skipping_non_dict_template", key=gig_key)
                 continue
+            queue.put_nowait((idx, gig_key, template))
 
-            log.info("creating_gig_from_template", key=gig_key)
-            gig_id = await self.create_gig(template)
+        # Template index -> (template, gig ID); persisted in one batch below.
+        results: dict[int, tuple[Mapping[str, Any], str]] = {}
+        workers = max(1, min(concurrency, queue.qsize()))
 
-            if gig_id is not None:
-                created_ids.append(gig_id)
+        try:
+            if workers == 1:
+                await self._creation_worker(queue, results, page=None, index=0)
             else:
-                log.warning("gig_creation_skipped", key=gig_key)
-
-            # Pause between gig creations to avoid rate-limiting
-            await asyncio.sleep(human_delay(3.0, 6.0))
-
+                pages = [await self._engine.new_worker_page() for _ in range(workers)]
+                try:
+                    await asyncio.gather(
+                        *(
+                            self._creation_worker(queue, results, page=page, index=i)
+                            for i, page in enumerate(pages)
+                        )
+                    )
+                finally:
+                    for page in pages:
+                        await page.close()
+        finally:
+            # Record whatever was published, even if the batch was cut short.
+            created = [results[idx] for idx in sorted(results)]
+            await self._save_gigs_to_db(created)
+
+        created_ids = [gig_id for _, gig_id in created]
         log.info(
             "batch_gig_creation_complete",
             total=len(gig_templates),
             created=len(created_ids),
+            workers=workers,
         )
         return created_ids
 
+    async def _creation_worker(
+        self,
+        queue: asyncio.Queue[tuple[int, str, Mapping[str, Any]]],
+        results: dict[int, tuple[Mapping[str, Any], str]],
+        page: PwPage | None,
+        index: int,
+    ) -> None:
+        """Create gigs from *queue* on *page* until the queue is empty."""
+        # Stagger concurrent workers so they don't move through the
+        # wizard in lockstep.
+        if index:
+            await asyncio.sleep(human_delay(1.0, 3.0) * index)
+
+        while True:
+            try:
+                idx, gig_key, template = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            log.info("creating_gig_from_template", key=gig_key, worker=index)
+            gig_id = await self.create_gig(template, page=page, persist=False)
+
+            if gig_id is not None:
+                results[idx] = (template, gig_id)
+            else:
+                log.warning("gig_creation_skipped", key=gig_key)
+
+            # Pause between gig creations to avoid rate-limiting
+            await asyncio.sleep(human_delay(3.0, 6.0))
+
     # ------------------------------------------------------------------
     # Gig listing
     # ------------------------------------------------------------------
@@ -204,108 +626,121 @@ class GigManager:
         await self._navigator.wait_for_page_ready()
 
         page = await self._engine.get_page()
-        gigs: list[dict[str, str]] = []
 
-        # Try multiple selectors for gig cards
-        gig_card_selectors = [
-            ".gig-card",
-            ".gig-row",
-            "[data-testid='gig-item']",
-            ".manage-gig-item",
-            "tr.gig-item",
-            ".gig-listing",
-        ]
+        try:
+            gigs: list[dict[str, str]] = await page.evaluate(
+                _EXTRACT_GIGS_JS,
+                {
+                    "cards": _GIG_CARD_SELECTORS,
+                    "title": _GIG_TITLE_SELECTORS,
+                    "status": _GIG_STATUS_SELECTORS,
+                    "stats": _GIG_STAT_SELECTORS,
+                    "statCells": _GIG_STAT_CELL_SELECTOR,
+                    "statKeys": _GIG_STAT_KEYS,
+                },
+            )
+            log.info("gigs_listed", count=len(gigs))
+            return gigs
+        except Exception:
+            log.warning("gig_batch_extract_failed", exc_info=True)
 
         elements: list = []
-        for selector in gig_card_selectors:
+        # Try multiple selectors for gig cards
+        for selector in _GIG_CARD_SELECTORS:
             elements = await page.query_selector_all(selector)
             if elements:
                 break
 
-        for el in elements:
-            try:
-                gig: dict[str, str] = {
-                    "title": "",
-                    "status": "",
-                    "url": "",
-                    "impressions": "0",
-                    "clicks": "0",
-                    "orders": "0",
-                }
-
-                # Title
-                for sel in ("h3", ".gig-title", "a.title", "h4",
-                            "[data-testid='gig-title']"):
-                    title_el = await el.query_selector(sel)
-                    if title_el is not None:
-                        text = await title_el.text_content()
-                        if text and text.strip():
-                            gig["title"] = text.strip()
-                            break
-
-                # URL
-                link_el = await el.query_selector("a[href*='/gigs/']")
-                if link_el is None:
-                    link_el = await el.query_selector("a[href]")
-                if link_el is not None:
-                    href = await link_el.get_attribute("href") or ""
-                    if href:
-                        if href.startswith("/"):
-                            href = f"https://www.fiverr.com{href}"
-                        gig["url"] = href
-
-                # Status
-                for sel in (".gig-status", ".status-badge", "span[class*='status']",
-                            "[data-testid='gig-status']"):
-                    status_el = await el.query_selector(sel)
-                    if status_el is not None:
-                        text = await status_el.text_content()
-                        if text and text.strip():
-                            gig["status"] = text.strip().lower()
-                            break
-
-                # Analytics: impressions, clicks, orders
-                stat_selectors = [
-                    (".impressions", "impressions"),
-                    (".clicks", "clicks"),
-                    (".orders-count", "orders"),
-                ]
-                for sel, key in stat_selectors:
-                    stat_el = await el.query_selector(sel)
-                    if stat_el is not None:
-                        text = await stat_el.text_content()
-                        if text:
-                            digits = "".join(
-                                ch for ch in text.strip() if ch.isdigit()
-                            )
-                            if digits:
-                                gig[key] = digits
-
-                # Fallback: try generic stat columns
-                stat_cells = await el.query_selector_all(
-                    "td.stat, .analytics-cell, .stat-value"
-                )
-                stat_keys = ["impressions", "clicks", "orders"]
-                for idx, cell in enumerate(stat_cells):
-                    if idx >= len(stat_keys):
+        # Cards are independent; parse them concurrently so the element
+        # lookups pipeline over the connection instead of running serially.
+        limit = asyncio.Semaphore(_CARD_PARSE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._parse_card(el, limit) for el in elements),
+            return_exceptions=True,
+        )
+
+        gigs = []
+        for result in results:
+            if isinstance(result, BaseException):
+                log.warning("gig_parse_error", exc_info=result)
+            elif result is not None:
+                gigs.append(result)
+
+        log.info("gigs_listed", count=len(gigs))
+        return gigs
+
+    async def get_my_gigs_columnar(self) -> dict[str, list[Any]]:
+        """Scrape the gig management page, returning one list per field.
+
+        See ``gig_columns`` for the layout.
+        """
+        return gig_columns(await self.get_my_gigs())
+
+    @staticmethod
+    async def _parse_card(
+        el: Any, limit: asyncio.Semaphore
+    ) -> dict[str, str] | None:
+        """Read one gig card element; ``None`` if it has no title."""
+        async with limit:
+            gig: dict[str, str] = {
+                "title": "",
+                "status": "",
+                "url": "",
+                "impressions": "0",
+                "clicks": "0",
+                "orders": "0",
+            }
+
+            # Title
+            for sel in _GIG_TITLE_SELECTORS:
+                title_el = await el.query_selector(sel)
+                if title_el is not None:
+                    text = await title_el.text_content()
+                    if text and text.strip():
+                        gig["title"] = text.strip()
+                        break
+
+            # URL
+            link_el = await el.query_selector("a[href*='/gigs/']")
+            if link_el is None:
+                link_el = await el.query_selector("a[href]")
+            if link_el is not None:
+                href = await link_el.get_attribute("href") or ""
+                if href:
+                    href = urljoin(_BASE_URL, href)
+                    gig["url"] = href
+
+            # Status
+            for sel in _GIG_STATUS_SELECTORS:
+                status_el = await el.query_selector(sel)
+                if status_el is not None:
+                    text = await status_el.text_content()
+                    if text and text.strip():
+                        gig["status"] = text.strip().lower()
                         break
-                    text = await cell.text_content()
+
+            # Analytics: impressions, clicks, orders
+            for sel, key in _GIG_STAT_SELECTORS:
+                stat_el = await el.query_selector(sel)
+                if stat_el is not None:
+                    text = await stat_el.text_content()
                     if text:
-                        digits = "".join(
-                            ch for ch in text.strip() if ch.isdigit()
-                        )
+                        digits = _NON_DIGITS_RE.sub("", text)
                         if digits:
-                            gig[stat_keys[idx]] = digits
-
-                if gig["title"]:
-                    gigs.append(gig)
+                            gig[key] = digits
 
-            except Exception:
-                log.warning("gig_parse_error", exc_info=True)
-                continue
+            # Fallback: try generic stat columns
+            stat_cells = await el.query_selector_all(_GIG_STAT_CELL_SELECTOR)
+            for idx, cell in enumerate(stat_cells):
+                if idx >= len(_GIG_STAT_KEYS):
+                    break
+                text = await cell.text_content()
+                if text:
+                    digits = _NON_DIGITS_RE.sub("", text)
+                    if digits:
+                        gig[_GIG_STAT_KEYS[idx]] = digits
 
-        log.info("gigs_listed", count=len(gigs))
-        return gigs
+            return gig if gig["title"] else None
 
     # ------------------------------------------------------------------
     # Status toggling
@@ -321,426 +756,486 @@ class GigManager:
         active:
             ``True`` to activate, ``False`` to pause/deactivate.
         """
+        if await self._toggle_gig_status(gig_id, active):
+            await self._db.execute(
+                _UPDATE_GIG_STATUS_SQL, (_gig_status(active), gig_id)
+            )
+
+    async def update_gig_status_bulk(
+        self, updates: list[tuple[str, bool]], concurrency: int = 4
+    ) -> list[str]:
+        """Activate or deactivate several gigs at once.
+
+        Each toggle runs on its own page, at most *concurrency* at a time,
+        and the database is updated with one ``executemany`` at the end.
+
+        Parameters
+        ----------
+        updates:
+            ``(gig_id, active)`` pairs, as for ``update_gig_status``.
+        concurrency:
+            Maximum number of gig pages open at once.
+
+        Returns
+        -------
+        list[str]
+            IDs of the gigs whose status was changed.
+        """
+        limit = asyncio.Semaphore(concurrency)
+        results = await asyncio.gather(
+            *(
+                self._toggle_on_new_page(gig_id, active, limit)
+                for gig_id, active in updates
+            ),
+            return_exceptions=True,
+        )
+
+        rows: list[tuple[str, str]] = []
+        for (gig_id, active), ok in zip(updates, results, strict=True):
+            if isinstance(ok, BaseException):
+                log.error("gig_status_update_failed", gig_id=gig_id, exc_info=ok)
+            elif ok:
+                rows.append((_gig_status(active), gig_id))
+
+        if rows:
+            await self._db.executemany(_UPDATE_GIG_STATUS_SQL, rows)
+        log.info("gig_statuses_updated", requested=len(updates), updated=len(rows))
+        return [gig_id for _, gig_id in rows]
+
+    async def _toggle_on_new_page(
+        self, gig_id: str, active: bool, limit: asyncio.Semaphore
+    ) -> bool:
+        """Run ``_toggle_gig_status`` on a fresh page under *limit*."""
+        async with limit:
+            page = await self._engine.new_worker_page()
+            try:
+                return await self._toggle_gig_status(gig_id, active, page)
+            finally:
+                await page.close()
+
+    async def _toggle_gig_status(
+        self, gig_id: str, active: bool, page: PwPage | None = None
+    ) -> bool:
+        """Click a gig's activate/pause control; ``True`` if it was found.
+
+        *page* defaults to the engine's current page.  The database is
+        left to the caller.
+        """
+        if page is None:
+            page = await self._engine.get_page()
+
         url = f"https://www.fiverr.com/manage_gigs/{gig_id}"
-        await self._engine.navigate(url)
-        await self._navigator.wait_for_page_ready()
+        await self._engine.navigate(url, page=page)
+        await self._navigator.wait_for_page_ready(page)
 
-        page = await self._engine.get_page()
         target_action = "activate" if active else "pause"
 
         # Look for a toggle or status-change button
-        toggle_selectors = [
-            f"button:has-text('{target_action.capitalize()}')",
-            f"a:has-text('{target_action.capitalize()}')",
-            ".gig-status-toggle",
-            "[data-testid='gig-toggle']",
-            f"button[data-action='{target_action}']",
-        ]
-
-        for selector in toggle_selectors:
+        selector = await self._first_present(
+            page, _TOGGLE_SELECTORS[target_action], timeout=4_000
+        )
+        if selector is not None:
             try:
-                el = await page.wait_for_selector(selector, timeout=4_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.3, 0.8))
-                    await human_click(page, selector)
-                    await asyncio.sleep(between_actions())
+                await asyncio.sleep(human_delay(0.3, 0.8))
+                await human_click(page, selector)
+                await asyncio.sleep(between_actions())
 
-                    # Handle confirmation dialog
-                    confirm_selectors = [
-                        "button:has-text('Confirm')",
-                        "button:has-text('Yes')",
-                        "button:has-text('OK')",
-                    ]
-                    for confirm_sel in confirm_selectors:
-                        try:
-                            confirm_el = await page.wait_for_selector(
-                                confirm_sel, timeout=2_000
-                            )
-                            if confirm_el is not None:
-                                await confirm_el.click()
-                                await asyncio.sleep(between_actions())
-                                break
-                        except Exception:
-                            continue
-
-                    log.info(
-                        "gig_status_updated",
-                        gig_id=gig_id,
-                        active=active,
-                    )
+                # Handle confirmation dialog
+                confirm = page.get_by_role("button", name=_CONFIRM_BUTTON_NAME)
+                try:
+                    await confirm.first.click(timeout=2_000)
+                    await asyncio.sleep(between_actions())
+                except PlaywrightTimeoutError:
+                    pass
 
-                    # Update in DB
-                    status = "active" if active else "paused"
-                    await self._db.execute(
-                        "UPDATE gigs SET status = ? WHERE fiverr_gig_id = ?",
-                        (status, gig_id),
-                    )
-                    return
+                log.info(
+                    "gig_status_updated",
+                    gig_id=gig_id,
+                    active=active,
+                )
+                return True
             except Exception:
-                continue
+                log.warning("gig_status_toggle_failed", gig_id=gig_id, exc_info=True)
 
         log.error(
             "gig_status_toggle_not_found",
             gig_id=gig_id,
             target=target_action,
         )
-        await self._engine.screenshot("gig_status_toggle_missing")
+        await self._engine.screenshot("gig_status_toggle_missing", page=page)
+        return False
 
     # ------------------------------------------------------------------
     # Internal: wizard step helpers
     # ------------------------------------------------------------------
 
-    async def _fill_title(self, page: object, title: str) -> None:
+    async def _fill_title(self, page: PwPage, title: str) -> None:
         """Fill in the gig title input."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
-        selector = await self._selectors.find(
-            pw_page, "gig_creation", "title_input"
+        selector = await self._selectors.find_cached(
+            page, "gig_creation", "title_input"
         )
         if selector is None:
             log.warning("gig_title_input_not_found_using_fallback")
             selector = "input[name='title'], input#title, input[placeholder*='title']"
 
-        await self._engine.type_text(selector, title)
+        await self._engine.type_text(selector, title, page=page)
         await asyncio.sleep(between_actions())
         log.debug("gig_title_filled", title=title[:60])
 
     async def _select_category(
-        self, page: object, category: str, subcategory: str
+        self, page: PwPage, category: str, subcategory: str
     ) -> None:
         """Select the category and subcategory dropdowns."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
         # -- Category -------------------------------------------------------
         if category:
-            cat_selector = await self._selectors.find(
-                pw_page, "gig_creation", "category_select"
+            cat_selector = await self._selectors.find_cached(
+                page, "gig_creation", "category_select"
             )
             if cat_selector is not None:
-                await self._select_option_by_text(pw_page, cat_selector, category)
+                await self._select_option_by_text(page, cat_selector, category)
                 await asyncio.sleep(human_delay(1.0, 2.0))
             else:
                 log.warning("category_selector_not_found")
 
         # -- Subcategory ----------------------------------------------------
         if subcategory:
-            subcat_selector = await self._selectors.find(
-                pw_page, "gig_creation", "subcategory_select"
+            subcat_selector = await self._selectors.find_cached(
+                page, "gig_creation", "subcategory_select"
             )
             if subcat_selector is not None:
                 await self._select_option_by_text(
-                    pw_page, subcat_selector, subcategory
+                    page, subcat_selector, subcategory, scope=category
                 )
                 await asyncio.sleep(between_actions())
             else:
                 log.warning("subcategory_selector_not_found")
 
-    async def _add_tags(self, page: object, tags: list[str]) -> None:
+    async def _add_tags(self, page: PwPage, tags: Sequence[str]) -> None:
         """Add tags to the gig."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
         if not tags:
             return
 
-        tag_selector = await self._selectors.find(
-            pw_page, "gig_creation", "tags_input"
+        tag_selector = await self._selectors.find_cached(
+            page, "gig_creation", "tags_input"
         )
         if tag_selector is None:
             log.warning("tags_input_not_found")
             return
 
+        # Tags are short, so each one is typed with a single
+        # press_sequentially call (one key delay per tag) instead of
+        # type_text's per-character round-trips.
+        tag_input = page.locator(tag_selector).first
         for tag in tags:
             try:
-                await self._engine.type_text(tag_selector, tag, clear_first=True)
+                await tag_input.fill("")
+                await tag_input.press_sequentially(
+                    tag, delay=int(typing_delay() * 1000)
+                )
                 await asyncio.sleep(human_delay(0.3, 0.8))
                 # Press Enter or comma to confirm the tag
-                await pw_page.keyboard.press("Enter")
+                await page.keyboard.press("Enter")
                 await asyncio.sleep(human_delay(0.3, 0.6))
                 log.debug("tag_added", tag=tag)
             except Exception:
                 log.warning("tag_add_failed", tag=tag, exc_info=True)
 
     async def _fill_packages(
-        self, page: object, packages: dict[str, Any]
+        self, page: PwPage, packages: Mapping[str, Any]
     ) -> None:
         """Fill in package/pricing information.
 
         The ``packages`` dict has keys ``basic``, ``standard``, ``premium``,
         each containing ``name``, ``price``, ``description``,
         ``delivery_days``, etc.
-        """
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
 
+        With ``fast_fill`` every field is first set in one ``evaluate``;
+        whatever that could not place is then filled the normal way.
+        """
         if not packages:
             return
 
         # Fiverr's pricing page typically has columns for each tier.
         # We try both column-index-based and name-based approaches.
-        tier_order = ["basic", "standard", "premium"]
+        specs = {
+            tier_key: self._package_field_specs(
+                tier_key, idx + 1, packages.get(tier_key)
+            )
+            for idx, tier_key in enumerate(_PACKAGE_TIERS)
+            if packages.get(tier_key) is not None
+        }
+
+        prefilled: set[str] = set()
+        if self._fast_fill:
+            prefilled = await self._prefill_packages(page, specs)
+
+        for tier_key, fields in specs.items():
+            for field, (value, candidates) in fields.items():
+                if f"{tier_key}.{field}" in prefilled:
+                    continue
+                sel = await self._first_present(page, candidates)
+                if sel is None:
+                    continue
+                if field in ("delivery_days", "revisions"):
+                    await self._select_package_field(page, sel, value, tier_key, field)
+                else:
+                    await self._type_package_field(page, sel, value, tier_key, field)
 
-        for idx, tier_key in enumerate(tier_order):
-            tier_data = packages.get(tier_key)
-            if tier_data is None:
-                continue
+            await asyncio.sleep(human_delay(0.5, 1.0))
+            log.debug("package_filled", tier=tier_key)
 
-            column_idx = idx + 1  # 1-indexed columns
-
-            # -- Package name -----------------------------------------------
-            name = tier_data.get("name", "")
-            if name:
-                name_selectors = [
-                    f".package-col:nth-child({column_idx}) input[name*='name']",
-                    f"input[name*='{tier_key}'][name*='name']",
-                    f".tier-{tier_key} input.package-name",
-                    f"[data-tier='{tier_key}'] input.name",
-                ]
-                for sel in name_selectors:
-                    try:
-                        el = await pw_page.wait_for_selector(sel, timeout=2_000)
-                        if el is not None:
-                            await self._engine.type_text(sel, name)
-                            break
-                    except Exception:
-                        continue
-
-            # -- Package description ----------------------------------------
-            desc = tier_data.get("description", "")
-            if desc:
-                desc_selectors = [
-                    f".package-col:nth-child({column_idx}) textarea",
-                    f"textarea[name*='{tier_key}'][name*='desc']",
-                    f".tier-{tier_key} textarea",
-                ]
-                for sel in desc_selectors:
-                    try:
-                        el = await pw_page.wait_for_selector(sel, timeout=2_000)
-                        if el is not None:
-                            await self._engine.type_text(sel, desc)
-                            break
-                    except Exception:
-                        continue
-
-            # -- Price ------------------------------------------------------
-            price = str(tier_data.get("price", ""))
-            if price:
-                price_selectors = [
-                    f".package-col:nth-child({column_idx}) input[name*='price']",
-                    f"input[name*='{tier_key}'][name*='price']",
-                    f".tier-{tier_key} input.price",
-                ]
-
-                # Also try the YAML-configured price input
-                try:
-                    yaml_sel = self._selectors.get("gig_creation", "price_input")
-                    price_selectors.insert(0, yaml_sel)
-                except KeyError:
-                    pass
+    def _package_field_specs(
+        self, tier_key: str, column_idx: int, tier_data: Mapping[str, Any]
+    ) -> dict[str, tuple[str, tuple[str, ...]]]:
+        """Map each field set in *tier_data* to ``(value, candidate selectors)``.
 
-                for sel in price_selectors:
-                    try:
-                        el = await pw_page.wait_for_selector(sel, timeout=2_000)
-                        if el is not None:
-                            await self._engine.type_text(sel, price)
-                            break
-                    except Exception:
-                        continue
+        Candidates are in priority order; YAML-configured inputs come
+        first.  ``revisions`` values are option labels ("Unlimited" for
+        ``-1``); ``delivery_days`` values are option values.
+        """
+        col = f".package-col:nth-child({column_idx})"
+        tier = f".tier-{tier_key}"
+        specs: dict[str, tuple[str, tuple[str, ...]]] = {}
+
+        name = tier_data.get("name", "")
+        if name:
+            specs["name"] = (name, (
+                f"{col} input[name*='name']",
+                f"input[name*='{tier_key}'][name*='name']",
+                f"{tier} input.package-name",
+                f"[data-tier='{tier_key}'] input.name",
+            ))
+
+        desc = tier_data.get("description", "")
+        if desc:
+            specs["description"] = (desc, (
+                f"{col} textarea",
+                f"textarea[name*='{tier_key}'][name*='desc']",
+                f"{tier} textarea",
+            ))
+
+        price = str(tier_data.get("price", ""))
+        if price:
+            specs["price"] = (price, (
+                *self._yaml_selector("price_input"),
+                f"{col} input[name*='price']",
+                f"input[name*='{tier_key}'][name*='price']",
+                f"{tier} input.price",
+            ))
+
+        days = str(tier_data.get("delivery_days", ""))
+        if days:
+            specs["delivery_days"] = (days, (
+                *self._yaml_selector("delivery_days"),
+                f"{col} select[name*='delivery']",
+                f"select[name*='{tier_key}'][name*='delivery']",
+                f"{tier} select.delivery-time",
+            ))
+
+        revisions = tier_data.get("revisions")
+        if revisions is not None:
+            rev_str = "Unlimited" if revisions == -1 else str(revisions)
+            specs["revisions"] = (rev_str, (
+                f"{col} select[name*='revision']",
+                f"select[name*='{tier_key}'][name*='revision']",
+                f"{tier} select.revisions",
+            ))
+
+        return specs
+
+    async def _prefill_packages(
+        self,
+        page: PwPage,
+        specs: Mapping[str, Mapping[str, tuple[str, tuple[str, ...]]]],
+    ) -> set[str]:
+        """Set every package field in one ``evaluate``.
 
-            # -- Delivery days ----------------------------------------------
-            days = str(tier_data.get("delivery_days", ""))
-            if days:
-                days_selectors = [
-                    f".package-col:nth-child({column_idx}) select[name*='delivery']",
-                    f"select[name*='{tier_key}'][name*='delivery']",
-                    f".tier-{tier_key} select.delivery-time",
-                ]
+        Returns the ``"tier.field"`` keys that were set; an empty set if the
+        script fails, so everything falls back to typing.
+        """
+        payload = {
+            tier_key: {
+                field: {"value": value, "selectors": list(candidates)}
+                for field, (value, candidates) in fields.items()
+            }
+            for tier_key, fields in specs.items()
+        }
+        try:
+            filled: list[str] = await page.evaluate(_PREFILL_PACKAGES_JS, payload)
+        except Exception:
+            log.debug("package_prefill_failed", exc_info=True)
+            return set()
+        log.debug("packages_prefilled", fields=filled)
+        return set(filled)
 
-                try:
-                    yaml_sel = self._selectors.get(
-                        "gig_creation", "delivery_days"
-                    )
-                    days_selectors.insert(0, yaml_sel)
-                except KeyError:
-                    pass
+    async def _select_package_field(
+        self, page: PwPage, selector: str, value: str, tier: str, field: str
+    ) -> None:
+        """Choose *value* in a package dropdown, logging rather than raising.
 
-                for sel in days_selectors:
-                    try:
-                        el = await pw_page.wait_for_selector(sel, timeout=2_000)
-                        if el is not None:
-                            tag = await el.evaluate(
-                                "el => el.tagName.toLowerCase()"
-                            )
-                            if tag == "select":
-                                await el.select_option(value=days)
-                            else:
-                                await self._engine.type_text(sel, days)
-                            break
-                    except Exception:
-                        continue
-
-            # -- Revisions --------------------------------------------------
-            revisions = tier_data.get("revisions")
-            if revisions is not None:
-                rev_str = "Unlimited" if revisions == -1 else str(revisions)
-                rev_selectors = [
-                    f".package-col:nth-child({column_idx}) select[name*='revision']",
-                    f"select[name*='{tier_key}'][name*='revision']",
-                    f".tier-{tier_key} select.revisions",
-                ]
-                for sel in rev_selectors:
-                    try:
-                        el = await pw_page.wait_for_selector(sel, timeout=2_000)
-                        if el is not None:
-                            await el.select_option(label=rev_str)
-                            break
-                    except Exception:
-                        continue
+        ``revisions`` are matched by label, ``delivery_days`` by option value;
+        a delivery-days input that isn't a ``<select>`` is typed into.
+        """
+        loc = page.locator(selector).first
+        try:
+            if field == "revisions":
+                await loc.select_option(label=value)
+                return
+            tag = await loc.evaluate("el => el.tagName.toLowerCase()")
+            if tag == "select":
+                await loc.select_option(value=value)
+            else:
+                await self._engine.type_text(selector, value, page=page)
+        except Exception:
+            log.warning("package_field_failed", tier=tier, field=field, exc_info=True)
+
+    async def _first_present(
+        self, page: PwPage, candidates: tuple[str, ...], timeout: int = 2_000
+    ) -> str | None:
+        """Return the highest-priority candidate visible on *page*.
+
+        All candidates share a single *timeout*: the union selector is
+        awaited once until one of its matches is visible, then the earliest
+        candidate in *candidates* (not in document order) with a visible
+        match is picked.  Plain CSS candidates are checked together in one
+        in-page lookup; others (``:has-text`` and friends) are counted
+        through Playwright, in order, only if needed.  Hidden matches never
+        count, so a hidden button cannot shadow a visible fallback.
+        """
+        try:
+            await page.locator(", ".join(candidates)).filter(visible=True).first.wait_for(
+                state="visible", timeout=timeout
+            )
+            matches = await page.evaluate(_MATCHES_JS, list(candidates))
+            for candidate, matched in zip(candidates, matches, strict=True):
+                if matched is None:
+                    matched = await page.locator(candidate).filter(visible=True).count() > 0
+                if matched:
+                    return candidate
+        except Exception:
+            pass
+        return None
 
-            await asyncio.sleep(human_delay(0.5, 1.0))
-            log.debug("package_filled", tier=tier_key)
+    async def _type_package_field(
+        self, page: PwPage, selector: str, value: str, tier: str, field: str
+    ) -> None:
+        """Type *value* into a package input, logging rather than raising."""
+        try:
+            await self._engine.type_text(selector, value, page=page)
+        except Exception:
+            log.warning("package_field_failed", tier=tier, field=field, exc_info=True)
 
-    async def _fill_description(self, page: object, description: str) -> None:
+    async def _fill_description(self, page: PwPage, description: str) -> None:
         """Fill in the gig description."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
         if not description:
             return
 
-        desc_selector = await self._selectors.find(
-            pw_page, "gig_creation", "description_editor"
+        desc_selector = await self._selectors.find_cached(
+            page, "gig_creation", "description_editor"
         )
 
         if desc_selector is not None:
             try:
                 # Some editors use contenteditable divs instead of textareas
-                el = await pw_page.wait_for_selector(desc_selector, timeout=5_000)
+                el = await page.wait_for_selector(desc_selector, timeout=5_000)
                 if el is not None:
                     tag = await el.evaluate("el => el.tagName.toLowerCase()")
                     is_editable = await el.get_attribute("contenteditable")
 
                     if tag == "textarea":
-                        await self._engine.type_text(desc_selector, description)
+                        await self._engine.type_text(
+                            desc_selector, description, page=page
+                        )
                     elif is_editable == "true":
                         await el.click()
                         await asyncio.sleep(human_delay(0.3, 0.6))
-                        await pw_page.keyboard.type(description, delay=30)
+                        await page.keyboard.type(description, delay=30)
                     else:
-                        await self._engine.type_text(desc_selector, description)
+                        await self._engine.type_text(
+                            desc_selector, description, page=page
+                        )
 
                     log.debug("description_filled", length=len(description))
                     return
             except Exception:
                 log.warning("description_fill_primary_failed", exc_info=True)
+                self._selectors.forget("gig_creation", "description_editor")
 
         # Fallback: try generic description inputs
-        fallbacks = [
-            "textarea[name='description']",
-            ".ql-editor",
-            "[contenteditable='true']",
-            "textarea.description",
-        ]
-        for sel in fallbacks:
-            try:
-                el = await pw_page.wait_for_selector(sel, timeout=3_000)
-                if el is not None:
-                    is_editable = await el.get_attribute("contenteditable")
-                    if is_editable == "true":
-                        await el.click()
-                        await asyncio.sleep(human_delay(0.3, 0.6))
-                        await pw_page.keyboard.type(description, delay=30)
-                    else:
-                        await self._engine.type_text(sel, description)
-                    log.debug("description_filled_fallback", selector=sel)
-                    return
-            except Exception:
-                continue
+        sel = await self._first_present(
+            page, _DESCRIPTION_FALLBACK_SELECTORS, timeout=3_000
+        )
+        if sel is None:
+            log.warning("description_input_not_found")
+            return
 
-        log.warning("description_input_not_found")
+        try:
+            el = page.locator(sel).first
+            is_editable = await el.get_attribute("contenteditable")
+            if is_editable == "true":
+                await el.click()
+                await asyncio.sleep(human_delay(0.3, 0.6))
+                await page.keyboard.type(description, delay=30)
+            else:
+                await self._engine.type_text(sel, description, page=page)
+            log.debug("description_filled_fallback", selector=sel)
+        except Exception:
+            log.warning("description_fill_fallback_failed", selector=sel, exc_info=True)
 
-    async def _click_save_and_continue(self, page: object) -> None:
+    async def _click_save_and_continue(self, page: PwPage) -> None:
         """Click the save/continue button between wizard steps."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
-        save_selectors = [
-            "button:has-text('Save & Continue')",
-            "button:has-text('Save and Continue')",
-            "button:has-text('Continue')",
-            "button:has-text('Next')",
-            "[data-testid='save-continue']",
-        ]
-
         # Also try the YAML-configured save button
-        try:
-            yaml_save = self._selectors.get("gig_creation", "save_button")
-            save_selectors.insert(0, yaml_save)
-        except KeyError:
-            pass
+        save_selectors = (
+            *self._yaml_selector("save_button"),
+            *_SAVE_SELECTORS,
+        )
 
-        for selector in save_selectors:
-            try:
-                el = await pw_page.wait_for_selector(selector, timeout=5_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.5, 1.0))
-                    await human_click(pw_page, selector)
-                    await asyncio.sleep(page_load_wait())
-                    log.debug("save_and_continue_clicked")
-                    return
-            except Exception:
-                continue
+        selector = await self._first_present(page, save_selectors, timeout=5_000)
+        if selector is None:
+            log.warning("save_continue_button_not_found")
+            return
 
-        log.warning("save_continue_button_not_found")
+        try:
+            await asyncio.sleep(human_delay(0.5, 1.0))
+            await human_click(page, selector)
+            await asyncio.sleep(page_load_wait())
+            log.debug("save_and_continue_clicked")
+        except Exception:
+            log.warning("save_continue_click_failed", selector=selector, exc_info=True)
 
-    async def _publish_gig(self, page: object) -> str | None:
+    async def _publish_gig(self, page: PwPage) -> str | None:
         """Click publish and extract the new gig ID.
 
         Returns the Fiverr gig ID or ``None``.
         """
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
-        publish_selectors = [
-            "button:has-text('Publish')",
-            "button:has-text('Publish Gig')",
-            "[data-testid='publish-gig']",
-        ]
+        publish_selectors = (
+            *self._yaml_selector("publish_button"),
+            *_PUBLISH_SELECTORS,
+        )
+        publish = page.get_by_role("button", name=_PUBLISH_BUTTON_NAME).or_(
+            page.locator(", ".join(publish_selectors))
+        )
 
         try:
-            yaml_pub = self._selectors.get("gig_creation", "publish_button")
-            publish_selectors.insert(0, yaml_pub)
-        except KeyError:
-            pass
-
-        for selector in publish_selectors:
+            await publish.first.wait_for(state="attached", timeout=5_000)
+        except PlaywrightTimeoutError:
+            log.warning("publish_button_not_found")
+        else:
             try:
-                el = await pw_page.wait_for_selector(selector, timeout=5_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.5, 1.5))
-                    await human_click(pw_page, selector)
-                    await asyncio.sleep(page_load_wait())
-                    break
+                await asyncio.sleep(human_delay(0.5, 1.5))
+                await human_click(page, publish)
+                await asyncio.sleep(page_load_wait())
             except Exception:
-                continue
+                log.warning("publish_click_failed", exc_info=True)
 
         # Extract gig ID from the resulting URL
         await asyncio.sleep(human_delay(2.0, 4.0))
-        current_url = pw_page.url
+        current_url = page.url
         gig_id = self._extract_gig_id_from_url(current_url)
 
         if gig_id is None:
             # Try to find the gig ID on the confirmation page
-            gig_id = await self._extract_gig_id_from_page(pw_page)
+            gig_id = await self._extract_gig_id_from_page(page)
 
         return gig_id
 
@@ -748,42 +1243,47 @@ class GigManager:
     # Internal: utility
     # ------------------------------------------------------------------
 
+    def _yaml_selector(self, element: str) -> tuple[str, ...]:
+        """Return the YAML ``gig_creation`` selector for *element* as a 0/1-tuple."""
+        selector = self._gig_creation_sels[element]
+        return (selector,) if selector else ()
+
     async def _select_option_by_text(
-        self, page: object, selector: str, text: str
+        self, page: PwPage, selector: str, text: str, scope: str = ""
     ) -> None:
-        """Select a ``<select>`` option whose label contains *text*."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
+        """Select a ``<select>`` option whose label matches *text*.
 
+        An exact (case-insensitive) label match wins over a partial one.
+        The dropdown's options are read in one call and cached per
+        (*selector*, *scope*); pass the parent choice as *scope* when the
+        options depend on it (e.g. subcategories of a category).
+        """
+        key = (selector, scope)
         try:
-            el = await pw_page.wait_for_selector(selector, timeout=5_000)
+            el = await page.wait_for_selector(selector, timeout=5_000)
             if el is None:
                 return
 
-            # Try exact label match first, then partial
-            try:
-                await el.select_option(label=text)
+            options = self._option_cache.get(key)
+            value = self._match_option(options, text) if options else None
+            if value is None:
+                # Cache miss, or the cached list is stale: read it again.
+                options = await el.evaluate(_SELECT_OPTIONS_JS)
+                if options:
+                    self._option_cache[key] = options
+                value = self._match_option(options, text)
+
+            if value is None:
+                log.warning(
+                    "select_option_not_found",
+                    selector=selector,
+                    text=text,
+                )
                 return
-            except Exception:
-                pass
-
-            # Fallback: find option with partial text match
-            options = await el.query_selector_all("option")
-            for option in options:
-                label = await option.text_content()
-                if label and text.lower() in label.lower():
-                    value = await option.get_attribute("value")
-                    if value is not None:
-                        await el.select_option(value=value)
-                        return
 
-            log.warning(
-                "select_option_not_found",
-                selector=selector,
-                text=text,
-            )
+            await el.select_option(value=value)
         except Exception:
+            self._option_cache.pop(key, None)
             log.warning(
                 "select_option_failed",
                 selector=selector,
@@ -791,6 +1291,18 @@ class GigManager:
                 exc_info=True,
             )
 
+    @staticmethod
+    def _match_option(options: list[list[str]], text: str) -> str | None:
+        """Return the value of the exact, else first partial, label match."""
+        wanted = text.strip().lower()
+        partial: str | None = None
+        for label, value in options:
+            if label == wanted:
+                return value
+            if partial is None and wanted in label:
+                partial = value
+        return partial
+
     @staticmethod
     def _extract_gig_id_from_url(url: str) -> str | None:
         """Parse a gig ID from a Fiverr URL.
@@ -798,32 +1310,17 @@ class GigManager:
         Examples of URL patterns:
         - ``https://www.fiverr.com/manage_gigs/123456``
         - ``https://www.fiverr.com/gigs/123456/edit``
+        - ``https://www.fiverr.com/manage_gigs/123456#overview``
         """
-        for segment_prefix in ("/manage_gigs/", "/gigs/"):
-            if segment_prefix in url:
-                after = url.split(segment_prefix, 1)[1]
-                gig_id = after.split("/")[0].split("?")[0]
-                if gig_id and gig_id.isdigit():
-                    return gig_id
-        return None
+        match = _GIG_ID_RE.search(url)
+        return match.group(1) if match else None
 
-    async def _extract_gig_id_from_page(self, page: object) -> str | None:
+    async def _extract_gig_id_from_page(self, page: PwPage) -> str | None:
         """Try to scrape the gig ID from a confirmation / success page."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
         # Look for gig ID text or links
-        id_selectors = [
-            ".gig-id",
-            "[data-testid='gig-id']",
-            "a[href*='/gigs/']",
-            ".success-gig-link",
-        ]
-
-        for selector in id_selectors:
+        for selector in _GIG_ID_SELECTORS:
             try:
-                el = await pw_page.wait_for_selector(selector, timeout=3_000)
+                el = await page.wait_for_selector(selector, timeout=3_000)
                 if el is not None:
                     href = await el.get_attribute("href")
                     if href:
@@ -833,7 +1330,7 @@ class GigManager:
 
                     text = await el.text_content()
                     if text:
-                        digits = "".join(ch for ch in text if ch.isdigit())
+                        digits = _NON_DIGITS_RE.sub("", text)
                         if digits:
                             return digits
             except Exception:
@@ -842,26 +1339,54 @@ class GigManager:
         return None
 
     async def _save_gig_to_db(
-        self, template: dict[str, Any], gig_id: str
+        self, template: Mapping[str, Any], gig_id: str
     ) -> None:
         """Persist a newly created gig in the database."""
+        await self._save_gigs_to_db([(template, gig_id)])
+
+    async def _save_gigs_to_db(
+        self, created: list[tuple[Mapping[str, Any], str]]
+    ) -> None:
+        """Persist newly created gigs with one ``executemany``.
+
+        If the batch is rejected, the rows are retried one by one in a
+        single transaction so one bad row does not lose the others.
+        """
+        if not created:
+            return
+
         now = datetime.now(timezone.utc).isoformat()
-        title = template.get("title", "")
+        rows: list[tuple[str, str, str, str]] = []
+        for template, gig_id in created:
+            title = template.get("title", "")
+            rows.append((gig_id, self._infer_gig_type(title), title, now))
 
-        # Infer gig type from title keywords
-        gig_type = "writing"
-        lower_title = title.lower()
-        if any(kw in lower_title for kw in ("python", "script", "code", "automation")):
-            gig_type = "coding"
-        elif any(kw in lower_title for kw in ("data entry", "spreadsheet", "excel")):
-            gig_type = "data_entry"
+        try:
+            await self._db.executemany(_INSERT_GIG_SQL, rows)
+            log.debug("gigs_saved_to_db", count=len(rows))
+            return
+        except Exception:
+            log.warning("gig_db_batch_save_failed", count=len(rows), exc_info=True)
 
         try:
-            await self._db.execute(
-                "INSERT INTO gigs (fiverr_gig_id, gig_type, title, status, created_at) "
-                "VALUES (?, ?, ?, 'active', ?)",
-                (gig_id, gig_type, title, now),
-            )
-            log.debug("gig_saved_to_db", gig_id=gig_id, title=title[:60])
+            async with self._db.transaction():
+                for row in rows:
+                    try:
+                        await self._db.execute(_INSERT_GIG_SQL, row)
+                    except Exception:
+                        log.warning("gig_db_save_failed", gig_id=row[0], exc_info=True)
         except Exception:
-            log.warning("gig_db_save_failed", gig_id=gig_id, exc_info=True)
+            log.warning(
+                "gig_db_save_failed",
+                gig_ids=[gig_id for _, gig_id in created],
+                exc_info=True,
+            )
+
+    @staticmethod
+    def _infer_gig_type(title: str) -> str:
+        """Infer the gig type from keywords in its title."""
+        if _CODING_KEYWORDS_RE.search(title):
+            return "coding"
+        if _DATA_ENTRY_KEYWORDS_RE.search(title):
+            return "data_entry"
+        return "writing"
@@ -8,18 +8,213 @@ All sent messages are recorded in the local database for audit.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import re
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin
 
 from src.browser.anti_detect import simulate_reading
 from src.browser.engine import BrowserEngine
 from src.browser.selectors import SelectorStore
 from src.fiverr.navigation import Navigator
 from src.models.database import Database
-from src.utils.human_timing import between_actions, human_delay, reading_delay
+from src.utils.human_timing import (
+    between_actions,
+    human_delay,
+    reading_delay,
+    typing_delay,
+)
 from src.utils.logger import get_logger
+from src.utils.polling import wait_until
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page as PwPage
 
 log = get_logger(__name__, component="inbox")
 
+# Relative conversation links are resolved against this.
+_BASE_URL = "https://www.fiverr.com/"
+
+# ---------------------------------------------------------------------------
+# Static selector fallbacks
+# ---------------------------------------------------------------------------
+
+_USERNAME_SELECTORS: tuple[str, ...] = (
+    "h3",
+    "strong",
+    ".username",
+    ".sender-name",
+    "[data-testid='username']",
+    "a.username",
+)
+_PREVIEW_SELECTORS: tuple[str, ...] = (
+    ".message-preview",
+    ".last-message",
+    "p",
+    "span.preview",
+    ".snippet",
+)
+_USERNAME_UNION = ", ".join(_USERNAME_SELECTORS)
+_PREVIEW_UNION = ", ".join(_PREVIEW_SELECTORS)
+_UNREAD_BADGE_SELECTOR = ".unread-badge, .unread-indicator, .new-message-dot"
+
+# Upper bound on items/messages parsed concurrently on the fallback path.
+_PARSE_CONCURRENCY = 16
+
+# A word plus its trailing whitespace (or a whitespace run); the unit typed
+# per press_sequentially call.
+_TYPING_CHUNK_RE = re.compile(r"\S+\s*|\s+")
+
+# Sent messages are written in batches of up to _LOG_BATCH_MAX, waiting at
+# most _LOG_BATCH_WAIT seconds for a batch to fill.
+_LOG_BATCH_MAX = 50
+_LOG_BATCH_WAIT = 0.1
+_INSERT_SENT_MESSAGE_SQL = (
+    "INSERT INTO messages (order_id, direction, content, timestamp) "
+    "VALUES (?, 'sent', ?, ?)"
+)
+
+# Budgets (seconds) for post-click waits; they return as soon as the page
+# is ready, so these only bound the slow case.
+_THREAD_OPEN_TIMEOUT = 10.0
+_MESSAGES_TIMEOUT_MS = 15_000
+
+_MESSAGE_SELECTORS: tuple[str, ...] = (
+    ".message-item",
+    ".chat-message",
+    "[data-testid='message']",
+    ".message-row",
+    ".message-bubble",
+    ".msg-wrapper",
+)
+_MESSAGES_UNION = ", ".join(_MESSAGE_SELECTORS)
+_SENDER_SELECTORS: tuple[str, ...] = (
+    ".sender",
+    ".message-author",
+    ".username",
+    "[data-testid='message-sender']",
+)
+_MESSAGE_TEXT_FALLBACK_SELECTORS: tuple[str, ...] = ("p", ".text", ".content", "span")
+_TIMESTAMP_SELECTORS: tuple[str, ...] = (
+    ".timestamp",
+    "time",
+    ".message-time",
+    "[data-testid='message-time']",
+    ".date",
+)
+
+# Cheap fingerprint of the conversation list: item count plus a hash of
+# each item's class and text.  Any new message, preview or read-state
+# change alters it.
+_CONVERSATIONS_SIGNATURE_JS = """
+(items) => {
+    let h = 5381;
+    for (const el of items) {
+        const s = (el.getAttribute("class") || "") + "\\u0000" + el.textContent;
+        for (let i = 0; i < s.length; i++) h = ((h * 33) ^ s.charCodeAt(i)) >>> 0;
+    }
+    return items.length + ":" + h.toString(16);
+}
+"""
+
+# Extract every conversation item in one call instead of a round-trip per
+# field per item.  Mirrors _parse_conversation_item.
+_EXTRACT_CONVERSATIONS_JS = """
+(items, spec) => {
+    const text = (el) => (el && el.textContent ? el.textContent.trim() : "");
+    const firstText = (root, sels) => {
+        for (const sel of sels) {
+            const t = text(root.querySelector(sel));
+            if (t) return t;
+        }
+        return "";
+    };
+
+    return items.map((el) => {
+        const cls = (el.getAttribute("class") || "").toLowerCase();
+        const link = el.querySelector("a[href]");
+        let href = link ? (link.getAttribute("href") || "") : "";
+        if (href) {
+            try { href = new URL(href, "https://www.fiverr.com/").href; } catch (e) {}
+        }
+        return {
+            username: firstText(el, spec.username),
+            last_message_preview: firstText(el, spec.preview),
+            unread: cls.includes("unread") || cls.includes("new")
+                || el.querySelector(spec.badge) !== null,
+            conversation_url: href,
+        };
+    });
+}
+"""
+
+# Read one message container's fields in a single call.  ``sender`` is left
+# empty when no sender element exists; the caller infers it from ``cls``.
+_MESSAGE_FIELDS_JS = """
+(el, spec) => {
+    const text = (node) => (node && node.textContent ? node.textContent.trim() : "");
+    const first = (sels) => {
+        for (const sel of sels) {
+            let node = null;
+            try { node = el.querySelector(sel); } catch (e) { continue; }
+            if (node) return node;
+        }
+        return null;
+    };
+    const firstText = (sels) => {
+        for (const sel of sels) {
+            const t = text(el.querySelector(sel));
+            if (t) return t;
+        }
+        return "";
+    };
+
+    const ts = first(spec.timestamp);
+    return {
+        sender: firstText(spec.sender),
+        cls: (el.getAttribute("class") || "").toLowerCase(),
+        text: text(first(spec.text)),
+        timestamp: ts ? (ts.getAttribute("datetime") || text(ts)) : "",
+    };
+}
+"""
+
+# Extract every message bubble in one call, using _MESSAGE_FIELDS_JS on the
+# first container selector with matches.
+_EXTRACT_MESSAGES_JS = f"""
+(spec) => {{
+    const fields = {_MESSAGE_FIELDS_JS.strip()};
+
+    let containers = [];
+    for (const sel of spec.containers) {{
+        containers = document.querySelectorAll(sel);
+        if (containers.length) break;
+    }}
+    return Array.from(containers, (el) => fields(el, spec));
+}}
+"""
+
+# Fallback-path helper for ``eval_on_selector_all(union, js, candidates)``:
+# the union fetches every candidate match in one call and the script returns
+# the text of the first candidate whose first match has non-empty text, as
+# a per-selector loop would.
+_FIRST_TEXT_JS = """
+(nodes, sels) => {
+    for (const sel of sels) {
+        const node = nodes.find((n) => n.matches(sel));
+        const t = node && node.textContent ? node.textContent.trim() : "";
+        if (t) return t;
+    }
+    return "";
+}
+"""
+
+# Index of the first candidate with any match on the page, or -1.
+_FIRST_PRESENT_INDEX_JS = (
+    "(sels) => sels.findIndex((sel) => document.querySelector(sel) !== null)"
+)
+
 
 class InboxManager:
     """Read and send messages through the Fiverr inbox.
@@ -47,6 +242,16 @@ class InboxManager:
         self._selectors = selectors
         self._navigator = navigator
         self._db = db
+        # (username, content, order_id, timestamp) awaiting the writer task,
+        # which is started on first use.
+        self._log_queue: asyncio.Queue[tuple[str, str, str | None, str]] = (
+            asyncio.Queue()
+        )
+        self._log_writer: asyncio.Task[None] | None = None
+        # Last conversation list and the signature of the page it came from;
+        # cleared whenever we send, since that changes the list.
+        self._conversations_sig: str | None = None
+        self._conversations: list[dict[str, str | bool]] = []
 
     # ------------------------------------------------------------------
     # Conversation listing
@@ -61,76 +266,64 @@ class InboxManager:
             Each dict contains: ``username``, ``last_message_preview``,
             ``unread`` (bool), ``conversation_url``.
         """
-        await self._navigator.goto_inbox()
-        page = await self._engine.get_page()
-
-        conversations: list[dict[str, str | bool]] = []
+        page = await self._navigator.goto_inbox()
 
         # Locate conversation items
-        item_selector = await self._selectors.find(
-            page, "inbox", "conversation_item"
-        )
+        item_selector = await self._selectors.find_cached(page, "inbox", "conversation_item")
         if item_selector is None:
             log.warning("conversation_items_not_found")
+            return []
+
+        # If the list looks exactly as it did last time, skip the full parse.
+        try:
+            signature: str | None = await page.locator(item_selector).evaluate_all(
+                _CONVERSATIONS_SIGNATURE_JS
+            )
+        except Exception:
+            signature = None
+        if signature is not None and signature == self._conversations_sig:
+            log.info("conversations_unchanged", total=len(self._conversations))
+            return [dict(conv) for conv in self._conversations]
+
+        conversations = await self._extract_conversations(page, item_selector)
+        self._conversations_sig = signature
+        self._conversations = [dict(conv) for conv in conversations]
+        return conversations
+
+    async def _extract_conversations(
+        self, page: PwPage, item_selector: str
+    ) -> list[dict[str, str | bool]]:
+        """Parse every conversation item matching *item_selector*."""
+        conversations: list[dict[str, str | bool]] = []
+        try:
+            conversations = await page.locator(item_selector).evaluate_all(
+                _EXTRACT_CONVERSATIONS_JS,
+                {
+                    "username": _USERNAME_SELECTORS,
+                    "preview": _PREVIEW_SELECTORS,
+                    "badge": _UNREAD_BADGE_SELECTOR,
+                },
+            )
+            log.info("conversations_listed", total=len(conversations))
             return conversations
+        except Exception:
+            log.warning("conversation_batch_extract_failed", exc_info=True)
 
         elements = await page.query_selector_all(item_selector)
         log.info("conversations_found", count=len(elements))
 
-        for el in elements:
-            try:
-                conv: dict[str, str | bool] = {
-                    "username": "",
-                    "last_message_preview": "",
-                    "unread": False,
-                    "conversation_url": "",
-                }
-
-                # Extract username -- typically in a heading or strong tag
-                for name_sel in ("h3", "strong", ".username", ".sender-name",
-                                 "[data-testid='username']", "a.username"):
-                    name_el = await el.query_selector(name_sel)
-                    if name_el is not None:
-                        text = await name_el.text_content()
-                        if text and text.strip():
-                            conv["username"] = text.strip()
-                            break
-
-                # Extract preview text
-                for preview_sel in (".message-preview", ".last-message",
-                                    "p", "span.preview", ".snippet"):
-                    preview_el = await el.query_selector(preview_sel)
-                    if preview_el is not None:
-                        text = await preview_el.text_content()
-                        if text and text.strip():
-                            conv["last_message_preview"] = text.strip()
-                            break
-
-                # Detect unread state -- look for unread indicator classes
-                class_attr = await el.get_attribute("class") or ""
-                conv["unread"] = (
-                    "unread" in class_attr.lower()
-                    or "new" in class_attr.lower()
-                )
-                if not conv["unread"]:
-                    badge = await el.query_selector(
-                        ".unread-badge, .unread-indicator, .new-message-dot"
-                    )
-                    conv["unread"] = badge is not None
-
-                # Extract conversation URL from the first anchor tag
-                link_el = await el.query_selector("a[href]")
-                if link_el is not None:
-                    href = await link_el.get_attribute("href") or ""
-                    if href:
-                        if href.startswith("/"):
-                            href = f"https://www.fiverr.com{href}"
-                        conv["conversation_url"] = href
-
-                conversations.append(conv)
-            except Exception:
-                log.warning("conversation_parse_error", exc_info=True)
-                continue
+        # Items are independent; parse them concurrently so the element
+        # lookups pipeline over the connection instead of running serially.
+        limit = asyncio.Semaphore(_PARSE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._parse_conversation_item(el, limit) for el in elements),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                log.warning("conversation_parse_error", exc_info=result)
+            else:
+                conversations.append(result)
 
         log.info("conversations_listed", total=len(conversations))
         return conversations
@@ -152,8 +345,7 @@ class InboxManager:
         list[dict]
             Each dict has keys: ``sender``, ``text``, ``timestamp``.
         """
-        await self._navigator.goto_inbox()
-        page = await self._engine.get_page()
+        page = await self._navigator.goto_inbox()
 
         # Find and click the conversation for this user
         opened = await self._open_conversation_by_username(page, username)
@@ -161,77 +353,63 @@ class InboxManager:
             log.warning("conversation_not_found", username=username)
             return []
 
-        # Wait for messages to load
-        await asyncio.sleep(page_load_pause())
+        # Wait for messages to load (an empty thread just uses the budget)
+        try:
+            await page.locator(_MESSAGES_UNION).first.wait_for(
+                state="attached", timeout=_MESSAGES_TIMEOUT_MS
+            )
+        except Exception:
+            log.debug("messages_wait_timeout", username=username)
 
         # Simulate reading the conversation like a human
         await simulate_reading(page, duration=reading_delay(500))
 
         # Extract messages
+        text_selectors = self._selectors.get_all_safe("inbox", "message_text")
+        try:
+            raw: list[dict[str, str]] = await page.evaluate(
+                _EXTRACT_MESSAGES_JS,
+                {
+                    "containers": _MESSAGE_SELECTORS,
+                    "sender": _SENDER_SELECTORS,
+                    "text": [*text_selectors, *_MESSAGE_TEXT_FALLBACK_SELECTORS],
+                    "timestamp": _TIMESTAMP_SELECTORS,
+                },
+            )
+        except Exception:
+            log.warning("message_batch_extract_failed", exc_info=True)
+        else:
+            messages = [
+                _to_message(fields, username) for fields in raw if fields["text"]
+            ]
+            log.info(
+                "conversation_read",
+                username=username,
+                message_count=len(messages),
+            )
+            return messages
+
         messages: list[dict[str, str]] = []
         message_containers = await self._find_message_elements(page)
+        text_selector = (
+            await self._selectors.find_cached(page, "inbox", "message_text")
+            if message_containers
+            else None
+        )
 
-        for container in message_containers:
-            try:
-                msg: dict[str, str] = {
-                    "sender": "",
-                    "text": "",
-                    "timestamp": "",
-                }
-
-                # Determine sender
-                for sender_sel in (".sender", ".message-author", ".username",
-                                   "[data-testid='message-sender']"):
-                    sender_el = await container.query_selector(sender_sel)
-                    if sender_el is not None:
-                        text = await sender_el.text_content()
-                        if text and text.strip():
-                            msg["sender"] = text.strip()
-                            break
-
-                # If no explicit sender element, infer from class
-                if not msg["sender"]:
-                    container_class = await container.get_attribute("class") or ""
-                    if "sent" in container_class.lower() or "self" in container_class.lower():
-                        msg["sender"] = "me"
-                    else:
-                        msg["sender"] = username
-
-                # Extract message text
-                text_selector = await self._selectors.find(
-                    page, "inbox", "message_text"
-                )
-                if text_selector is not None:
-                    text_el = await container.query_selector(text_selector)
-                else:
-                    text_el = None
-
-                if text_el is None:
-                    for fallback in ("p", ".text", ".content", "span"):
-                        text_el = await container.query_selector(fallback)
-                        if text_el is not None:
-                            break
-
-                if text_el is not None:
-                    text = await text_el.text_content()
-                    if text:
-                        msg["text"] = text.strip()
-
-                # Extract timestamp
-                for ts_sel in (".timestamp", "time", ".message-time",
-                               "[data-testid='message-time']", ".date"):
-                    ts_el = await container.query_selector(ts_sel)
-                    if ts_el is not None:
-                        ts_text = await ts_el.text_content()
-                        ts_attr = await ts_el.get_attribute("datetime")
-                        msg["timestamp"] = (ts_attr or ts_text or "").strip()
-                        break
-
-                if msg["text"]:
-                    messages.append(msg)
-            except Exception:
-                log.warning("message_parse_error", exc_info=True)
-                continue
+        limit = asyncio.Semaphore(_PARSE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(
+                self._parse_message(container, username, text_selector, limit)
+                for container in message_containers
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                log.warning("message_parse_error", exc_info=result)
+            elif result is not None:
+                messages.append(result)
 
         log.info(
             "conversation_read",
@@ -254,8 +432,7 @@ class InboxManager:
         message:
             The text content to send.
         """
-        await self._navigator.goto_inbox()
-        page = await self._engine.get_page()
+        page = await self._navigator.goto_inbox()
 
         opened = await self._open_conversation_by_username(page, username)
         if not opened:
@@ -267,9 +444,10 @@ class InboxManager:
         await asyncio.sleep(between_actions())
 
         await self._type_and_send(page, message)
+        self._conversations_sig = None
 
         # Log the message in the database
-        await self._log_sent_message(username, message)
+        self._log_sent_message(username, message)
         log.info("message_sent_inbox", username=username, length=len(message))
 
     async def send_message_on_order_page(
@@ -284,14 +462,14 @@ class InboxManager:
         message:
             The text content to send.
         """
-        await self._navigator.goto_order_page(order_id)
-        page = await self._engine.get_page()
+        page = await self._navigator.goto_order_page(order_id)
         await asyncio.sleep(between_actions())
 
         await self._type_and_send(page, message)
+        self._conversations_sig = None
 
         # Log the message in the database
-        await self._log_sent_message(
+        self._log_sent_message(
             f"order:{order_id}", message, order_id=order_id
         )
         log.info(
@@ -324,130 +502,251 @@ class InboxManager:
     # ------------------------------------------------------------------
 
     async def _open_conversation_by_username(
-        self, page: object, username: str
+        self, page: PwPage, username: str
     ) -> bool:
         """Click on the conversation matching *username*.
 
         Returns ``True`` if the conversation was found and clicked.
         """
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
-        item_selector = await self._selectors.find(
-            pw_page, "inbox", "conversation_item"
-        )
+        item_selector = await self._selectors.find_cached(page, "inbox", "conversation_item")
         if item_selector is None:
             return False
 
-        elements = await pw_page.query_selector_all(item_selector)
-        for el in elements:
-            text = await el.text_content()
-            if text and username.lower() in text.lower():
-                await asyncio.sleep(human_delay(0.3, 0.8))
-                await el.click()
-                await asyncio.sleep(page_load_pause())
-                return True
+        # Case-insensitive substring match on the item's text, in one call.
+        item = page.locator(item_selector).filter(has_text=username).first
+        if await item.count() == 0:
+            return False
 
-        return False
+        before = page.url
+        await asyncio.sleep(human_delay(0.3, 0.8))
+        await item.click()
 
-    async def _find_message_elements(self, page: object) -> list:
-        """Return all message container elements on the current page."""
-        from playwright.async_api import Page as PwPage
+        # Done once the thread routes in or its messages render.
+        async def thread_open() -> bool:
+            return (
+                page.url != before
+                or await page.locator(_MESSAGES_UNION).count() > 0
+            )
 
-        pw_page: PwPage = page  # type: ignore[assignment]
+        if not await wait_until(thread_open, timeout=_THREAD_OPEN_TIMEOUT):
+            log.debug("conversation_open_wait_timeout", username=username)
+        return True
+
+    @staticmethod
+    async def _parse_conversation_item(
+        el: Any, limit: asyncio.Semaphore
+    ) -> dict[str, str | bool]:
+        """Read one conversation item element."""
+        async with limit:
+            conv: dict[str, str | bool] = {
+                "username": "",
+                "last_message_preview": "",
+                "unread": False,
+                "conversation_url": "",
+            }
+
+            # Extract username -- typically in a heading or strong tag
+            conv["username"] = await el.eval_on_selector_all(
+                _USERNAME_UNION, _FIRST_TEXT_JS, _USERNAME_SELECTORS
+            )
 
-        message_selectors = [
-            ".message-item",
-            ".chat-message",
-            "[data-testid='message']",
-            ".message-row",
-            ".message-bubble",
-            ".msg-wrapper",
-        ]
+            # Extract preview text
+            conv["last_message_preview"] = await el.eval_on_selector_all(
+                _PREVIEW_UNION, _FIRST_TEXT_JS, _PREVIEW_SELECTORS
+            )
 
-        for selector in message_selectors:
-            elements = await pw_page.query_selector_all(selector)
-            if elements:
-                return elements
+            # Detect unread state -- look for unread indicator classes
+            class_attr = await el.get_attribute("class") or ""
+            conv["unread"] = (
+                "unread" in class_attr.lower()
+                or "new" in class_attr.lower()
+            )
+            if not conv["unread"]:
+                badge = await el.query_selector(_UNREAD_BADGE_SELECTOR)
+                conv["unread"] = badge is not None
+
+            # Extract conversation URL from the first anchor tag
+            link_el = await el.query_selector("a[href]")
+            if link_el is not None:
+                href = await link_el.get_attribute("href") or ""
+                if href:
+                    href = urljoin(_BASE_URL, href)
+                    conv["conversation_url"] = href
+
+            return conv
+
+    @staticmethod
+    async def _parse_message(
+        container: Any,
+        username: str,
+        text_selector: str | None,
+        limit: asyncio.Semaphore,
+    ) -> dict[str, str] | None:
+        """Read one message container; ``None`` if it has no text."""
+        text_sels = (
+            (text_selector, *_MESSAGE_TEXT_FALLBACK_SELECTORS)
+            if text_selector is not None
+            else _MESSAGE_TEXT_FALLBACK_SELECTORS
+        )
+        async with limit:
+            fields = await container.evaluate(
+                _MESSAGE_FIELDS_JS,
+                {
+                    "sender": _SENDER_SELECTORS,
+                    "text": text_sels,
+                    "timestamp": _TIMESTAMP_SELECTORS,
+                },
+            )
+        return _to_message(fields, username) if fields["text"] else None
 
-        return []
+    async def _find_message_elements(self, page: PwPage) -> list:
+        """Return all message container elements on the current page."""
+        # One probe picks the highest-priority selector with matches; the
+        # groups are not unioned since they can match nested wrappers.
+        idx = await page.evaluate(_FIRST_PRESENT_INDEX_JS, _MESSAGE_SELECTORS)
+        if idx < 0:
+            return []
+        return await page.query_selector_all(_MESSAGE_SELECTORS[idx])
 
-    async def _type_and_send(self, page: object, message: str) -> None:
+    async def _type_and_send(self, page: PwPage, message: str) -> None:
         """Type a message into the input and press send."""
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
         # Find the message input
-        input_selector = await self._selectors.find(
-            pw_page, "inbox", "message_input"
-        )
+        input_selector = await self._selectors.find_cached(page, "inbox", "message_input")
         if input_selector is None:
             log.error("message_input_not_found")
-            await self._engine.screenshot("no_message_input")
+            await self._engine.screenshot("no_message_input", page=page)
             raise RuntimeError("Message input field not found on page")
 
-        await self._engine.type_text(input_selector, message)
+        # Type word by word: one press_sequentially call per word, each with
+        # its own sampled key delay, instead of a round-trip per character.
+        message_input = page.locator(input_selector).first
+        await message_input.fill("")
+        await message_input.click()
+        for chunk in _TYPING_CHUNK_RE.findall(message):
+            await message_input.press_sequentially(
+                chunk, delay=int(typing_delay() * 1000)
+            )
+        log.debug("typed_text", selector=input_selector, length=len(message))
         await asyncio.sleep(human_delay(0.5, 1.5))
 
         # Find and click the send button
-        send_selector = await self._selectors.find(
-            pw_page, "inbox", "send_button"
-        )
+        send_selector = await self._selectors.find_cached(page, "inbox", "send_button")
         if send_selector is not None:
-            await self._engine.click(send_selector)
+            await self._engine.click(send_selector, page=page)
         else:
             # Fallback: press Enter to send
             log.debug("send_button_not_found_using_enter")
-            await pw_page.keyboard.press("Enter")
+            await page.keyboard.press("Enter")
 
         await asyncio.sleep(between_actions())
 
-    async def _log_sent_message(
+    def _log_sent_message(
         self,
         username: str,
         content: str,
         order_id: str | None = None,
     ) -> None:
-        """Record a sent message in the database.
+        """Queue a sent message to be recorded in the database.
 
         If *order_id* is provided the message is linked to that order;
-        otherwise a best-effort lookup is performed.
+        otherwise a best-effort lookup is performed when the batch is
+        written.  The write happens off the send path; ``close`` flushes it.
         """
         now = datetime.now(timezone.utc).isoformat()
+        self._log_queue.put_nowait((username, content, order_id, now))
+        if self._log_writer is None or self._log_writer.done():
+            self._log_writer = asyncio.create_task(self._drain_log_queue())
+
+    async def _drain_log_queue(self) -> None:
+        """Write queued messages in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._log_queue.get()]
+            deadline = loop.time() + _LOG_BATCH_WAIT
+            while len(batch) < _LOG_BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._log_queue.get(), remaining)
+                    )
+                except TimeoutError:
+                    break
 
-        if order_id is None:
-            # Try to find an order associated with this username
-            row = await self._db.fetch_one(
-                "SELECT id FROM orders WHERE buyer_username = ? "
-                "ORDER BY created_at DESC LIMIT 1",
-                (username,),
-            )
-            if row is not None:
-                order_id = row["id"]
-
-        if order_id is not None:
             try:
-                await self._db.execute(
-                    "INSERT INTO messages (order_id, direction, content, timestamp) "
-                    "VALUES (?, 'sent', ?, ?)",
-                    (order_id, content, now),
-                )
-                log.debug("message_logged", order_id=order_id)
+                await self._write_message_log(batch)
             except Exception:
-                log.warning("message_log_failed", exc_info=True)
-        else:
-            log.debug(
-                "message_not_logged_no_order",
-                username=username,
-            )
+                log.warning("message_log_failed", count=len(batch), exc_info=True)
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
 
+    async def _write_message_log(
+        self, batch: list[tuple[str, str, str | None, str]]
+    ) -> None:
+        """Insert one batch of queued messages in a single transaction.
+
+        If the batch is rejected (e.g. one row names an unknown order), the
+        rows are retried one by one so the rest are still recorded.
+        """
+        order_ids: dict[str, str | None] = {}
+        rows: list[tuple[str, str, str]] = []
+        for username, content, order_id, timestamp in batch:
+            if order_id is None:
+                if username not in order_ids:
+                    # Try to find an order associated with this username
+                    row = await self._db.fetch_one(
+                        "SELECT id FROM orders WHERE buyer_username = ? "
+                        "ORDER BY created_at DESC LIMIT 1",
+                        (username,),
+                    )
+                    order_ids[username] = row["id"] if row is not None else None
+                order_id = order_ids[username]
+            if order_id is None:
+                log.debug("message_not_logged_no_order", username=username)
+                continue
+            rows.append((order_id, content, timestamp))
+
+        if not rows:
+            return
+        try:
+            async with self._db.transaction():
+                await self._db.executemany(_INSERT_SENT_MESSAGE_SQL, rows)
+        except Exception:
+            for row in rows:
+                try:
+                    await self._db.execute(_INSERT_SENT_MESSAGE_SQL, row)
+                except Exception:
+                    log.warning("message_log_failed", order_id=row[0], exc_info=True)
+            return
+        log.debug("messages_logged", count=len(rows))
+
+    async def close(self) -> None:
+        """Flush queued message-log writes and stop the writer task."""
+        if self._log_writer is None:
+            return
+        await self._log_queue.join()
+        self._log_writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._log_writer
+        self._log_writer = None
 
 # ---------------------------------------------------------------------------
 # Module-level helper
 # ---------------------------------------------------------------------------
 
-def page_load_pause() -> float:
-    """Return a human-like pause duration for waiting after page interactions."""
-    return human_delay(1.5, 3.5)
+def _infer_sender(container_class: str, username: str) -> str:
+    """Guess a message's sender from its lower-cased container class."""
+    if "sent" in container_class or "self" in container_class:
+        return "me"
+    return username
+
+
+def _to_message(fields: dict[str, str], username: str) -> dict[str, str]:
+    """Build a message dict from ``_MESSAGE_FIELDS_JS`` output."""
+    return {
+        "sender": fields["sender"] or _infer_sender(fields["cls"], username),
+        "text": fields["text"],
+        "timestamp": fields["timestamp"],
+    }
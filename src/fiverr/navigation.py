@@ -8,23 +8,44 @@ about popup dismissal timing.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+
+from playwright.async_api import Page
 
 from src.browser.engine import BrowserEngine
 from src.browser.selectors import SelectorStore
-from src.utils.human_timing import between_actions, human_delay, page_load_wait
+from src.utils.human_timing import between_actions, human_delay
 from src.utils.logger import get_logger
 
 log = get_logger(__name__, component="navigator")
 
 _BASE = "https://www.fiverr.com"
 
+# Selector-store (page, element) pairs for overlays we want to close.
+_DISMISSAL_TARGETS: tuple[tuple[str, str], ...] = (
+    ("common", "cookie_banner_close"),
+    ("common", "popup_close"),
+    ("common", "notification_dismiss"),
+)
+# How long to wait for any overlay at all before concluding there is none.
+_POPUP_WAIT_MS = 800
+
+# Cap on waiting for the network to go quiet after load; pages that keep
+# long-polling connections open never reach networkidle.
+_SETTLE_TIMEOUT_MS = 5_000
+
 _URLS = {
     "dashboard": f"{_BASE}/seller_dashboard",
     "inbox": f"{_BASE}/inbox",
     "orders": f"{_BASE}/manage_orders",
     "gig_create": f"{_BASE}/gigs/new",
-    "my_gigs": f"{_BASE}/users/{{username}}/manage_gigs",
-    "order_page": f"{_BASE}/manage_orders/{{order_id}}",
+}
+
+# Parametric URLs, built with f-strings rather than parsing a format
+# string on every call.
+_URL_TEMPLATES: dict[str, Callable[[str], str]] = {
+    "my_gigs": lambda username: f"{_BASE}/users/{username}/manage_gigs",
+    "order_page": lambda order_id: f"{_BASE}/manage_orders/{order_id}",
 }
 
 
@@ -42,36 +63,46 @@ class Navigator:
     def __init__(self, engine: BrowserEngine, selectors: SelectorStore) -> None:
         self._engine = engine
         self._selectors = selectors
+        # One ``:visible``-filtered union selector per dismissal target, so
+        # each group is probed in a single call.
+        self._popup_selectors: tuple[tuple[str, str], ...] = tuple(
+            (f"{yaml_page}.{yaml_element}", ", ".join(f"{c}:visible" for c in candidates))
+            for yaml_page, yaml_element in _DISMISSAL_TARGETS
+            if (candidates := selectors.get_all_safe(yaml_page, yaml_element))
+        )
+        self._any_popup_selector = ", ".join(sel for _, sel in self._popup_selectors)
 
     # ------------------------------------------------------------------
     # Core navigation targets
     # ------------------------------------------------------------------
 
-    async def goto_dashboard(self) -> None:
+    # Every ``goto_*`` returns the page it navigated, so callers can keep
+    # using that handle instead of asking the engine for it again.
+
+    async def goto_dashboard(self) -> Page:
         """Navigate to the seller dashboard and wait for readiness."""
         log.info("navigating_to_dashboard")
-        await self._engine.navigate(_URLS["dashboard"])
-        await self.wait_for_page_ready()
+        return await self._goto(_URLS["dashboard"])
 
-    async def goto_inbox(self) -> None:
+    async def goto_inbox(self) -> Page:
         """Navigate to the Fiverr inbox."""
         log.info("navigating_to_inbox")
-        await self._engine.navigate(_URLS["inbox"])
-        await self.wait_for_page_ready()
+        return await self._goto(_URLS["inbox"])
 
-    async def goto_orders(self) -> None:
+    async def goto_orders(self) -> Page:
         """Navigate to the manage-orders page."""
         log.info("navigating_to_orders")
-        await self._engine.navigate(_URLS["orders"])
-        await self.wait_for_page_ready()
+        return await self._goto(_URLS["orders"])
+
+    async def goto_gig_creation(self, page: Page | None = None) -> Page:
+        """Navigate to the gig creation page.
 
-    async def goto_gig_creation(self) -> None:
-        """Navigate to the gig creation page."""
+        *page* defaults to the engine's current page.
+        """
         log.info("navigating_to_gig_creation")
-        await self._engine.navigate(_URLS["gig_create"])
-        await self.wait_for_page_ready()
+        return await self._goto(_URLS["gig_create"], page)
 
-    async def goto_order_page(self, order_id: str) -> None:
+    async def goto_order_page(self, order_id: str) -> Page:
         """Navigate to a specific order's detail page.
 
         Parameters
@@ -79,76 +110,83 @@ class Navigator:
         order_id:
             The Fiverr order identifier (e.g. ``"FO12345678A1B2"``).
         """
-        url = _URLS["order_page"].format(order_id=order_id)
+        url = _URL_TEMPLATES["order_page"](order_id)
         log.info("navigating_to_order", order_id=order_id, url=url)
-        await self._engine.navigate(url)
-        await self.wait_for_page_ready()
+        return await self._goto(url)
+
+    async def _goto(self, url: str, page: Page | None = None) -> Page:
+        """Navigate *page* (default: the current page) to *url* and settle."""
+        if page is None:
+            page = await self._engine.get_page()
+        await self._engine.navigate(url, page=page)
+        await self.wait_for_page_ready(page)
+        return page
 
     # ------------------------------------------------------------------
     # Popup / banner dismissal
     # ------------------------------------------------------------------
 
-    async def dismiss_popups(self) -> None:
+    async def dismiss_popups(self, page: Page | None = None) -> None:
         """Attempt to close popups, cookie banners, and notification modals.
 
-        Each selector group is tried independently; errors are caught and
-        silently logged so that missing popups never break the flow.
+        One short wait checks whether any overlay is visible at all; if so,
+        each selector group is probed with a single union query and its
+        first visible match clicked.  Errors are caught so that missing
+        popups never break the flow.  *page* defaults to the engine's
+        current page.
         """
-        page = await self._engine.get_page()
+        if page is None:
+            page = await self._engine.get_page()
+        if not self._popup_selectors:
+            return
 
-        # Map of selector-store (page, element) pairs for things we want to close
-        dismissal_targets: list[tuple[str, str]] = [
-            ("common", "cookie_banner_close"),
-            ("common", "popup_close"),
-            ("common", "notification_dismiss"),
-        ]
+        # A single short wait covers every group; most pages have no popup.
+        try:
+            await page.wait_for_selector(self._any_popup_selector, timeout=_POPUP_WAIT_MS)
+        except Exception:
+            return
 
-        for yaml_page, yaml_element in dismissal_targets:
+        for target, selector in self._popup_selectors:
             try:
-                candidates = self._selectors.get_all(yaml_page, yaml_element)
-            except KeyError:
+                element = await page.query_selector(selector)
+                if element is not None:
+                    await asyncio.sleep(human_delay(0.2, 0.6))
+                    await element.click()
+                    log.info("popup_dismissed", target=target)
+                    await asyncio.sleep(human_delay(0.3, 0.8))
+            except Exception:
+                # Element went away or click failed -- perfectly fine.
                 continue
 
-            for selector in candidates:
-                try:
-                    element = await page.wait_for_selector(selector, timeout=1_500)
-                    if element is not None:
-                        await asyncio.sleep(human_delay(0.2, 0.6))
-                        await element.click()
-                        log.info(
-                            "popup_dismissed",
-                            target=f"{yaml_page}.{yaml_element}",
-                            selector=selector,
-                        )
-                        await asyncio.sleep(human_delay(0.3, 0.8))
-                        break  # One successful dismiss per target group is enough
-                except Exception:
-                    # Element not present or click failed -- perfectly fine.
-                    continue
-
     # ------------------------------------------------------------------
     # Readiness
     # ------------------------------------------------------------------
 
-    async def wait_for_page_ready(self) -> None:
+    async def wait_for_page_ready(self, page: Page | None = None) -> None:
         """Wait for the page to become interactive, then dismiss popups.
 
-        The method waits for the ``load`` event (with a generous timeout),
-        pauses briefly like a human would, and then sweeps for dismissible
-        overlays.
+        The method waits for ``domcontentloaded`` (with a generous timeout)
+        and then for the network to settle (capped, so JS frameworks get
+        time to hydrate without a fixed sleep), sweeps for dismissible
+        overlays, and pauses briefly like a human would.  *page* defaults
+        to the engine's current page.
         """
-        page = await self._engine.get_page()
+        if page is None:
+            page = await self._engine.get_page()
 
         try:
             await page.wait_for_load_state("domcontentloaded", timeout=30_000)
         except Exception:
             log.warning("page_load_timeout", url=page.url)
 
-        # Additional settle time for JS frameworks to hydrate
-        await asyncio.sleep(page_load_wait())
+        # Let JS frameworks hydrate; returns as soon as the network is quiet
+        try:
+            await page.wait_for_load_state("networkidle", timeout=_SETTLE_TIMEOUT_MS)
+        except Exception:
+            log.debug("page_settle_timeout", url=page.url)
 
         # Try to get the page into a clean state
-        await self.dismiss_popups()
+        await self.dismiss_popups(page)
 
         # Short human-like pause after everything settles
         await asyncio.sleep(between_actions())
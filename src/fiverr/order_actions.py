@@ -8,17 +8,227 @@ revision acceptance.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import expect
 
 from src.browser.anti_detect import human_click
 from src.browser.engine import BrowserEngine
-from src.browser.selectors import SelectorStore
+from src.browser.selectors import SelectorStore, wait_for_any
 from src.fiverr.navigation import Navigator
 from src.utils.human_timing import between_actions, human_delay
 from src.utils.logger import get_logger
+from src.utils.polling import wait_until
+from src.utils.retry import retry
+
+if TYPE_CHECKING:
+    from playwright.async_api import ElementHandle, Page
 
 log = get_logger(__name__, component="order_actions")
 
+# Any of these after submitting means the delivery went through.  They are
+# joined into one selector so the browser matches every variant in a
+# single wait.
+_SUCCESS_INDICATORS = (
+    ".delivery-success",
+    "[data-testid='delivery-success']",
+    ":has-text('delivered successfully')",
+    ":has-text('Order Delivered')",
+    ".success-message",
+    ".order-delivered-banner",
+)
+_SUCCESS_UNION = ", ".join(_SUCCESS_INDICATORS)
+# Seconds to poll for a success marker or redirect after submitting.
+_VERIFY_TIMEOUT = 8.0
+# An identical action that succeeded this recently (seconds) is not redone.
+_RECENT_SUCCESS_TTL = 60.0
+
+# Opens the delivery form on the order page.
+_DELIVER_TRIGGER_SELECTORS = (
+    "button:has-text('Deliver Now')",
+    "button:has-text('Deliver Order')",
+    "button:has-text('Deliver')",
+    "[data-testid='deliver-order']",
+    ".deliver-now-btn",
+    "a:has-text('Deliver Now')",
+)
+
+# Any file input, used when the YAML ``file_upload`` selector misses.
+_UPLOAD_INPUT_SELECTORS = (
+    "input[type='file']",
+    ".upload-zone input[type='file']",
+    ".file-upload input",
+)
+
+# Deadline-extension form: trigger, fields and submit button.
+_EXTENSION_TRIGGER_SELECTORS = (
+    "a:has-text('Extend')",
+    "button:has-text('Extend')",
+    "[data-testid='extend-delivery']",
+    ".extend-delivery-btn",
+    "a[href*='extend']",
+)
+_EXTENSION_DAYS_SELECTORS = (
+    "input[name='days']",
+    "input[type='number']",
+    "select.extension-days",
+    "[data-testid='extension-days']",
+    "input.days-input",
+)
+_EXTENSION_REASON_SELECTORS = (
+    "textarea[name='reason']",
+    "textarea.extension-reason",
+    "[data-testid='extension-reason']",
+    "textarea",
+)
+_EXTENSION_SUBMIT_SELECTORS = (
+    "button:has-text('Submit')",
+    "button:has-text('Request')",
+    "button[type='submit']",
+    "[data-testid='submit-extension']",
+    ".extension-submit-btn",
+)
+
+# "Accept" / "Start Revision" on an order with a revision request.
+_ACCEPT_REVISION_SELECTORS = (
+    "button:has-text('Accept')",
+    "button:has-text('Start Revision')",
+    "[data-testid='accept-revision']",
+    ".accept-revision-btn",
+    "a:has-text('Accept Revision')",
+    "button:has-text('OK')",
+)
+
+# Catch-alls that also match unrelated fields; ``_first_match`` only tries
+# them after the specific candidates in the same list.
+_GENERIC_SELECTORS = frozenset({
+    "textarea",
+    "input[type='number']",
+    "button[type='submit']",
+})
+
+# Confirmation modals that follow an action.
+_CONFIRM_SELECTORS = (
+    "button:has-text('Confirm')",
+    "button:has-text('Yes')",
+    "button:has-text('OK')",
+    "[data-testid='confirm-button']",
+    ".modal-confirm-btn",
+)
+
+
+def _resolve_file(file_path: str) -> Path | None:
+    """Return the absolute path of *file_path*, or ``None`` if it is not a file.
+
+    ``absolute()`` rather than ``resolve()``: symlinks need not be followed
+    here, so the per-component ``readlink`` calls are skipped.
+    """
+    p = Path(file_path).absolute()
+    return p if p.is_file() else None
+
+
+async def _first_match(
+    page: Page, selectors: Sequence[str], timeout: int
+) -> tuple[str, ElementHandle] | None:
+    """Return the first of *selectors* visible on the page, waiting only if none is.
+
+    One concurrent ``count()`` probe over visible matches picks an element
+    that is already shown (earliest in *selectors* wins) without arming
+    any timeouts; only when nothing is visible yet does it fall back to
+    ``wait_for_any`` with the shared *timeout* (ms).  Catch-alls listed in
+    ``_GENERIC_SELECTORS`` go through the same two steps only after the
+    specific candidates came up empty, so they cannot beat a field that
+    is still rendering.
+    """
+    specific = [sel for sel in selectors if sel not in _GENERIC_SELECTORS]
+    generic = [sel for sel in selectors if sel in _GENERIC_SELECTORS]
+    for group in (specific, generic):
+        if not group:
+            continue
+        match = await _first_visible(page, group)
+        if match is None:
+            match = await wait_for_any(page, group, timeout=timeout)
+        if match is not None:
+            return match
+    return None
+
+
+async def _first_visible(
+    page: Page, selectors: Sequence[str]
+) -> tuple[str, ElementHandle] | None:
+    """Return the first of *selectors* with a visible match right now."""
+    locators = [page.locator(sel).filter(visible=True) for sel in selectors]
+    counts = await asyncio.gather(*(loc.count() for loc in locators))
+    for selector, loc, count in zip(selectors, locators, counts, strict=True):
+        if not count:
+            continue
+        try:
+            return selector, await loc.first.element_handle(timeout=1_000)
+        except PlaywrightError:
+            continue  # hidden or detached since the probe
+    return None
+
+
+async def _validate_files(file_paths: list[str]) -> list[Path] | None:
+    """Resolve *file_paths* off the event loop, dropping duplicate files.
+
+    The ``stat`` calls run in worker threads and overlap with each other.
+    Returns ``None`` (after logging every missing path) if any path is
+    not a file.
+    """
+    checked = await asyncio.gather(
+        *(asyncio.to_thread(_resolve_file, fp) for fp in file_paths)
+    )
+    missing = [fp for fp, p in zip(file_paths, checked, strict=True) if p is None]
+    if missing:
+        for fp in missing:
+            log.error("delivery_file_not_found", path=fp)
+        return None
+    return await asyncio.to_thread(
+        _drop_duplicate_files, [p for p in checked if p is not None]
+    )
+
+
+def _url_signals_delivery(url: str) -> bool:
+    """Return ``True`` if *url* looks like a post-delivery page."""
+    lowered = url.lower()
+    return "delivered" in lowered or "complete" in lowered
+
+
+def _drop_duplicate_files(paths: list[Path]) -> list[Path]:
+    """Return *paths* without repeated paths or copies of an earlier file.
+
+    A copy is a file with the same name and content as an earlier one
+    (e.g. one output saved in two folders); files whose names differ are
+    always kept, even if their content matches.  Only files whose name
+    and size match another file's are hashed, so a delivery of distinct
+    files costs one ``stat`` each.
+    """
+    unique = list(dict.fromkeys(paths))
+    by_name_size: dict[tuple[str, int], list[Path]] = {}
+    for p in unique:
+        by_name_size.setdefault((p.name, p.stat().st_size), []).append(p)
+
+    duplicates: set[Path] = set()
+    for group in by_name_size.values():
+        if len(group) < 2:
+            continue
+        seen: set[str] = set()
+        for p in group:
+            with p.open("rb") as fh:
+                digest = hashlib.file_digest(fh, "sha256").hexdigest()
+            if digest in seen:
+                duplicates.add(p)
+                log.info("delivery_duplicate_file_skipped", path=str(p))
+            seen.add(digest)
+
+    return [p for p in unique if p not in duplicates]
+
 
 class OrderActions:
     """Perform delivery and management actions on Fiverr orders.
@@ -42,6 +252,60 @@ class OrderActions:
         self._engine = engine
         self._selectors = selectors
         self._navigator = navigator
+        # One lock per order id, plus the time of each recent successful
+        # action, so a duplicate call neither races nor repeats the work.
+        # A lock is dropped once no caller holds or waits for it.
+        self._order_locks: dict[str, asyncio.Lock] = {}
+        self._order_lock_users: dict[str, int] = {}
+        self._recent_success: dict[tuple[Hashable, ...], float] = {}
+        # Failure screenshots run in the background; strong refs until done.
+        self._bg_tasks: set[asyncio.Task[None]] = set()
+
+    async def _single_flight(
+        self,
+        key: tuple[Hashable, ...],
+        action: Callable[[], Awaitable[bool]],
+    ) -> bool:
+        """Run *action* at most once at a time per order.
+
+        ``key`` is ``(action_name, order_id, *args)``.  Callers for the
+        same order queue on one lock; if an identical call succeeded in
+        the last ``_RECENT_SUCCESS_TTL`` seconds, ``True`` is returned
+        without driving the browser again.
+        """
+        order_id = str(key[1])
+        lock = self._order_locks.setdefault(order_id, asyncio.Lock())
+        self._order_lock_users[order_id] = self._order_lock_users.get(order_id, 0) + 1
+        try:
+            async with lock:
+                now = time.monotonic()
+                done_at = self._recent_success.get(key)
+                if done_at is not None and now - done_at < _RECENT_SUCCESS_TTL:
+                    log.info("order_action_coalesced", action=key[0], order_id=order_id)
+                    return True
+
+                ok = await action()
+                if ok:
+                    now = time.monotonic()
+                    self._recent_success = {
+                        k: t
+                        for k, t in self._recent_success.items()
+                        if now - t < _RECENT_SUCCESS_TTL
+                    }
+                    self._recent_success[key] = now
+                return ok
+        finally:
+            users = self._order_lock_users[order_id] - 1
+            if users:
+                self._order_lock_users[order_id] = users
+            else:
+                del self._order_lock_users[order_id]
+                del self._order_locks[order_id]
+
+    async def close(self) -> None:
+        """Wait for any failure screenshots still being written."""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
 
     # ------------------------------------------------------------------
     # Deliver order
@@ -69,80 +333,71 @@ class OrderActions:
         bool
             ``True`` if the delivery was submitted successfully.
         """
-        # Validate that all files exist before starting
-        resolved_paths: list[Path] = []
-        for fp in file_paths:
-            p = Path(fp).resolve()
-            if not p.is_file():
-                log.error("delivery_file_not_found", path=str(p))
-                return False
-            resolved_paths.append(p)
+        key = ("deliver", order_id, message, tuple(file_paths))
+        return await self._single_flight(
+            key, lambda: self._deliver_order(order_id, message, file_paths)
+        )
 
-        await self._navigator.goto_order_page(order_id)
-        page = await self._engine.get_page()
+    async def _deliver_order(
+        self, order_id: str, message: str, file_paths: list[str]
+    ) -> bool:
+        """Body of ``deliver_order``; runs under the order's lock."""
+        order_log = log.bind(order_id=order_id)
+        # Validate the files while the order page loads; neither depends
+        # on the other.
+        resolved_paths, page = await asyncio.gather(
+            _validate_files(file_paths),
+            self._navigator.goto_order_page(order_id),
+        )
+        if resolved_paths is None:
+            return False
 
         # Click the "Deliver Now" / "Deliver Order" button to open the form
         deliver_trigger_found = await self._click_deliver_trigger(page)
         if not deliver_trigger_found:
-            log.error("deliver_trigger_not_found", order_id=order_id)
-            await self._engine.screenshot("deliver_trigger_missing")
+            order_log.error("deliver_trigger_not_found")
+            self._screenshot_later("deliver_trigger_missing")
             return False
 
-        await asyncio.sleep(between_actions())
-
         # -- Type the delivery message --------------------------------------
-        msg_selector = await self._selectors.find(
+        msg_selector = await self._selectors.find_cached(
             page, "delivery", "delivery_message_input"
         )
         if msg_selector is None:
-            log.error("delivery_message_input_not_found", order_id=order_id)
-            await self._engine.screenshot("delivery_no_message_input")
+            order_log.error("delivery_message_input_not_found")
+            self._screenshot_later("delivery_no_message_input")
             return False
 
         await self._engine.type_text(msg_selector, message)
         await asyncio.sleep(human_delay(0.5, 1.5))
 
         # -- Upload files ---------------------------------------------------
-        for resolved in resolved_paths:
-            uploaded = await self._upload_delivery_file(page, resolved)
-            if not uploaded:
-                log.error(
-                    "delivery_file_upload_failed",
-                    order_id=order_id,
-                    file=str(resolved),
-                )
-                await self._engine.screenshot("delivery_upload_failed")
-                return False
-            # Brief pause between uploads
-            await asyncio.sleep(human_delay(1.0, 2.5))
+        if not await self._upload_delivery_files(page, resolved_paths):
+            order_log.error("delivery_file_upload_failed", files=len(resolved_paths))
+            self._screenshot_later("delivery_upload_failed")
+            return False
 
         # -- Submit the delivery --------------------------------------------
-        submit_selector = await self._selectors.find(
+        submit_selector = await self._selectors.find_cached(
             page, "delivery", "submit_delivery"
         )
         if submit_selector is None:
-            log.error("delivery_submit_button_not_found", order_id=order_id)
-            await self._engine.screenshot("delivery_no_submit")
+            order_log.error("delivery_submit_button_not_found")
+            self._screenshot_later("delivery_no_submit")
             return False
 
-        await asyncio.sleep(human_delay(0.5, 1.0))
+        # One pause covers "check the attachments, then reach for submit".
+        await asyncio.sleep(human_delay(1.0, 2.5))
         await human_click(page, submit_selector)
         await asyncio.sleep(between_actions())
 
         # Verify submission -- look for confirmation indicators
         success = await self._verify_delivery_submitted(page)
         if success:
-            log.info(
-                "order_delivered",
-                order_id=order_id,
-                files=len(resolved_paths),
-            )
+            order_log.info("order_delivered", files=len(resolved_paths))
         else:
-            log.warning(
-                "delivery_verification_uncertain",
-                order_id=order_id,
-            )
-            await self._engine.screenshot("delivery_verification_uncertain")
+            order_log.warning("delivery_verification_uncertain")
+            self._screenshot_later("delivery_verification_uncertain")
 
         return success
 
@@ -169,120 +424,94 @@ class OrderActions:
         bool
             ``True`` if the extension request was submitted.
         """
+        key = ("extend", order_id, days, reason)
+        return await self._single_flight(
+            key, lambda: self._request_extension(order_id, days, reason)
+        )
+
+    async def _request_extension(
+        self, order_id: str, days: int, reason: str
+    ) -> bool:
+        """Body of ``request_extension``; runs under the order's lock."""
+        order_log = log.bind(order_id=order_id)
         await self._navigator.goto_order_page(order_id)
         page = await self._engine.get_page()
         await asyncio.sleep(between_actions())
 
         # Look for the extension / "Extend delivery" link or button
-        extension_selectors = [
-            "a:has-text('Extend')",
-            "button:has-text('Extend')",
-            "[data-testid='extend-delivery']",
-            ".extend-delivery-btn",
-            "a[href*='extend']",
-        ]
-
         clicked = False
-        for selector in extension_selectors:
+        match = await _first_match(page, _EXTENSION_TRIGGER_SELECTORS, timeout=3_000)
+        if match is not None:
             try:
-                el = await page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.3, 0.8))
-                    await el.click()
-                    clicked = True
-                    break
+                await asyncio.sleep(human_delay(0.3, 0.8))
+                await match[1].click()
+                clicked = True
             except Exception:
-                continue
+                order_log.debug("extension_trigger_click_failed", selector=match[0])
 
         if not clicked:
-            log.error("extension_trigger_not_found", order_id=order_id)
-            await self._engine.screenshot("extension_trigger_missing")
+            order_log.error("extension_trigger_not_found")
+            self._screenshot_later("extension_trigger_missing")
             return False
 
         await asyncio.sleep(between_actions())
 
         # Fill in the number of days
-        days_selectors = [
-            "input[name='days']",
-            "input[type='number']",
-            "select.extension-days",
-            "[data-testid='extension-days']",
-            "input.days-input",
-        ]
-
         days_filled = False
-        for selector in days_selectors:
+        match = await _first_match(page, _EXTENSION_DAYS_SELECTORS, timeout=3_000)
+        if match is not None:
+            selector, el = match
             try:
-                el = await page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    tag = await el.evaluate("el => el.tagName.toLowerCase()")
-                    if tag == "select":
-                        await el.select_option(value=str(days))
-                    else:
-                        await self._engine.type_text(selector, str(days))
-                    days_filled = True
-                    break
+                # Most candidates name their tag; only ask the page when
+                # the selector doesn't say.
+                if selector.startswith(("select", "input")):
+                    is_select = selector.startswith("select")
+                else:
+                    is_select = await el.evaluate("el => el.tagName === 'SELECT'")
+                if is_select:
+                    await el.select_option(value=str(days))
+                else:
+                    await self._engine.type_text(selector, str(days))
+                days_filled = True
             except Exception:
-                continue
+                order_log.debug("extension_days_fill_failed", selector=selector)
 
         if not days_filled:
-            log.error("extension_days_input_not_found", order_id=order_id)
-            await self._engine.screenshot("extension_no_days_input")
+            order_log.error("extension_days_input_not_found")
+            self._screenshot_later("extension_no_days_input")
             return False
 
         await asyncio.sleep(human_delay(0.5, 1.0))
 
         # Fill in the reason
-        reason_selectors = [
-            "textarea[name='reason']",
-            "textarea.extension-reason",
-            "[data-testid='extension-reason']",
-            "textarea",
-        ]
-
         reason_filled = False
-        for selector in reason_selectors:
+        match = await _first_match(page, _EXTENSION_REASON_SELECTORS, timeout=3_000)
+        if match is not None:
             try:
-                el = await page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    await self._engine.type_text(selector, reason)
-                    reason_filled = True
-                    break
+                await self._engine.type_text(match[0], reason)
+                reason_filled = True
             except Exception:
-                continue
+                order_log.debug("extension_reason_fill_failed", selector=match[0])
 
         if not reason_filled:
-            log.warning("extension_reason_input_not_found", order_id=order_id)
+            order_log.warning("extension_reason_input_not_found")
             # Continue anyway -- reason may be optional on some layouts
 
         await asyncio.sleep(human_delay(0.5, 1.0))
 
         # Submit the extension request
-        submit_selectors = [
-            "button:has-text('Submit')",
-            "button:has-text('Request')",
-            "button[type='submit']",
-            "[data-testid='submit-extension']",
-            ".extension-submit-btn",
-        ]
-
-        for selector in submit_selectors:
+        match = await _first_match(page, _EXTENSION_SUBMIT_SELECTORS, timeout=3_000)
+        if match is not None:
             try:
-                el = await page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    await human_click(page, selector)
-                    await asyncio.sleep(between_actions())
-                    log.info(
-                        "extension_requested",
-                        order_id=order_id,
-                        days=days,
-                    )
-                    return True
+                await human_click(page, match[0])
+                await asyncio.sleep(between_actions())
+                order_log.info("extension_requested", days=days)
+                return True
             except Exception:
-                continue
+                order_log.debug("extension_submit_click_failed", selector=match[0])
 
-        log.error("extension_submit_failed", order_id=order_id)
-        await self._engine.screenshot("extension_submit_failed")
+        order_log.error("extension_submit_failed")
+        self._screenshot_later("extension_submit_failed")
         return False
 
     # ------------------------------------------------------------------
@@ -302,193 +531,168 @@ class OrderActions:
         bool
             ``True`` if the revision was accepted successfully.
         """
+        return await self._single_flight(
+            ("accept_revision", order_id),
+            lambda: self._accept_revision(order_id),
+        )
+
+    async def _accept_revision(self, order_id: str) -> bool:
+        """Body of ``accept_revision``; runs under the order's lock."""
+        order_log = log.bind(order_id=order_id)
         await self._navigator.goto_order_page(order_id)
         page = await self._engine.get_page()
         await asyncio.sleep(between_actions())
 
         # Look for an "Accept" or "Start Revision" button
-        accept_selectors = [
-            "button:has-text('Accept')",
-            "button:has-text('Start Revision')",
-            "[data-testid='accept-revision']",
-            ".accept-revision-btn",
-            "a:has-text('Accept Revision')",
-            "button:has-text('OK')",
-        ]
-
-        for selector in accept_selectors:
+        match = await _first_match(page, _ACCEPT_REVISION_SELECTORS, timeout=3_000)
+        if match is not None:
             try:
-                el = await page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.3, 0.8))
-                    await human_click(page, selector)
-                    await asyncio.sleep(between_actions())
+                await asyncio.sleep(human_delay(0.3, 0.8))
+                await human_click(page, match[0])
+                await asyncio.sleep(between_actions())
 
-                    # Handle confirmation dialogs
-                    await self._confirm_dialog(page)
+                # Handle confirmation dialogs
+                await self._confirm_dialog(page)
 
-                    log.info("revision_accepted", order_id=order_id)
-                    return True
+                order_log.info("revision_accepted")
+                return True
             except Exception:
-                continue
+                order_log.debug("accept_revision_click_failed", selector=match[0])
 
-        log.error("accept_revision_button_not_found", order_id=order_id)
-        await self._engine.screenshot("accept_revision_not_found")
+        order_log.error("accept_revision_button_not_found")
+        self._screenshot_later("accept_revision_not_found")
         return False
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _click_deliver_trigger(self, page: object) -> bool:
+    async def _click_deliver_trigger(self, page: Page) -> bool:
         """Find and click the button that opens the delivery form.
 
         Returns ``True`` if a deliver button was found and clicked.
         """
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
-        trigger_selectors = [
-            "button:has-text('Deliver Now')",
-            "button:has-text('Deliver Order')",
-            "button:has-text('Deliver')",
-            "[data-testid='deliver-order']",
-            ".deliver-now-btn",
-            "a:has-text('Deliver Now')",
-        ]
-
-        for selector in trigger_selectors:
-            try:
-                el = await pw_page.wait_for_selector(selector, timeout=4_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.3, 0.8))
-                    await human_click(pw_page, selector)
-                    await asyncio.sleep(between_actions())
-                    return True
-            except Exception:
-                continue
+        match = await _first_match(page, _DELIVER_TRIGGER_SELECTORS, timeout=4_000)
+        if match is None:
+            return False
 
-        return False
+        try:
+            await asyncio.sleep(human_delay(0.3, 0.8))
+            await human_click(page, match[0])
+            await asyncio.sleep(between_actions())
+        except Exception:
+            log.debug("deliver_trigger_click_failed", selector=match[0])
+            return False
+        return True
 
-    async def _upload_delivery_file(
-        self, page: object, file_path: Path
+    async def _upload_delivery_files(
+        self, page: Page, file_paths: list[Path]
     ) -> bool:
-        """Upload a single file through the delivery form.
+        """Upload every file through the delivery form.
+
+        The file input is resolved once.  All files are selected in a
+        single ``set_input_files`` call; if the input rejects several
+        files (no ``multiple`` attribute), they are uploaded one by one
+        with a short pause in between.
 
         Returns ``True`` on success.
         """
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
-        # Try YAML-configured selector first, then fallbacks
-        upload_selector = await self._selectors.find(
-            pw_page, "delivery", "file_upload"
+        # Try YAML-configured selector first, then any file input
+        upload_selector = await self._selectors.find_cached(
+            page, "delivery", "file_upload"
         )
+        if upload_selector is None:
+            match = await _first_match(page, _UPLOAD_INPUT_SELECTORS, timeout=3_000)
+            if match is None:
+                log.error("file_upload_selector_not_found", files=len(file_paths))
+                return False
+            upload_selector = match[0]
 
-        if upload_selector is not None:
+        if len(file_paths) > 1:
             try:
-                await self._engine.upload_file(upload_selector, str(file_path))
-                log.debug("file_uploaded", file=file_path.name)
+                await self._engine.upload_file(
+                    upload_selector, [str(p) for p in file_paths]
+                )
+                log.debug("files_uploaded", count=len(file_paths))
                 return True
+            except PlaywrightError:
+                log.debug("batch_upload_rejected", selector=upload_selector)
+
+        for index, file_path in enumerate(file_paths):
+            if index:
+                await asyncio.sleep(human_delay(1.0, 2.5))
+            try:
+                await self._upload_one(upload_selector, file_path)
             except Exception:
-                log.debug(
-                    "yaml_upload_selector_failed",
+                log.error(
+                    "file_upload_failed",
+                    file=file_path.name,
                     selector=upload_selector,
                 )
+                return False
+            log.debug("file_uploaded", file=file_path.name)
+        return True
 
-        # Fallback: look for any file input on the page
-        fallback_selectors = [
-            "input[type='file']",
-            ".upload-zone input[type='file']",
-            ".file-upload input",
-        ]
+    @retry(max_attempts=3, base_delay=2.0, max_delay=15.0, exceptions=(PlaywrightError,))
+    async def _upload_one(self, selector: str, file_path: Path) -> None:
+        """Upload a single file, retrying transient browser errors.
 
-        for selector in fallback_selectors:
-            try:
-                el = await pw_page.wait_for_selector(selector, timeout=3_000)
-                if el is not None:
-                    await self._engine.upload_file(selector, str(file_path))
-                    log.debug(
-                        "file_uploaded_fallback",
-                        file=file_path.name,
-                        selector=selector,
-                    )
-                    return True
-            except Exception:
-                continue
-
-        log.error("file_upload_selector_not_found", file=file_path.name)
-        return False
+        A failure only repeats this file, not the files already attached.
+        """
+        await self._engine.upload_file(selector, str(file_path))
 
-    async def _verify_delivery_submitted(self, page: object) -> bool:
+    async def _verify_delivery_submitted(self, page: Page) -> bool:
         """Check for confirmation indicators after submitting a delivery.
 
         Returns ``True`` if a success signal is detected.
         """
-        from playwright.async_api import Page as PwPage
-
-        pw_page: PwPage = page  # type: ignore[assignment]
-
-        success_indicators = [
-            ".delivery-success",
-            "[data-testid='delivery-success']",
-            ":has-text('delivered successfully')",
-            ":has-text('Order Delivered')",
-            ".success-message",
-            ".order-delivered-banner",
-        ]
+        success = page.locator(_SUCCESS_UNION)
 
-        for selector in success_indicators:
-            try:
-                el = await pw_page.wait_for_selector(selector, timeout=8_000)
-                if el is not None:
-                    return True
-            except Exception:
-                continue
+        async def delivered() -> bool:
+            # Cheapest signal first: a redirect to a delivered/complete
+            # URL needs no round-trip to the browser.
+            if _url_signals_delivery(page.url):
+                return True
+            return await success.count() > 0
 
-        # Fallback: check if the page URL changed to indicate delivery
-        current_url = pw_page.url
-        if "delivered" in current_url.lower() or "complete" in current_url.lower():
+        if await wait_until(delivered, timeout=_VERIFY_TIMEOUT, initial=0.5, cap=4.0):
             return True
 
         # Final fallback: check if the delivery button is gone
-        # (which implies the form was submitted)
+        # (which implies the form was submitted).  Passes at once when it
+        # is already absent; otherwise gives it a moment to go away.
         try:
-            deliver_btn = await pw_page.wait_for_selector(
-                "button:has-text('Deliver Now')", timeout=2_000
+            await expect(page.locator("button:has-text('Deliver Now')")).to_be_hidden(
+                timeout=2_000
             )
-            if deliver_btn is None:
-                return True
-        except Exception:
-            # Button not found -> likely submitted
-            return True
-
-        return False
+        except AssertionError:
+            return False
+        return True
 
-    async def _confirm_dialog(self, page: object) -> None:
+    async def _confirm_dialog(self, page: Page) -> None:
         """Handle any confirmation modals that appear after an action."""
-        from playwright.async_api import Page as PwPage
+        match = await _first_match(page, _CONFIRM_SELECTORS, timeout=2_000)
+        if match is None:
+            return
 
-        pw_page: PwPage = page  # type: ignore[assignment]
+        selector, el = match
+        try:
+            await asyncio.sleep(human_delay(0.3, 0.8))
+            await el.click()
+            await asyncio.sleep(between_actions())
+            log.debug("confirmation_dialog_accepted", selector=selector)
+        except Exception:
+            log.debug("confirmation_dialog_click_failed", selector=selector)
 
-        confirm_selectors = [
-            "button:has-text('Confirm')",
-            "button:has-text('Yes')",
-            "button:has-text('OK')",
-            "[data-testid='confirm-button']",
-            ".modal-confirm-btn",
-        ]
+    def _screenshot_later(self, name: str) -> None:
+        """Capture a debug screenshot without making the caller wait."""
+        task = asyncio.create_task(self._safe_screenshot(name))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
 
-        for selector in confirm_selectors:
-            try:
-                el = await pw_page.wait_for_selector(selector, timeout=2_000)
-                if el is not None:
-                    await asyncio.sleep(human_delay(0.3, 0.8))
-                    await el.click()
-                    await asyncio.sleep(between_actions())
-                    log.debug("confirmation_dialog_accepted", selector=selector)
-                    return
-            except Exception:
-                continue
+    async def _safe_screenshot(self, name: str) -> None:
+        """Take a screenshot, logging (not raising) any failure."""
+        try:
+            await self._engine.screenshot(name)
+        except Exception:
+            log.warning("screenshot_failed", name=name, exc_info=True)
@@ -8,8 +8,12 @@ that are new or have changed status since the last check.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import re
+from collections.abc import Sequence
 from datetime import datetime, timezone
+from typing import Any
 
 from src.browser.anti_detect import simulate_reading
 from src.browser.engine import BrowserEngine
@@ -40,16 +44,169 @@ _GIG_TYPE_KEYWORDS: dict[str, GigType] = {
     "data": GigType.DATA_ENTRY,
 }
 
+# One alternation per gig type, in the dict's order.  The keywords are
+# grouped by type there, so the first pattern that matches gives the same
+# answer as scanning the keywords one by one.
+_GIG_TYPE_PATTERNS: tuple[tuple[re.Pattern[str], GigType], ...] = tuple(
+    (
+        re.compile(
+            "|".join(
+                re.escape(keyword)
+                for keyword, kw_type in _GIG_TYPE_KEYWORDS.items()
+                if kw_type is gig_type
+            )
+        ),
+        gig_type,
+    )
+    for gig_type in dict.fromkeys(_GIG_TYPE_KEYWORDS.values())
+)
+
+
+# Per-field fallbacks inside an order row, tried in order.
+_BUYER_SELECTORS = (
+    ".buyer-name",
+    ".username",
+    "a.buyer",
+    "[data-testid='buyer-name']",
+    ".seller-buyer",
+)
+_PRICE_SELECTORS = (
+    ".price",
+    ".order-price",
+    ".amount",
+    "[data-testid='order-price']",
+    "span.total",
+)
+_TITLE_SELECTORS = (
+    ".gig-title",
+    ".order-title",
+    "h3",
+    "h4",
+    "[data-testid='gig-title']",
+    ".order-desc",
+)
+
+# Order-page detail fallbacks; each is read through its comma union.
+_FILE_SELECTORS = (
+    ".attachment-name",
+    ".file-name",
+    "[data-testid='attachment']",
+    "a[download]",
+    ".order-attachments a",
+)
+_BUYER_MESSAGE_SELECTORS = (
+    ".message-body",
+    ".buyer-message",
+    "[data-testid='buyer-message']",
+    ".order-message .content",
+    ".chat-message p",
+)
+_DEADLINE_SELECTORS = (
+    ".delivery-deadline",
+    ".due-date",
+    "[data-testid='deadline']",
+    ".order-deadline",
+    "time.deadline",
+)
+_REVISION_SELECTORS = (
+    ".revision-message",
+    ".revision-request-text",
+    "[data-testid='revision-message']",
+    ".revision-details",
+    ".buyer-revision-note",
+)
+_FILE_UNION = ", ".join(_FILE_SELECTORS)
+_BUYER_MESSAGE_UNION = ", ".join(_BUYER_MESSAGE_SELECTORS)
+_DEADLINE_UNION = ", ".join(_DEADLINE_SELECTORS)
+_REVISION_UNION = ", ".join(_REVISION_SELECTORS)
+
+# For ``eval_on_selector_all(union, js, [sels, attr, attr_first])``: the
+# non-empty values of the first candidate that has any, where a value is
+# the element's text or *attr* (whichever *attr_first* puts first).
+_GROUP_VALUES_JS = """
+(nodes, [sels, attr, attrFirst]) => {
+    const value = (n) => {
+        const a = attr ? n.getAttribute(attr) : null;
+        return ((attrFirst ? (a || n.textContent) : (n.textContent || a)) || "").trim();
+    };
+    for (const sel of sels) {
+        const values = nodes.filter((n) => n.matches(sel)).map(value).filter(Boolean);
+        if (values.length) return values;
+    }
+    return [];
+}
+"""
+
+# For ``eval_on_selector_all(union, js, [sels, keep_blank])`` on a row: the
+# trimmed text of the first candidate whose first match has text, as a
+# per-selector loop would.  ``keep_blank`` accepts whitespace-only text.
+_FIRST_TEXT_JS = """
+(nodes, [sels, keepBlank]) => {
+    for (const sel of sels) {
+        const node = nodes.find((n) => n.matches(sel));
+        if (!node) continue;
+        const t = node.textContent || "";
+        if (t && (keepBlank || t.trim())) return t.trim();
+    }
+    return "";
+}
+"""
+
+# Upper bound on order rows parsed concurrently on the fallback path.
+_PARSE_CONCURRENCY = 16
+
+# Read every order row's raw fields in one call.  ``ids`` lists
+# ``[href, text]`` for each id candidate present, in priority order; the
+# text fields follow ``_first_text`` (price keeps blank-but-present text).
+_EXTRACT_ORDER_ROWS_JS = """
+(items, spec) => {
+    const query = (root, sel) => {
+        try { return root.querySelector(sel); } catch (e) { return null; }
+    };
+    const firstText = (root, sels, keepBlank) => {
+        for (const sel of sels) {
+            const node = query(root, sel);
+            const t = node ? (node.textContent || "") : "";
+            if (t && (keepBlank || t.trim())) return t.trim();
+        }
+        return "";
+    };
+
+    return items.map((el) => ({
+        ids: spec.id.flatMap((sel) => {
+            const node = query(el, sel);
+            return node ? [[node.getAttribute("href") || "", node.textContent || ""]] : [];
+        }),
+        buyer: firstText(el, spec.buyer, false),
+        status: firstText(el, spec.status, false),
+        price: firstText(el, spec.price, true),
+        title: firstText(el, spec.title, false),
+    }));
+}
+"""
+
+_INSERT_ORDER_SQL = (
+    "INSERT INTO orders "
+    "(id, fiverr_order_id, gig_type, status, buyer_username, "
+    " price, created_at, updated_at) "
+    "VALUES (?, ?, ?, 'new', ?, ?, ?, ?)"
+)
+_UPDATE_ORDER_STATUS_SQL = (
+    "UPDATE orders SET status = ?, updated_at = ? WHERE fiverr_order_id = ?"
+)
+
 
+@functools.lru_cache(maxsize=2048)
 def _infer_gig_type(title: str) -> str:
     """Infer the ``GigType`` value from an order/gig *title*.
 
     Scans the title for keywords and returns the first matching type.
-    Defaults to ``writing`` if no keywords match.
+    Defaults to ``writing`` if no keywords match.  Memoised: the same
+    active orders reappear on every poll.
     """
     lower = title.lower()
-    for keyword, gig_type in _GIG_TYPE_KEYWORDS.items():
-        if keyword in lower:
+    for pattern, gig_type in _GIG_TYPE_PATTERNS:
+        if pattern.search(lower):
             return gig_type.value
     return GigType.WRITING.value
 
@@ -103,28 +260,35 @@ class OrderMonitor:
         scraped_orders = await self._scrape_order_list(page)
         log.info("orders_scraped", count=len(scraped_orders))
 
-        # Compare with database to find new / changed entries
-        new_or_changed: list[dict[str, str]] = []
-
+        # Compare with database to find new / changed entries.  One SELECT
+        # covers every scraped id; inserts and updates are then batched.
+        by_id: dict[str, dict[str, str]] = {}
         for order in scraped_orders:
             fiverr_id = order.get("fiverr_order_id", "")
-            if not fiverr_id:
-                continue
-
-            existing = await self._db.fetch_one(
-                "SELECT fiverr_order_id, status FROM orders "
-                "WHERE fiverr_order_id = ?",
-                (fiverr_id,),
-            )
+            if fiverr_id and fiverr_id not in by_id:
+                by_id[fiverr_id] = order
+        if not by_id:
+            log.info("order_check_complete", new_or_changed=0)
+            return []
+
+        placeholders = ", ".join("?" * len(by_id))
+        rows = await self._db.fetch_all(
+            "SELECT fiverr_order_id, status FROM orders "
+            f"WHERE fiverr_order_id IN ({placeholders})",
+            tuple(by_id),
+        )
+        existing = {row["fiverr_order_id"]: row["status"] for row in rows}
 
-            if existing is None:
-                # Brand-new order -- insert into DB
-                now = datetime.now(timezone.utc).isoformat()
-                await self._db.execute(
-                    "INSERT INTO orders "
-                    "(id, fiverr_order_id, gig_type, status, buyer_username, "
-                    " price, created_at, updated_at) "
-                    "VALUES (?, ?, ?, 'new', ?, ?, ?, ?)",
+        now = datetime.now(timezone.utc).isoformat()
+        new_or_changed: list[dict[str, str]] = []
+        insert_rows: list[tuple[object, ...]] = []
+        update_rows: list[tuple[object, ...]] = []
+
+        for fiverr_id, order in by_id.items():
+            old_status = existing.get(fiverr_id)
+            if old_status is None:
+                # Brand-new order
+                insert_rows.append(
                     (
                         fiverr_id,
                         fiverr_id,
@@ -133,27 +297,30 @@ class OrderMonitor:
                         float(order.get("price", "0") or "0"),
                         now,
                         now,
-                    ),
+                    )
                 )
                 new_or_changed.append(order)
                 log.info("new_order_detected", fiverr_order_id=fiverr_id)
 
-            elif existing["status"] != order.get("status", ""):
-                # Status changed -- update DB
-                now = datetime.now(timezone.utc).isoformat()
-                await self._db.execute(
-                    "UPDATE orders SET status = ?, updated_at = ? "
-                    "WHERE fiverr_order_id = ?",
-                    (order.get("status", existing["status"]), now, fiverr_id),
+            elif old_status != order.get("status", ""):
+                # Status changed
+                update_rows.append(
+                    (order.get("status", old_status), now, fiverr_id)
                 )
                 new_or_changed.append(order)
                 log.info(
                     "order_status_changed",
                     fiverr_order_id=fiverr_id,
-                    old_status=existing["status"],
+                    old_status=old_status,
                     new_status=order.get("status"),
                 )
 
+        async with self._db.transaction():
+            if insert_rows:
+                await self._db.executemany(_INSERT_ORDER_SQL, insert_rows)
+            if update_rows:
+                await self._db.executemany(_UPDATE_ORDER_STATUS_SQL, update_rows)
+
         log.info("order_check_complete", new_or_changed=len(new_or_changed))
         return new_or_changed
 
@@ -200,82 +367,35 @@ class OrderMonitor:
                 text = await el.text_content()
                 details["requirements"] = (text or "").strip()
 
-        # -- Attached files -------------------------------------------------
-        file_selectors = [
-            ".attachment-name",
-            ".file-name",
-            "[data-testid='attachment']",
-            "a[download]",
-            ".order-attachments a",
-        ]
-        attached: list[str] = []
-        for sel in file_selectors:
-            elements = await page.query_selector_all(sel)
-            for el in elements:
-                text = await el.text_content()
-                href = await el.get_attribute("href")
-                name = (text or href or "").strip()
-                if name and name not in attached:
-                    attached.append(name)
-            if attached:
-                break
-        details["attached_files"] = attached
-
-        # -- Buyer messages -------------------------------------------------
-        msg_selectors = [
-            ".message-body",
-            ".buyer-message",
-            "[data-testid='buyer-message']",
-            ".order-message .content",
-            ".chat-message p",
-        ]
-        buyer_msgs: list[str] = []
-        for sel in msg_selectors:
-            elements = await page.query_selector_all(sel)
-            for el in elements:
-                text = await el.text_content()
-                if text and text.strip():
-                    buyer_msgs.append(text.strip())
-            if buyer_msgs:
-                break
+        # -- Attached files, buyer messages, revisions ----------------------
+        # One call each: the union returns every candidate match and the
+        # script keeps those of the first candidate that yields anything.
+        files, buyer_msgs, revisions = await asyncio.gather(
+            page.eval_on_selector_all(
+                _FILE_UNION, _GROUP_VALUES_JS, [_FILE_SELECTORS, "href", False]
+            ),
+            page.eval_on_selector_all(
+                _BUYER_MESSAGE_UNION, _GROUP_VALUES_JS, [_BUYER_MESSAGE_SELECTORS, None, False]
+            ),
+            page.eval_on_selector_all(
+                _REVISION_UNION, _GROUP_VALUES_JS, [_REVISION_SELECTORS, None, False]
+            ),
+        )
+        details["attached_files"] = list(dict.fromkeys(files))
         details["buyer_messages"] = buyer_msgs
 
         # -- Deadline -------------------------------------------------------
-        deadline_selectors = [
-            ".delivery-deadline",
-            ".due-date",
-            "[data-testid='deadline']",
-            ".order-deadline",
-            "time.deadline",
-        ]
-        for sel in deadline_selectors:
-            try:
-                el = await page.wait_for_selector(sel, timeout=3_000)
-                if el is not None:
-                    text = await el.text_content()
-                    dt_attr = await el.get_attribute("datetime")
-                    details["deadline"] = (dt_attr or text or "").strip()
-                    break
-            except Exception:
-                continue
+        # A single wait covers every candidate instead of 3 s per selector.
+        try:
+            await page.wait_for_selector(_DEADLINE_UNION, timeout=3_000)
+            deadlines = await page.eval_on_selector_all(
+                _DEADLINE_UNION, _GROUP_VALUES_JS, [_DEADLINE_SELECTORS, "datetime", True]
+            )
+            if deadlines:
+                details["deadline"] = deadlines[0]
+        except Exception:
+            log.debug("order_deadline_not_found", order_id=order_id)
 
-        # -- Revision requests ----------------------------------------------
-        revision_selectors = [
-            ".revision-message",
-            ".revision-request-text",
-            "[data-testid='revision-message']",
-            ".revision-details",
-            ".buyer-revision-note",
-        ]
-        revisions: list[str] = []
-        for sel in revision_selectors:
-            elements = await page.query_selector_all(sel)
-            for el in elements:
-                text = await el.text_content()
-                if text and text.strip():
-                    revisions.append(text.strip())
-            if revisions:
-                break
         details["revision_requests"] = revisions
 
         log.info("order_details_extracted", order_id=order_id)
@@ -386,109 +506,152 @@ class OrderMonitor:
             log.warning("order_items_not_found")
             return orders
 
-        elements = await pw_page.query_selector_all(item_selector)
+        # Looked up once for all rows
+        id_selectors = self._selectors.get_all("orders", "order_id")
+        status_selectors = self._selectors.get_all("orders", "order_status")
 
-        for el in elements:
-            try:
-                order: dict[str, str] = {
-                    "fiverr_order_id": "",
-                    "buyer_username": "",
-                    "status": "",
-                    "gig_type": "",
-                    "price": "",
-                    "requirements_url": "",
-                }
-
-                # -- Order ID -----------------------------------------------
-                id_candidates = self._selectors.get_all("orders", "order_id")
-                for sel in id_candidates:
-                    id_el = await el.query_selector(sel)
-                    if id_el is not None:
-                        # Try href first (often contains the order ID)
-                        href = await id_el.get_attribute("href") or ""
-                        if "/orders/" in href:
-                            # Extract the order ID from URL path
-                            parts = href.split("/orders/")
-                            if len(parts) > 1:
-                                raw_id = parts[1].split("/")[0].split("?")[0]
-                                order["fiverr_order_id"] = raw_id
-                                order["requirements_url"] = (
-                                    f"https://www.fiverr.com/manage_orders/{raw_id}"
-                                )
-
-                        if not order["fiverr_order_id"]:
-                            text = await id_el.text_content()
-                            if text and text.strip():
-                                # Strip non-alphanumeric prefix like "#"
-                                cleaned = text.strip().lstrip("#").strip()
-                                order["fiverr_order_id"] = cleaned
-
-                        if order["fiverr_order_id"]:
-                            break
-
-                # -- Buyer username -----------------------------------------
-                for uname_sel in (".buyer-name", ".username", "a.buyer",
-                                  "[data-testid='buyer-name']", ".seller-buyer"):
-                    uname_el = await el.query_selector(uname_sel)
-                    if uname_el is not None:
-                        text = await uname_el.text_content()
-                        if text and text.strip():
-                            order["buyer_username"] = text.strip()
-                            break
-
-                # -- Status -------------------------------------------------
-                status_candidates = self._selectors.get_all(
-                    "orders", "order_status"
+        # Fast path: read every row in one browser round-trip.
+        try:
+            rows = await pw_page.locator(item_selector).evaluate_all(
+                _EXTRACT_ORDER_ROWS_JS,
+                {
+                    "id": id_selectors,
+                    "buyer": _BUYER_SELECTORS,
+                    "status": status_selectors,
+                    "price": _PRICE_SELECTORS,
+                    "title": _TITLE_SELECTORS,
+                },
+            )
+        except Exception:
+            log.warning("order_batch_extract_failed", exc_info=True)
+        else:
+            for row in rows:
+                order_id, order_url = next(
+                    (
+                        parsed
+                        for href, text in row["ids"]
+                        if (parsed := _parse_order_id(href, text))[0]
+                    ),
+                    ("", ""),
                 )
-                for sel in status_candidates:
-                    status_el = await el.query_selector(sel)
-                    if status_el is not None:
-                        text = await status_el.text_content()
-                        if text and text.strip():
-                            order["status"] = text.strip().lower()
-                            break
-
-                # -- Price --------------------------------------------------
-                for price_sel in (".price", ".order-price", ".amount",
-                                  "[data-testid='order-price']", "span.total"):
-                    price_el = await el.query_selector(price_sel)
-                    if price_el is not None:
-                        text = await price_el.text_content()
-                        if text:
-                            # Strip currency symbols and whitespace
-                            cleaned = text.strip().replace("$", "").replace(
-                                ",", ""
-                            ).strip()
-                            order["price"] = cleaned
-                            break
-
-                # -- Gig type (inferred from title) -------------------------
-                title_text = ""
-                for title_sel in (".gig-title", ".order-title", "h3", "h4",
-                                  "[data-testid='gig-title']", ".order-desc"):
-                    title_el = await el.query_selector(title_sel)
-                    if title_el is not None:
-                        text = await title_el.text_content()
-                        if text and text.strip():
-                            title_text = text.strip()
-                            break
-
-                order["gig_type"] = _infer_gig_type(title_text)
-
-                # -- Requirements URL fallback ------------------------------
-                if not order["requirements_url"] and order["fiverr_order_id"]:
-                    order["requirements_url"] = (
-                        f"https://www.fiverr.com/manage_orders/"
-                        f"{order['fiverr_order_id']}"
-                    )
-
-                if order["fiverr_order_id"]:
+                order = _build_order(
+                    order_id, order_url, row["buyer"], row["status"],
+                    row["price"], row["title"],
+                )
+                if order_id:
                     orders.append(order)
                 else:
                     log.debug("order_row_missing_id", raw=str(order))
+            return orders
 
-            except Exception:
-                log.warning("order_row_parse_error", exc_info=True)
-                continue
+        elements = await pw_page.query_selector_all(item_selector)
+
+        # Rows are independent; parse them concurrently so the element
+        # lookups pipeline over the connection instead of running serially.
+        limit = asyncio.Semaphore(_PARSE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(
+                _parse_order_row(el, limit, id_selectors, status_selectors)
+                for el in elements
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                log.warning("order_row_parse_error", exc_info=result)
+            elif result["fiverr_order_id"]:
+                orders.append(result)
+            else:
+                log.debug("order_row_missing_id", raw=str(result))
 
         return orders
+
+
+# ---------------------------------------------------------------------------
+# Module-level helpers
+# ---------------------------------------------------------------------------
+
+
+async def _parse_order_row(
+    el: Any,
+    limit: asyncio.Semaphore,
+    id_selectors: Sequence[str],
+    status_selectors: Sequence[str],
+) -> dict[str, str]:
+    """Read one order row; the independent fields are fetched together."""
+    async with limit:
+        (order_id, order_url), buyer, status, price, title = await asyncio.gather(
+            _row_order_id(el, id_selectors),
+            _first_text(el, _BUYER_SELECTORS),
+            _first_text(el, status_selectors),
+            _first_text(el, _PRICE_SELECTORS, strip_empty=False),
+            _first_text(el, _TITLE_SELECTORS),
+        )
+
+    return _build_order(order_id, order_url, buyer, status, price, title)
+
+
+async def _row_order_id(el: Any, id_selectors: Sequence[str]) -> tuple[str, str]:
+    """Return ``(order_id, order_url)`` for a row, or empty strings."""
+    for sel in id_selectors:
+        id_el = await el.query_selector(sel)
+        if id_el is None:
+            continue
+
+        href, text = await asyncio.gather(
+            id_el.get_attribute("href"), id_el.text_content()
+        )
+        order_id, order_url = _parse_order_id(href, text)
+        if order_id:
+            return order_id, order_url
+
+    return "", ""
+
+
+def _parse_order_id(href: str | None, text: str | None) -> tuple[str, str]:
+    """Return ``(order_id, order_url)`` from an id element's href and text.
+
+    The href is preferred (it usually carries the id); otherwise the text
+    is used with any ``#`` prefix removed.  Empty strings if neither works.
+    """
+    href = href or ""
+    if "/orders/" in href:
+        raw_id = href.split("/orders/")[1].split("/")[0].split("?")[0]
+        if raw_id:
+            return raw_id, f"https://www.fiverr.com/manage_orders/{raw_id}"
+
+    cleaned = (text or "").strip().lstrip("#").strip()
+    return cleaned, ""
+
+
+def _build_order(
+    order_id: str,
+    order_url: str,
+    buyer: str,
+    status: str,
+    price: str,
+    title: str,
+) -> dict[str, str]:
+    """Assemble the order dict returned by ``_scrape_order_list``."""
+    return {
+        "fiverr_order_id": order_id,
+        "buyer_username": buyer,
+        "status": status.lower(),
+        "gig_type": _infer_gig_type(title),
+        # Strip currency symbols and thousands separators
+        "price": price.replace("$", "").replace(",", "").strip(),
+        "requirements_url": order_url
+        or (f"https://www.fiverr.com/manage_orders/{order_id}" if order_id else ""),
+    }
+
+
+async def _first_text(el: Any, selectors: Sequence[str], strip_empty: bool = True) -> str:
+    """Return the stripped text of the first of *selectors* inside *el*.
+
+    Candidates are tried in order.  With *strip_empty* a match whose text
+    is blank is skipped; otherwise any non-empty raw text wins.  All of
+    them are fetched in one call through their comma union.
+    """
+    return await el.eval_on_selector_all(
+        ", ".join(selectors), _FIRST_TEXT_JS, [list(selectors), not strip_empty]
+    )
@@ -7,7 +7,10 @@ used as a long-lived singleton and supports the async context-manager protocol.
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +20,12 @@ from src.utils.logger import get_logger
 
 log = get_logger(__name__, component="database")
 
+_CACHE_SIZE_KIB = 65_536
+
+# Tables read once at startup so the first writes find their b-tree pages
+# already in the page cache.
+_WARM_TABLES: tuple[str, ...] = ("orders", "messages", "gigs")
+
 
 class Database:
     """Thin async wrapper around an aiosqlite connection.
@@ -31,6 +40,12 @@ class Database:
     def __init__(self, db_path: str = "data/sixxer.db") -> None:
         self._db_path = Path(db_path)
         self._conn: aiosqlite.Connection | None = None
+        # Serialises writers on the shared connection: held by an open
+        # ``transaction()`` and around each standalone execute + commit.
+        self._write_lock = asyncio.Lock()
+        # Task running the open ``transaction()``; its execute helpers
+        # leave the commit to the end of the block.
+        self._tx_owner: asyncio.Task[Any] | None = None
 
     # ------------------------------------------------------------------
     # Connection lifecycle
@@ -42,10 +57,18 @@ class Database:
         self._conn = await aiosqlite.connect(str(self._db_path))
         self._conn.row_factory = aiosqlite.Row
         await self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only syncs at checkpoints; commits stay durable
+        # across application crashes, just not across power loss.
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        # 64 MiB page cache (negative = KiB) so hot tables stay in memory
+        # on this long-lived connection.
+        await self._conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+        await self._conn.execute("PRAGMA temp_store=MEMORY")
         await self._conn.execute("PRAGMA foreign_keys=ON")
         await self._conn.commit()
         log.info("database_connected", path=str(self._db_path))
         await self.migrate()
+        await self._warm_cache()
 
     async def close(self) -> None:
         """Close the database connection gracefully."""
@@ -122,11 +145,29 @@ class Database:
                 status        TEXT    NOT NULL DEFAULT 'active',
                 created_at    TEXT    NOT NULL
             );
+
+            CREATE TABLE IF NOT EXISTS selector_cache (
+                page      TEXT NOT NULL,
+                element   TEXT NOT NULL,
+                selector  TEXT NOT NULL,
+                cached_at TEXT NOT NULL,
+                PRIMARY KEY (page, element)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_orders_buyer
+                ON orders(buyer_username, created_at DESC);
             """
         )
         await self._conn.commit()
         log.info("database_migrated")
 
+    async def _warm_cache(self) -> None:
+        """Touch the hot tables so their pages are cached before first use."""
+        for table in _WARM_TABLES:
+            cursor = await self.conn.execute(f"SELECT count(*) FROM {table}")
+            await cursor.fetchone()
+            await cursor.close()
+
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
@@ -138,10 +179,53 @@ class Database:
             raise RuntimeError("Database is not connected. Call connect() first.")
         return self._conn
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes so they commit once, or roll back together.
+
+        ``execute`` and ``executemany`` calls inside the block do not
+        commit on their own; the block commits on exit and rolls back if
+        it raises.  A nested ``transaction()`` in the same task joins the
+        outer one.  Writes from other tasks wait until the block ends, so
+        do not spawn tasks that write and await them inside the block.
+        """
+        if self._owns_transaction():
+            yield
+            return
+
+        async with self._write_lock:
+            await self.conn.execute("BEGIN")
+            self._tx_owner = asyncio.current_task()
+            try:
+                yield
+            except BaseException:
+                await self.conn.rollback()
+                raise
+            else:
+                await self.conn.commit()
+            finally:
+                self._tx_owner = None
+
+    @asynccontextmanager
+    async def _rollback_on_error(self) -> AsyncIterator[None]:
+        """Roll back the implicit transaction a failed standalone write opens.
+
+        Left open, it would make the next ``transaction()`` fail to BEGIN.
+        """
+        try:
+            yield
+        except BaseException:
+            await self.conn.rollback()
+            raise
+
+    def _owns_transaction(self) -> bool:
+        """Return ``True`` if the calling task is inside ``transaction()``."""
+        return self._tx_owner is not None and self._tx_owner is asyncio.current_task()
+
     async def execute(
         self, sql: str, params: tuple[Any, ...] = ()
     ) -> aiosqlite.Cursor:
-        """Execute a SQL statement and commit.
+        """Execute a SQL statement and commit (unless in a ``transaction``).
 
         Parameters
         ----------
@@ -155,10 +239,34 @@ class Database:
         aiosqlite.Cursor
             The cursor after execution (useful for ``lastrowid``, etc.).
         """
-        cursor = await self.conn.execute(sql, params)
-        await self.conn.commit()
+        if self._owns_transaction():
+            return await self.conn.execute(sql, params)
+        async with self._write_lock, self._rollback_on_error():
+            cursor = await self.conn.execute(sql, params)
+            await self.conn.commit()
         return cursor
 
+    async def executemany(
+        self, sql: str, params_seq: Iterable[tuple[Any, ...]]
+    ) -> None:
+        """Execute *sql* once per parameter tuple and commit once.
+
+        Inside ``transaction()`` the commit is left to the block.
+
+        Parameters
+        ----------
+        sql:
+            SQL statement with ``?`` placeholders.
+        params_seq:
+            One tuple of bind parameters per row.
+        """
+        if self._owns_transaction():
+            await self.conn.executemany(sql, params_seq)
+            return
+        async with self._write_lock, self._rollback_on_error():
+            await self.conn.executemany(sql, params_seq)
+            await self.conn.commit()
+
     async def fetch_one(
         self, sql: str, params: tuple[Any, ...] = ()
     ) -> dict[str, Any] | None:
@@ -20,6 +20,12 @@ Usage example::
 from __future__ import annotations
 
 import random
+from collections.abc import Iterator
+
+# Number of keystroke delays drawn per batch.  ``type_text`` calls
+# ``typing_delay()`` once per character, so samples are drawn in bulk and
+# handed out one at a time.
+_TYPING_POOL_SIZE = 4096
 
 
 def _clipped_gauss(mean: float, std: float, lo: float, hi: float) -> float:
@@ -27,6 +33,18 @@ def _clipped_gauss(mean: float, std: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, random.gauss(mean, std)))
 
 
+def _typing_samples() -> Iterator[float]:
+    """Yield keystroke delays forever, refilling the pool when exhausted."""
+    while True:
+        yield from [
+            _clipped_gauss(mean=0.08, std=0.03, lo=0.03, hi=0.20)
+            for _ in range(_TYPING_POOL_SIZE)
+        ]
+
+
+_TYPING_ITER = _typing_samples()
+
+
 # ---------------------------------------------------------------------------
 # Public helpers
 # ---------------------------------------------------------------------------
@@ -60,7 +78,7 @@ def typing_delay() -> float:
     float
         Seconds in the range [0.03, 0.20].
     """
-    return _clipped_gauss(mean=0.08, std=0.03, lo=0.03, hi=0.20)
+    return next(_TYPING_ITER)
 
 
 def reading_delay(text_length: int) -> float:
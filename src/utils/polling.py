@@ -0,0 +1,63 @@
+"""Adaptive polling for page post-conditions.
+
+``wait_until`` replaces fixed "give the page a few seconds" sleeps: it
+checks the condition right away, then backs off exponentially, so fast
+pages return almost immediately while slow ones are still given the full
+budget.
+
+Usage::
+
+    from src.utils.polling import wait_until
+
+    async def thread_open() -> bool:
+        return page.url != before
+
+    if not await wait_until(thread_open, timeout=10.0):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+
+async def wait_until(
+    predicate: Callable[[], Awaitable[bool]],
+    timeout: float = 15.0,
+    initial: float = 0.05,
+    cap: float = 1.0,
+) -> bool:
+    """Await *predicate* until it returns ``True`` or *timeout* elapses.
+
+    Parameters
+    ----------
+    predicate:
+        Async callable checked once immediately and then after each sleep.
+        Exceptions count as "not yet".
+    timeout:
+        Overall budget in seconds.
+    initial:
+        First sleep between checks; doubled after every miss.
+    cap:
+        Upper bound on the sleep between checks.
+
+    Returns
+    -------
+    bool
+        ``True`` if the predicate held before the deadline.
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial
+    while True:
+        try:
+            if await predicate():
+                return True
+        except Exception:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, cap)
@@ -0,0 +1,115 @@
+"""Opt-in profiling decorator for async hot paths.
+
+Every decorated call logs its wall time at DEBUG level (measured with
+``time.perf_counter_ns``), which is cheap enough to leave on everywhere.
+Setting ``SIXXER_PROFILE=1`` additionally records each call with
+pyinstrument (the ``profile`` extra; a warning is logged if it is
+missing) and writes an HTML flamegraph under the log directory's
+``profile/`` folder.
+
+Usage::
+
+    from src.utils.profiling import profile
+
+    @profile
+    async def scrape(self) -> dict[str, str]:
+        ...
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+from src.utils.logger import get_logger
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+log = get_logger(__name__, component="profiling")
+
+_DEFAULT_LOG_DIR = Path(__file__).resolve().parents[2] / "data" / "logs"
+
+# pyinstrument cannot nest profilers on one thread; only the outermost
+# decorated call records a flamegraph, inner ones are just timed.
+_profiler_active: bool = False
+
+# SIXXER_PROFILE=1 without pyinstrument is reported once, not per call.
+_pyinstrument_warned: bool = False
+
+
+def _profiling_enabled() -> bool:
+    """Return ``True`` if flamegraph profiling was requested."""
+    return os.environ.get("SIXXER_PROFILE") == "1"
+
+
+def _profile_dir() -> Path:
+    """Directory that receives the HTML flamegraphs."""
+    log_dir = Path(os.environ.get("SIXXER_LOG_DIR", str(_DEFAULT_LOG_DIR)))
+    return log_dir / "profile"
+
+
+def _start_profiler() -> Any | None:
+    """Start a pyinstrument profiler, or return ``None`` if unavailable."""
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        global _pyinstrument_warned
+        if not _pyinstrument_warned:
+            _pyinstrument_warned = True
+            log.warning(
+                "pyinstrument_not_installed",
+                hint="SIXXER_PROFILE=1 needs pyinstrument: pip install -e '.[profile]'",
+            )
+        return None
+
+    profiler = Profiler(async_mode="enabled")
+    profiler.start()
+    return profiler
+
+
+def _write_flamegraph(profiler: Any, name: str) -> None:
+    """Stop *profiler* and save its HTML report for *name*."""
+    profiler.stop()
+    out_dir = _profile_dir()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now(UTC).strftime("%Y%m%d_%H%M%S_%f")
+    path = out_dir / f"{name}_{ts}.html"
+    path.write_text(profiler.output_html(), encoding="utf-8")
+    log.debug("flamegraph_saved", path=str(path))
+
+
+def profile(
+    func: Callable[P, Awaitable[T]],
+) -> Callable[P, Awaitable[T]]:
+    """Time (and optionally profile) every call to the async *func*."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        global _profiler_active
+
+        profiler = None
+        if _profiling_enabled() and not _profiler_active:
+            profiler = _start_profiler()
+            _profiler_active = profiler is not None
+
+        start = time.perf_counter_ns()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+            log.debug("call_timed", func=name, elapsed_ms=round(elapsed_ms, 2))
+            if profiler is not None:
+                _profiler_active = False
+                try:
+                    _write_flamegraph(profiler, name)
+                except Exception:
+                    log.warning("flamegraph_failed", func=name, exc_info=True)
+
+    return wrapper
@@ -8,7 +8,9 @@ network access or external services.
 from __future__ import annotations
 
 import json
+import os
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import AsyncGenerator
@@ -23,6 +25,10 @@ _PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
 if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
+# Send the log file to a scratch directory so test runs never write into
+# ``data/logs/`` inside the tree.  Must be set before ``src.*`` is imported.
+os.environ.setdefault("SIXXER_LOG_DIR", tempfile.mkdtemp(prefix="sixxer-test-logs-"))
+
 from src.models.database import Database
 from src.models.schemas import GigType, OrderStatus
 from src.utils.file_handler import DeliverableManager
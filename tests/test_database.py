@@ -0,0 +1,172 @@
+"""Tests for the async SQLite layer (``src.models.database``)."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from src.models.database import Database
+
+# =========================================================================
+# Connection setup
+# =========================================================================
+
+
+class TestConnect:
+    """Verify the PRAGMAs and indexes set up by ``Database.connect``."""
+
+    async def test_page_cache_is_enlarged(self, db: Database) -> None:
+        row = await db.fetch_one("PRAGMA cache_size")
+        assert row is not None
+        assert next(iter(row.values())) == -65_536
+
+    async def test_temp_store_in_memory(self, db: Database) -> None:
+        row = await db.fetch_one("PRAGMA temp_store")
+        assert row is not None
+        assert next(iter(row.values())) == 2  # MEMORY
+
+    async def test_buyer_lookup_uses_index(self, db: Database) -> None:
+        plan = await db.fetch_all(
+            "EXPLAIN QUERY PLAN SELECT id FROM orders WHERE buyer_username = ? "
+            "ORDER BY created_at DESC LIMIT 1",
+            ("buyer",),
+        )
+        assert any("idx_orders_buyer" in row["detail"] for row in plan)
+
+
+# =========================================================================
+# executemany
+# =========================================================================
+
+
+class TestExecuteMany:
+    """Verify batched inserts through ``Database.executemany``."""
+
+    async def test_inserts_every_row(self, db: Database) -> None:
+        rows = [
+            ("111", "writing", "Blog posts", "2024-01-01T00:00:00+00:00"),
+            ("222", "coding", "Python scripts", "2024-01-01T00:00:00+00:00"),
+        ]
+        await db.executemany(
+            "INSERT INTO gigs (fiverr_gig_id, gig_type, title, status, created_at) "
+            "VALUES (?, ?, ?, 'active', ?)",
+            rows,
+        )
+
+        stored = await db.fetch_all("SELECT fiverr_gig_id FROM gigs ORDER BY id")
+        assert [r["fiverr_gig_id"] for r in stored] == ["111", "222"]
+
+    async def test_empty_batch_is_noop(self, db: Database) -> None:
+        await db.executemany(
+            "INSERT INTO gigs (fiverr_gig_id, gig_type, title, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            [],
+        )
+
+        assert await db.fetch_all("SELECT * FROM gigs") == []
+
+    async def test_failed_row_rolls_back_batch(self, db: Database) -> None:
+        rows = [
+            ("o1", "FO-1", "writing", "buyer", 5.0, "t", "t"),
+            ("o1", "FO-2", "writing", "buyer", 5.0, "t", "t"),  # duplicate id
+        ]
+        with pytest.raises(sqlite3.IntegrityError):
+            await db.executemany(
+                "INSERT INTO orders (id, fiverr_order_id, gig_type, "
+                "buyer_username, price, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        assert not db.conn.in_transaction
+        assert await db.fetch_all("SELECT id FROM orders") == []
+
+
+# =========================================================================
+# transaction
+# =========================================================================
+
+
+class TestTransaction:
+    """Verify ``Database.transaction`` groups writes into one commit."""
+
+    _INSERT_GIG = (
+        "INSERT INTO gigs (fiverr_gig_id, gig_type, title, created_at) "
+        "VALUES (?, ?, ?, ?)"
+    )
+
+    async def test_commits_on_exit(self, db: Database) -> None:
+        async with db.transaction():
+            await db.execute(self._INSERT_GIG, ("1", "writing", "A", "t"))
+            await db.executemany(self._INSERT_GIG, [("2", "coding", "B", "t")])
+            assert db.conn.in_transaction
+
+        assert not db.conn.in_transaction
+        rows = await db.fetch_all("SELECT fiverr_gig_id FROM gigs ORDER BY id")
+        assert [r["fiverr_gig_id"] for r in rows] == ["1", "2"]
+
+    async def test_rolls_back_on_error(self, db: Database) -> None:
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.execute(self._INSERT_GIG, ("1", "writing", "A", "t"))
+                raise RuntimeError("boom")
+
+        assert await db.fetch_all("SELECT * FROM gigs") == []
+
+    async def test_nested_block_joins_outer(self, db: Database) -> None:
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                async with db.transaction():
+                    await db.execute(self._INSERT_GIG, ("1", "writing", "A", "t"))
+                raise RuntimeError("boom")
+
+        assert await db.fetch_all("SELECT * FROM gigs") == []
+
+    async def test_other_task_waits_for_block(self, db: Database) -> None:
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def failing_block() -> None:
+            async with db.transaction():
+                await db.execute(self._INSERT_GIG, ("1", "writing", "A", "t"))
+                entered.set()
+                await release.wait()
+                raise RuntimeError("boom")
+
+        block = asyncio.create_task(failing_block())
+        await entered.wait()
+        writer = asyncio.create_task(
+            db.execute(self._INSERT_GIG, ("2", "coding", "B", "t"))
+        )
+        await asyncio.sleep(0)
+        assert not writer.done()
+
+        release.set()
+        with pytest.raises(RuntimeError):
+            await block
+        await writer
+
+        rows = await db.fetch_all("SELECT fiverr_gig_id FROM gigs")
+        assert [r["fiverr_gig_id"] for r in rows] == ["2"]
+
+
+# =========================================================================
+# selector_cache
+# =========================================================================
+
+
+class TestSelectorCache:
+    """Verify the ``selector_cache`` table created by ``migrate``."""
+
+    async def test_replace_keeps_one_row_per_element(self, db: Database) -> None:
+        sql = (
+            "INSERT OR REPLACE INTO selector_cache "
+            "(page, element, selector, cached_at) VALUES (?, ?, ?, ?)"
+        )
+        await db.execute(sql, ("delivery", "file_upload", "input.a", "t1"))
+        await db.execute(sql, ("delivery", "file_upload", "input.b", "t2"))
+
+        rows = await db.fetch_all("SELECT selector FROM selector_cache")
+        assert [r["selector"] for r in rows] == ["input.b"]
@@ -0,0 +1,86 @@
+"""Tests for pure helpers in ``src.fiverr.gig_manager``."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.fiverr.gig_manager import _GIG_ID_RE, GigManager, _parse_templates
+
+# =========================================================================
+# Gig ID parsing
+# =========================================================================
+
+
+class TestGigIdRegex:
+    """Verify ``_GIG_ID_RE`` only takes whole numeric path segments."""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://www.fiverr.com/manage_gigs/123456", "123456"),
+            ("https://www.fiverr.com/gigs/123456/edit", "123456"),
+            ("https://www.fiverr.com/manage_gigs/123456?tab=pricing", "123456"),
+            ("https://www.fiverr.com/manage_gigs/123456#overview", "123456"),
+            ("https://www.fiverr.com/manage_gigs/123abc", None),
+            ("https://www.fiverr.com/manage_gigs/new", None),
+            ("https://www.fiverr.com/seller_dashboard", None),
+        ],
+    )
+    def test_extracts_id(self, url: str, expected: str | None) -> None:
+        match = _GIG_ID_RE.search(url)
+        assert (match.group(1) if match else None) == expected
+        assert GigManager._extract_gig_id_from_url(url) == expected
+
+
+# =========================================================================
+# Template JSON cache
+# =========================================================================
+
+
+class TestParseTemplates:
+    """Verify the compiled JSON copy kept next to the templates YAML."""
+
+    @staticmethod
+    def _write_yaml(tmp_path: Path, text: str) -> tuple[Path, Path, int]:
+        yaml_path = tmp_path / "gig_templates.yaml"
+        yaml_path.write_text(text, encoding="utf-8")
+        return yaml_path, tmp_path / "gig_templates.cache.json", yaml_path.stat().st_mtime_ns
+
+    def test_fresh_cache_is_used(self, tmp_path: Path) -> None:
+        yaml_path, json_path, mtime = self._write_yaml(tmp_path, "source: yaml\n")
+        json_path.write_text(json.dumps({"source": "json"}), encoding="utf-8")
+        os.utime(json_path, ns=(mtime, mtime))
+
+        assert _parse_templates(yaml_path, mtime) == {"source": "json"}
+
+    def test_stale_cache_is_rewritten(self, tmp_path: Path) -> None:
+        yaml_path, json_path, mtime = self._write_yaml(tmp_path, "source: yaml\n")
+        json_path.write_text(json.dumps({"source": "old"}), encoding="utf-8")
+        os.utime(json_path, ns=(mtime - 1, mtime - 1))
+
+        assert _parse_templates(yaml_path, mtime) == {"source": "yaml"}
+        assert json.loads(json_path.read_text(encoding="utf-8")) == {"source": "yaml"}
+
+    def test_unwritable_dir_still_parses(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        yaml_path, json_path, mtime = self._write_yaml(tmp_path, "source: yaml\n")
+
+        def deny(*args: object, **kwargs: object) -> None:
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(Path, "write_text", deny)
+
+        assert _parse_templates(yaml_path, mtime) == {"source": "yaml"}
+        assert not json_path.exists()
+        assert not json_path.with_suffix(".tmp").exists()
+
+    def test_non_string_keys_skip_cache(self, tmp_path: Path) -> None:
+        yaml_path, json_path, mtime = self._write_yaml(tmp_path, "2: two\nyes: true\n")
+
+        assert _parse_templates(yaml_path, mtime) == {2: "two", True: True}
+        assert not json_path.exists()
@@ -10,6 +10,7 @@ from __future__ import annotations
 import pytest
 
 from src.utils.human_timing import (
+    _TYPING_POOL_SIZE,
     between_actions,
     human_delay,
     page_load_wait,
@@ -74,6 +75,12 @@ class TestTypingDelay:
         values = {round(typing_delay(), 6) for _ in range(ITERATIONS)}
         assert len(values) > 1
 
+    def test_within_bounds_across_pool_refill(self) -> None:
+        """Samples drawn past the end of one pre-drawn batch stay in range."""
+        for _ in range(_TYPING_POOL_SIZE + ITERATIONS):
+            val = typing_delay()
+            assert 0.03 <= val <= 0.20
+
 
 # =========================================================================
 # reading_delay
@@ -0,0 +1,48 @@
+"""Tests for pure helpers in ``src.fiverr.order_actions``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.fiverr.order_actions import _drop_duplicate_files
+
+# =========================================================================
+# Duplicate delivery files
+# =========================================================================
+
+
+class TestDropDuplicateFiles:
+    """Verify which delivery files ``_drop_duplicate_files`` keeps."""
+
+    def test_repeated_path_kept_once(self, tmp_path: Path) -> None:
+        f = tmp_path / "report.pdf"
+        f.write_bytes(b"report")
+
+        assert _drop_duplicate_files([f, f]) == [f]
+
+    def test_same_name_and_content_in_two_dirs(self, tmp_path: Path) -> None:
+        a = tmp_path / "a" / "report.pdf"
+        b = tmp_path / "b" / "report.pdf"
+        for p in (a, b):
+            p.parent.mkdir()
+            p.write_bytes(b"report")
+
+        assert _drop_duplicate_files([a, b]) == [a]
+
+    def test_same_content_different_names_kept(self, tmp_path: Path) -> None:
+        a = tmp_path / "draft.txt"
+        b = tmp_path / "final.txt"
+        for p in (a, b):
+            p.write_bytes(b"")
+
+        assert _drop_duplicate_files([a, b]) == [a, b]
+
+    def test_same_name_and_size_different_content(self, tmp_path: Path) -> None:
+        a = tmp_path / "a" / "data.csv"
+        b = tmp_path / "b" / "data.csv"
+        a.parent.mkdir()
+        b.parent.mkdir()
+        a.write_bytes(b"1,2")
+        b.write_bytes(b"3,4")
+
+        assert _drop_duplicate_files([a, b]) == [a, b]
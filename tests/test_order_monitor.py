@@ -0,0 +1,51 @@
+"""Tests for pure helpers in ``src.fiverr.order_monitor``."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.fiverr.order_monitor import _GIG_TYPE_KEYWORDS, _infer_gig_type
+from src.models.schemas import GigType
+
+
+def _first_keyword_type(title: str) -> str:
+    """The original keyword loop: first dict entry found in the title wins."""
+    lower = title.lower()
+    for keyword, gig_type in _GIG_TYPE_KEYWORDS.items():
+        if keyword in lower:
+            return gig_type.value
+    return GigType.WRITING.value
+
+
+# =========================================================================
+# Gig type inference
+# =========================================================================
+
+
+class TestInferGigType:
+    """Verify the per-type patterns keep the keyword loop's answers."""
+
+    @pytest.mark.parametrize(
+        "title, expected",
+        [
+            ("SEO blog article", "writing"),
+            ("Python scraping scripts", "coding"),
+            ("Excel spreadsheet cleanup", "data_entry"),
+            ("Data entry from PDFs", "data_entry"),
+            ("Python script to write Excel data", "writing"),
+            ("Automation code for spreadsheet data", "coding"),
+            ("Coder needed", "coding"),
+            ("Logo design", "writing"),
+            ("", "writing"),
+        ],
+    )
+    def test_matches_keyword_loop(self, title: str, expected: str) -> None:
+        assert _infer_gig_type(title) == expected
+        assert _infer_gig_type(title) == _first_keyword_type(title)
+
+    def test_keywords_grouped_by_type(self) -> None:
+        # The per-type patterns rely on each type's keywords being
+        # contiguous in the dict; interleaving would change priorities.
+        types = list(_GIG_TYPE_KEYWORDS.values())
+        runs = [t for i, t in enumerate(types) if i == 0 or types[i - 1] is not t]
+        assert len(runs) == len(set(types))
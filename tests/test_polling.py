@@ -0,0 +1,40 @@
+"""Tests for adaptive polling (``src.utils.polling``)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from src.utils.polling import wait_until
+
+
+class TestWaitUntil:
+    """Verify the backoff loop in ``wait_until``."""
+
+    @patch("src.utils.polling.asyncio.sleep", new_callable=AsyncMock)
+    async def test_true_immediately_does_not_sleep(self, mock_sleep: AsyncMock) -> None:
+        predicate = AsyncMock(return_value=True)
+
+        assert await wait_until(predicate) is True
+        predicate.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+    @patch("src.utils.polling.asyncio.sleep", new_callable=AsyncMock)
+    async def test_interval_doubles_up_to_cap(self, mock_sleep: AsyncMock) -> None:
+        predicate = AsyncMock(side_effect=[False] * 5 + [True])
+
+        assert await wait_until(predicate, timeout=60, initial=0.1, cap=0.5) is True
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert delays == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+    @patch("src.utils.polling.asyncio.sleep", new_callable=AsyncMock)
+    async def test_exceptions_count_as_false(self, mock_sleep: AsyncMock) -> None:
+        predicate = AsyncMock(side_effect=[RuntimeError("detached"), True])
+
+        assert await wait_until(predicate) is True
+        assert predicate.await_count == 2
+
+    async def test_returns_false_after_timeout(self) -> None:
+        predicate = AsyncMock(return_value=False)
+
+        assert await wait_until(predicate, timeout=0.05, initial=0.01) is False
+        assert predicate.await_count >= 2
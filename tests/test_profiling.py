@@ -0,0 +1,90 @@
+"""Tests for the profiling decorator (``src.utils.profiling``)."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.profiling import profile
+
+
+class TestProfile:
+    """Verify the timing wrapper and the opt-in flamegraph path."""
+
+    async def test_returns_result(self) -> None:
+        @profile
+        async def compute(x: int) -> int:
+            return x * 2
+
+        assert await compute(21) == 42
+
+    async def test_preserves_metadata(self) -> None:
+        @profile
+        async def documented() -> None:
+            """Docstring."""
+
+        assert documented.__name__ == "documented"
+        assert documented.__doc__ == "Docstring."
+
+    async def test_propagates_exceptions(self) -> None:
+        @profile
+        async def boom() -> None:
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError, match="nope"):
+            await boom()
+
+    @patch("src.utils.profiling._start_profiler")
+    async def test_profiler_not_started_by_default(
+        self, mock_start: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("SIXXER_PROFILE", raising=False)
+
+        @profile
+        async def noop() -> None:
+            return None
+
+        await noop()
+        mock_start.assert_not_called()
+
+    @patch("src.utils.profiling._write_flamegraph")
+    @patch("src.utils.profiling._start_profiler")
+    async def test_outermost_call_only_is_profiled(
+        self,
+        mock_start: MagicMock,
+        mock_write: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("SIXXER_PROFILE", "1")
+        mock_start.return_value = MagicMock()
+
+        @profile
+        async def inner() -> str:
+            return "inner"
+
+        @profile
+        async def outer() -> str:
+            return await inner()
+
+        assert await outer() == "inner"
+        assert mock_start.call_count == 1
+        assert mock_write.call_count == 1
+
+    @patch("src.utils.profiling.log")
+    async def test_missing_pyinstrument_warns_once(
+        self, mock_log: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SIXXER_PROFILE", "1")
+        monkeypatch.setitem(sys.modules, "pyinstrument", None)  # import fails
+        monkeypatch.setattr("src.utils.profiling._pyinstrument_warned", False)
+
+        @profile
+        async def noop() -> None:
+            return None
+
+        await noop()
+        await noop()
+        mock_log.warning.assert_called_once()
+        assert mock_log.warning.call_args.args[0] == "pyinstrument_not_installed"
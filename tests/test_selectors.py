@@ -0,0 +1,131 @@
+"""Tests for the resolved-selector cache in ``src.browser.selectors``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.browser.selectors import SelectorStore
+from src.models.database import Database
+
+_YAML = """
+selectors:
+  delivery:
+    submit_delivery:
+      primary: "button.submit"
+      fallback: "button.send"
+    file_upload:
+      primary: "input[type='file']"
+"""
+
+
+class FakePage:
+    """Just enough of a Playwright ``Page`` for ``find``/``find_cached``."""
+
+    def __init__(self, present: set[str], url: str = "https://x.test/orders/1") -> None:
+        self.present = present
+        self.url = url
+        self.waits = 0
+        self.queries = 0
+
+    async def wait_for_selector(self, selector: str, timeout: int) -> Any:
+        self.waits += 1
+        if selector in self.present:
+            return object()
+        raise TimeoutError(selector)
+
+    async def query_selector(self, selector: str) -> Any:
+        self.queries += 1
+        return object() if selector in self.present else None
+
+
+@pytest.fixture
+def yaml_path(tmp_path: Path) -> str:
+    path = tmp_path / "selectors.yaml"
+    path.write_text(_YAML, encoding="utf-8")
+    return str(path)
+
+
+# =========================================================================
+# find_cached
+# =========================================================================
+
+
+class TestFindCached:
+    """Verify the single cache shared by every ``find_cached`` caller."""
+
+    async def test_same_path_reuses_without_touching_page(self, yaml_path: str) -> None:
+        store = SelectorStore(yaml_path)
+        page = FakePage({"button.send"})
+
+        assert await store.find_cached(page, "delivery", "submit_delivery") == "button.send"
+        waits = page.waits
+        assert await store.find_cached(page, "delivery", "submit_delivery") == "button.send"
+        assert (page.waits, page.queries) == (waits, 0)
+
+    async def test_other_path_revalidates_with_one_query(self, yaml_path: str) -> None:
+        store = SelectorStore(yaml_path)
+        page = FakePage({"button.send"})
+        await store.find_cached(page, "delivery", "submit_delivery")
+        waits = page.waits
+
+        page.url = "https://x.test/orders/2"
+        assert await store.find_cached(page, "delivery", "submit_delivery") == "button.send"
+        assert (page.waits, page.queries) == (waits, 1)
+
+    async def test_stale_entry_is_re_resolved(self, yaml_path: str) -> None:
+        store = SelectorStore(yaml_path)
+        page = FakePage({"button.send"})
+        await store.find_cached(page, "delivery", "submit_delivery")
+
+        page.present = {"button.submit"}
+        page.url = "https://x.test/orders/2"
+        assert await store.find_cached(page, "delivery", "submit_delivery") == "button.submit"
+
+    @patch("src.browser.selectors.time.monotonic", return_value=0.0)
+    async def test_forget_drops_entries(self, _mock_time: Any, yaml_path: str) -> None:
+        store = SelectorStore(yaml_path)
+        page = FakePage({"button.send", "input[type='file']"})
+        await store.find_cached(page, "delivery", "submit_delivery")
+        await store.find_cached(page, "delivery", "file_upload")
+
+        store.forget("delivery", "file_upload")
+        waits = page.waits
+        await store.find_cached(page, "delivery", "submit_delivery")
+        assert page.waits == waits
+        await store.find_cached(page, "delivery", "file_upload")
+        assert page.waits == waits + 1
+
+
+# =========================================================================
+# Persistence
+# =========================================================================
+
+
+class TestPersistence:
+    """Verify the optional ``selector_cache`` backing."""
+
+    async def test_resolved_selector_survives_restart(
+        self, db: Database, yaml_path: str
+    ) -> None:
+        page = FakePage({"button.send"})
+        await SelectorStore(yaml_path, db=db).find_cached(page, "delivery", "submit_delivery")
+
+        restarted = SelectorStore(yaml_path, db=db)
+        await restarted.load_persisted()
+        waits = page.waits
+        assert await restarted.find_cached(page, "delivery", "submit_delivery") == "button.send"
+        assert (page.waits, page.queries) == (waits, 1)
+
+    async def test_miss_deletes_persisted_row(self, db: Database, yaml_path: str) -> None:
+        page = FakePage({"button.send"})
+        store = SelectorStore(yaml_path, db=db)
+        await store.find_cached(page, "delivery", "submit_delivery")
+
+        page.present = set()
+        page.url = "https://x.test/orders/2"
+        assert await store.find_cached(page, "delivery", "submit_delivery") is None
+        assert await db.fetch_all("SELECT * FROM selector_cache") == []